@@ -0,0 +1,273 @@
+"""Filler detection from the audio signal, without a full transcription.
+
+Hesitation sounds ("э-э", "ммм", "uh") are voiced and hold a steady
+spectrum for a few hundred milliseconds, while words change it every
+syllable. Candidate spans are found from log-mel frames with NumPy, and
+only those spans are sent to a small Whisper model, prompted to keep
+hesitations, to confirm what was said.
+"""
+
+import logging
+import re
+from bisect import bisect_right
+from pathlib import Path
+
+import numpy as np
+
+from . import metrics
+from .audio import AudioSource
+from .analyzer import FILLERS
+from .models import EditDecision
+from .transcript import Transcript, normalize
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+
+# Spellings Whisper uses for drawn-out hesitations ("Э-э-э", "Ммм", "Uhh")
+_HESITATION = re.compile(r"^(э+м*|м+|а+|ы+|эм+|у+|um+|u+h*|uh+m*|e+r*m*|e+h+|a+h+|h*m+)$")
+
+# Prompts in the style of a verbatim transcript, so hesitations are written out
+_PROMPTS = {
+    "ru": "Э-э, ну, м-м, я думаю... Ммм, а-а, вот.",
+    "en": "Um, uh, I mean... Hmm, uh, well, erm.",
+}
+
+
+def mel_filterbank(n_fft: int, n_mels: int, samplerate: int) -> np.ndarray:
+    """Triangular mel filters as an (n_mels, n_fft // 2 + 1) matrix."""
+    def to_mel(hz):
+        return 2595.0 * np.log10(1.0 + hz / 700.0)
+
+    def to_hz(mel):
+        return 700.0 * (10 ** (mel / 2595.0) - 1.0)
+
+    bins = np.fft.rfftfreq(n_fft, 1.0 / samplerate)
+    edges = to_hz(np.linspace(0.0, to_mel(samplerate / 2), n_mels + 2))
+    lower, center, upper = edges[:-2, None], edges[1:-1, None], edges[2:, None]
+    rising = (bins - lower) / (center - lower)
+    falling = (upper - bins) / (upper - center)
+    return np.maximum(0.0, np.minimum(rising, falling)).astype(np.float32)
+
+
+class AcousticFillerDetector:
+    """Finds hesitation sounds from spectral features, confirmed by a small model."""
+
+    def __init__(
+        self,
+        language: str = "ru",
+        model_size: str = "tiny",
+        device: str = "cpu",
+        min_duration: float = 0.25,
+        max_duration: float = 2.0,
+        level_db: float = -45.0,
+        max_flux: float = 0.08,
+        padding: float = 0.3,
+        verbose: bool = False,
+    ):
+        """Initialize the detector.
+
+        Args:
+            language: Language code ("ru" or "en")
+            model_size: Whisper model used to confirm candidates
+            device: Device for the model (cpu, cuda)
+            min_duration: Shortest steady voiced span considered, in seconds
+            max_duration: Longest steady voiced span considered, in seconds
+            level_db: Frames below this level (dBFS) are not voiced
+            max_flux: Largest frame-to-frame spectral change of a steady sound (0..1)
+            padding: Context in seconds sent to the model around each candidate
+            verbose: Enable verbose debug output
+        """
+        self.language = language
+        self.fillers = FILLERS.get(language, set())
+        self.model_size = model_size
+        self.device = device
+        self.min_duration = min_duration
+        self.max_duration = max_duration
+        self.level_db = level_db
+        self.max_flux = max_flux
+        self.padding = padding
+        self.verbose = verbose
+        self._model = None
+
+        self.frame = 400  # 25 ms
+        self.hop = 160  # 10 ms
+        self.mel = mel_filterbank(self.frame, 40, SAMPLE_RATE)
+        self.window = np.hanning(self.frame).astype(np.float32)
+
+    @property
+    def model(self):
+        """The confirming Whisper model, loaded on first access."""
+        if self._model is None:
+            from faster_whisper import WhisperModel
+
+            logger.info(f"Loading Whisper model for acoustic fillers: {self.model_size}")
+            self._model = WhisperModel(self.model_size, device=self.device, compute_type="int8")
+        return self._model
+
+    def detect(self, audio_path: "Path | AudioSource") -> list[EditDecision]:
+        """Find filler sounds in an audio file.
+
+        Args:
+            audio_path: Path to the audio file, or a source already decoded for this run
+
+        Returns:
+            Filler decisions sorted by start time
+        """
+        if isinstance(audio_path, AudioSource):
+            return self.detect_array(audio_path.mono16k())
+
+        from faster_whisper import decode_audio
+
+        with metrics.stage("decode") as span:
+            audio = decode_audio(str(audio_path), sampling_rate=SAMPLE_RATE)
+            if span:
+                span.set(audio_seconds=len(audio) / SAMPLE_RATE)
+        return self.detect_array(audio)
+
+    def detect_array(self, audio: np.ndarray) -> list[EditDecision]:
+        """Find filler sounds in 16 kHz mono audio."""
+        with metrics.stage("acoustic_candidates", audio_seconds=len(audio) / SAMPLE_RATE):
+            candidates = self.find_candidates(audio)
+        if self.verbose:
+            total = sum(end - start for start, end in candidates)
+            print(f"[DEBUG] {len(candidates)} acoustic filler candidates ({total:.1f}s of audio)")
+        if not candidates:
+            return []
+        with metrics.stage("acoustic_confirm", audio_seconds=sum(e - s for s, e in candidates)):
+            return self.confirm(audio, candidates)
+
+    def find_candidates(self, audio: np.ndarray, block: int = 6000) -> list[tuple[float, float]]:
+        """Return (start, end) spans of steady voiced sound, in seconds.
+
+        Args:
+            audio: 16 kHz mono samples
+            block: Frames analysed at a time, bounding memory for long audio
+
+        Returns:
+            Candidate spans in time order
+        """
+        n_frames = max(0, (len(audio) - self.frame) // self.hop + 1)
+        if n_frames < 2:
+            return []
+
+        steady = np.empty(n_frames, dtype=bool)
+        frames = np.lib.stride_tricks.sliding_window_view(audio, self.frame)[:: self.hop]
+        prev = None
+        for first in range(0, n_frames, block):
+            chunk = frames[first:first + block] * self.window
+            bands = (np.abs(np.fft.rfft(chunk, axis=1)) ** 2) @ self.mel.T
+            level = 10 * np.log10(bands.sum(axis=1) / (self.frame * self.frame) + 1e-12)
+
+            # Spectral flux: cosine distance between neighbouring log-mel frames
+            logmel = np.log1p(bands * 1e4)
+            logmel /= np.linalg.norm(logmel, axis=1, keepdims=True) + 1e-9
+            previous = logmel[:1] if prev is None else prev
+            flux = 1.0 - np.einsum("ij,ij->i", logmel, np.concatenate([previous, logmel[:-1]]))
+            prev = logmel[-1:]
+
+            steady[first:first + len(chunk)] = (level > self.level_db) & (flux < self.max_flux)
+
+        # Runs of steady frames long enough to be a drawn-out sound, not a syllable
+        edges = np.flatnonzero(np.diff(steady.astype(np.int8), prepend=np.int8(0), append=np.int8(0)))
+        spans = []
+        for start, end in zip(edges[::2].tolist(), edges[1::2].tolist()):
+            start_s = start * self.hop / SAMPLE_RATE
+            end_s = ((end - 1) * self.hop + self.frame) / SAMPLE_RATE
+            if self.min_duration <= end_s - start_s <= self.max_duration:
+                spans.append((start_s, end_s))
+        return spans
+
+    def confirm(self, audio: np.ndarray, candidates: list[tuple[float, float]]) -> list[EditDecision]:
+        """Transcribe only the candidate spans and keep those heard as fillers.
+
+        The padded spans are joined into one short reel separated by silence,
+        so the model runs once over seconds of audio instead of the whole file.
+        """
+        gap = np.zeros(int(0.5 * SAMPLE_RATE), dtype=np.float32)
+        duration = len(audio) / SAMPLE_RATE
+        pieces, reel_starts, clip_starts = [], [], []
+        position = 0.0
+        for start, end in candidates:
+            clip_start = max(0.0, start - self.padding)
+            clip = audio[int(clip_start * SAMPLE_RATE):int(min(duration, end + self.padding) * SAMPLE_RATE)]
+            reel_starts.append(position)
+            clip_starts.append(clip_start)
+            pieces.extend([clip, gap])
+            position += (len(clip) + len(gap)) / SAMPLE_RATE
+
+        segments, _ = self.model.transcribe(
+            np.concatenate(pieces),
+            language=self.language,
+            initial_prompt=_PROMPTS.get(self.language),
+            word_timestamps=True,
+            condition_on_previous_text=False,
+        )
+
+        decisions = {}
+        for segment in segments:
+            for word in segment.words or []:
+                middle = (word.start + word.end) / 2
+                i = bisect_right(reel_starts, middle) - 1
+                if i < 0 or not self.is_filler(word.word):
+                    continue
+                start, end = candidates[i]
+                source = clip_starts[i] + middle - reel_starts[i]
+                if start - self.padding / 2 <= source <= end + self.padding / 2 and i not in decisions:
+                    decisions[i] = EditDecision(
+                        start=start, end=end, reason="filler", original_text=word.word.strip()
+                    )
+        return [decisions[i] for i in sorted(decisions)]
+
+    def is_filler(self, text: str) -> bool:
+        """Check if a word from the confirming model is a hesitation or filler."""
+        token = normalize(text).replace("-", "").rstrip(".")
+        return token in self.fillers or bool(_HESITATION.match(token))
+
+
+def merge_decisions(
+    decisions: list[EditDecision],
+    acoustic: list[EditDecision],
+    transcript: Transcript | None = None,
+) -> list[EditDecision]:
+    """Add acoustic filler decisions to text-based ones.
+
+    Acoustic decisions that overlap a text-based cut are already covered.
+    Those mostly covered by a word the full transcript kept are taken to be
+    a drawn-out real word. Both kinds are dropped.
+
+    Args:
+        decisions: Decisions from Analyzer
+        acoustic: Decisions from AcousticFillerDetector
+        transcript: Full transcript, if one was made
+
+    Returns:
+        All decisions sorted by start time
+    """
+    cuts = sorted(decisions, key=lambda d: d.start)
+    cut_starts = np.array([d.start for d in cuts])
+    # Furthest end among cuts starting up to each index
+    reach = np.maximum.accumulate(np.array([d.end for d in cuts])) if cuts else np.zeros(0)
+
+    kept = None
+    if transcript is not None:
+        kept = np.ones(len(transcript), dtype=bool)
+        for d in cuts:
+            kept[np.searchsorted(transcript.end, d.start, "right"):np.searchsorted(transcript.start, d.end)] = False
+
+    merged = list(decisions)
+    for d in acoustic:
+        i = int(np.searchsorted(cut_starts, d.end))
+        if i and reach[i - 1] > d.start:
+            continue
+        if kept is not None:
+            first = np.searchsorted(transcript.end, d.start, "right")
+            last = np.searchsorted(transcript.start, d.end)
+            words = np.arange(first, last)[kept[first:last]]
+            overlap = np.minimum(transcript.end[words], d.end) - np.maximum(transcript.start[words], d.start)
+            if overlap.sum() > (d.end - d.start) / 2:
+                continue
+        merged.append(d)
+
+    merged.sort(key=lambda d: d.start)
+    return merged
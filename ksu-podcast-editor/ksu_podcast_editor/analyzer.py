@@ -1,6 +1,13 @@
 """Filler and repetition detection."""
 
+from collections.abc import Iterable, Iterator
+
+import numpy as np
+
+from . import metrics
 from .models import EditDecision, Segment, Word
+from .repetition import RepetitionDetector
+from .transcript import Transcript, normalize
 
 # Single-word fillers by language
 FILLERS = {
@@ -36,112 +43,281 @@ FILLER_PHRASES = {
 }
 
 
+# Trie key marking the end of a phrase (tokens are always str)
+_END = None
+
+
+class PhraseMatcher:
+    """Token trie over filler phrases, matched in a single pass."""
+
+    def __init__(self, phrases: list[list[str]]):
+        """Build the trie.
+
+        Args:
+            phrases: Phrases as lists of normalized tokens
+        """
+        self.root: dict = {}
+        self.max_len = 0
+        for tokens in phrases:
+            if not tokens:
+                continue
+            node = self.root
+            for token in tokens:
+                node = node.setdefault(token, {})
+            node[_END] = len(tokens)
+            self.max_len = max(self.max_len, len(tokens))
+
+    def match_at(self, tokens: list[str], i: int) -> int:
+        """Return the length of the longest phrase starting at tokens[i], or 0."""
+        node = self.root
+        best = 0
+        for j in range(i, len(tokens)):
+            node = node.get(tokens[j])
+            if node is None:
+                break
+            if _END in node:
+                best = j - i + 1
+        return best
+
+    def find_all(self, tokens: list[str]) -> list[tuple[int, int]]:
+        """Find non-overlapping phrase matches, leftmost-longest first.
+
+        Returns:
+            List of (start_index, length) tuples in token order
+        """
+        matches = []
+        i = 0
+        while i < len(tokens):
+            length = self.match_at(tokens, i)
+            if length:
+                matches.append((i, length))
+                i += length
+            else:
+                i += 1
+        return matches
+
+
+class _TokenView:
+    """Read-only sequence of token strings over an array of token ids."""
+
+    def __init__(self, ids: np.ndarray, vocab: list[str]):
+        self.ids = ids
+        self.vocab = vocab
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, i: int) -> str:
+        return self.vocab[self.ids[i]]
+
+
 class Analyzer:
     """Analyzes transcribed segments for fillers and repetitions."""
 
-    def __init__(self, language: str = "ru", custom_fillers: set[str] | None = None):
+    def __init__(
+        self,
+        language: str = "ru",
+        custom_fillers: set[str] | None = None,
+        repetitions: RepetitionDetector | None = None,
+    ):
         """Initialize the analyzer.
 
         Args:
             language: Language code ("ru" or "en")
             custom_fillers: Additional filler words to detect
+            repetitions: Detector for repeated words, phrases and stutters
         """
         self.language = language
+        self.repetitions = repetitions or RepetitionDetector()
         self.fillers = FILLERS.get(language, set())
         self.filler_phrases = FILLER_PHRASES.get(language, [])
         if custom_fillers:
             self.fillers = self.fillers | custom_fillers
 
-    def analyze(self, segments: list[Segment]) -> list[EditDecision]:
+        # Multi-word entries can never match a single word, so they go to the trie
+        phrases = list(self.filler_phrases)
+        phrases.extend(f for f in self.fillers if len(f.split()) > 1)
+        self.phrase_matcher = PhraseMatcher(
+            [[self._normalize(t) for t in phrase.split()] for phrase in phrases]
+        )
+
+    def analyze(self, segments: list[Segment] | Transcript) -> list[EditDecision]:
         """Analyze segments and return edit decisions.
 
         Args:
-            segments: List of transcribed segments
+            segments: List of transcribed segments, or a columnar Transcript
 
         Returns:
             List of edit decisions for segments to remove
         """
-        decisions = []
+        if not isinstance(segments, Transcript):
+            segments = Transcript.from_segments(segments)
+        audio_seconds = float(segments.end[-1]) if len(segments) else None
+        with metrics.stage("analyze", audio_seconds=audio_seconds, words=len(segments)) as span:
+            decisions = self.analyze_transcript(segments)
+            if span:
+                span.set(decisions=len(decisions))
+        return decisions
 
-        all_words = []
-        for segment in segments:
-            all_words.extend(segment.words)
-
-        # Track which word indices are already marked (to avoid double-counting)
-        marked_indices: set[int] = set()
-
-        # Detect multi-word filler phrases first
-        for phrase in self.filler_phrases:
-            phrase_words = phrase.split()
-            phrase_len = len(phrase_words)
-
-            for i in range(len(all_words) - phrase_len + 1):
-                if any(idx in marked_indices for idx in range(i, i + phrase_len)):
-                    continue
-
-                candidate = [self._normalize(all_words[j].text) for j in range(i, i + phrase_len)]
-                if candidate == phrase_words:
-                    # Found a phrase match
-                    start_time = all_words[i].start
-                    end_time = all_words[i + phrase_len - 1].end
-                    original = " ".join(all_words[j].text for j in range(i, i + phrase_len))
-
-                    decisions.append(
-                        EditDecision(
-                            start=start_time,
-                            end=end_time,
-                            reason="filler",
-                            original_text=original,
-                        )
-                    )
-                    for idx in range(i, i + phrase_len):
-                        marked_indices.add(idx)
-
-        # Detect single-word fillers
-        for i, word in enumerate(all_words):
-            if i in marked_indices:
+    def analyze_transcript(self, transcript: Transcript) -> list[EditDecision]:
+        """Analyze a columnar transcript with vectorized passes over token ids.
+
+        Besides filler words and phrases, this finds repeated words, repeated
+        phrases and partial-word stutters, and cuts the copy chosen by the
+        repetition detector.
+
+        Args:
+            transcript: Transcript to analyze
+
+        Returns:
+            List of edit decisions sorted by start time
+        """
+        spans, _ = self._find(transcript)
+        decisions = [decision for _, _, decision in spans]
+        decisions.sort(key=lambda d: d.start)
+        return decisions
+
+    def _find(
+        self, transcript: Transcript
+    ) -> tuple[list[tuple[int, int, EditDecision]], list[tuple[int, int]]]:
+        """Run every detection pass over a transcript.
+
+        Returns:
+            (first word, end word, decision) for each decision, and the
+            (first word, end word) extent of each detection; a repetition's
+            extent also covers the copy it keeps
+        """
+        ids = transcript.token_ids
+        vocab = transcript.tokens
+        index = transcript.token_index
+        spans = []
+        extents = []
+        marked = np.zeros(len(ids), dtype=bool)
+
+        # Detect multi-word filler phrases first, trying only words that can start one
+        first_ids = [index[t] for t in self.phrase_matcher.root if t in index]
+        tokens = _TokenView(ids, vocab)
+        pos = 0
+        for i in np.flatnonzero(np.isin(ids, first_ids)).tolist():
+            if i < pos:
                 continue
-            if self._is_filler(word):
-                decisions.append(
-                    EditDecision(
-                        start=word.start,
-                        end=word.end,
-                        reason="filler",
-                        original_text=word.text,
-                    )
+            phrase_len = self.phrase_matcher.match_at(tokens, i)
+            if phrase_len:
+                decision = EditDecision(
+                    start=float(transcript.start[i]),
+                    end=float(transcript.end[i + phrase_len - 1]),
+                    reason="filler",
+                    original_text=transcript.span_text(i, i + phrase_len),
                 )
-                marked_indices.add(i)
+                spans.append((i, i + phrase_len, decision))
+                extents.append((i, i + phrase_len))
+                marked[i:i + phrase_len] = True
+                pos = i + phrase_len
 
-        # Detect repetitions
-        for i in range(1, len(all_words)):
-            if i in marked_indices:
-                continue
-            if self._is_repetition(all_words[i - 1], all_words[i]):
-                decisions.append(
-                    EditDecision(
-                        start=all_words[i].start,
-                        end=all_words[i].end,
-                        reason="repetition",
-                        original_text=all_words[i].text,
-                    )
+        # Single-word fillers
+        filler_ids = [index[t] for t in self.fillers if t in index]
+        fillers = np.isin(ids, filler_ids) & ~marked
+        for i in np.flatnonzero(fillers).tolist():
+            decision = EditDecision(
+                start=float(transcript.start[i]),
+                end=float(transcript.end[i]),
+                reason="filler",
+                original_text=transcript.text(i),
+            )
+            spans.append((i, i + 1, decision))
+            extents.append((i, i + 1))
+
+        # Repeated words, phrases and stutters among the remaining words
+        repetitions = self.repetitions.find(
+            ids, vocab, transcript.start, transcript.end, transcript.confidence, skip=marked | fillers
+        )
+        for repetition in repetitions:
+            for i in repetition.dropped:
+                stop = i + repetition.length
+                decision = EditDecision(
+                    start=float(transcript.start[i]),
+                    end=float(transcript.end[stop - 1]),
+                    reason="repetition",
+                    original_text=transcript.span_text(i, stop),
                 )
+                spans.append((i, stop, decision))
+            extents.append((repetition.copies[0], repetition.copies[-1] + repetition.length))
 
-        # Sort by start time
-        decisions.sort(key=lambda d: d.start)
+        return spans, extents
 
-        return decisions
+    def iter_decisions(self, segments: Iterable[Segment], window: int = 512) -> Iterator[EditDecision]:
+        """Yield edit decisions as soon as they are final.
+
+        Args:
+            segments: Transcribed segments, e.g. straight from Transcriber.iter_segments
+            window: Words analyzed at a time (see iter_labeled_words)
+
+        Yields:
+            Edit decisions in word order
+        """
+        last = None
+        for _, decision in self.iter_labeled_words(segments, window):
+            if decision is not None and decision is not last:
+                yield decision
+            last = decision
+
+    def iter_labeled_words(
+        self, segments: Iterable[Segment], window: int = 512
+    ) -> Iterator[tuple[Word, EditDecision | None]]:
+        """Yield every word with the decision that removes it, if any.
+
+        Words are buffered and analyzed a window at a time with the same
+        passes as analyze(), so both find the same decisions. A word is
+        emitted once no filler phrase, repeat or stutter it belongs to can
+        still change, which needs a look-ahead of a few times max_ngram
+        words, so memory stays flat however long the transcript is.
+
+        Args:
+            segments: Transcribed segments, e.g. straight from Transcriber.iter_segments
+            window: Words analyzed at a time
+
+        Yields:
+            (word, decision) tuples in word order; decision is None for kept words
+        """
+        # Words after the last emitted one that can still affect it: a repeated
+        # phrase with its copy, and one more that could take its words first
+        lookahead = 4 * self.repetitions.max_ngram + self.phrase_matcher.max_len
+        limit = max(window, 2 * lookahead)
+        words: list[Word] = []
+
+        for segment in segments:
+            words.extend(segment.words)
+            if len(words) >= limit:
+                done = yield from self._label_window(words, len(words) - lookahead)
+                del words[:done]
+                # A repeat chain spanning the window holds words back; analyze more at once
+                limit = max(window, 2 * lookahead, 2 * len(words))
+
+        yield from self._label_window(words, len(words))
+
+    def _label_window(self, words: list[Word], cut: int):
+        """Label words before `cut`, moving it back before any detection that straddles it.
+
+        Returns:
+            Number of words labelled
+        """
+        segment = Segment.model_construct(start=0.0, end=0.0, words=words, text="")
+        spans, extents = self._find(Transcript.from_segments([segment]))
+        moved = True
+        while moved:
+            moved = False
+            for first, stop in extents:
+                if first < cut < stop:
+                    cut, moved = first, True
+
+        labels: list[EditDecision | None] = [None] * cut
+        for first, stop, decision in spans:
+            if stop <= cut:
+                labels[first:stop] = [decision] * (stop - first)
+        for word, decision in zip(words, labels):
+            yield word, decision
+        return cut
 
     def _normalize(self, text: str) -> str:
         """Normalize text for comparison."""
-        return text.lower().strip().rstrip(".,!?:;")
-
-    def _is_filler(self, word: Word) -> bool:
-        """Check if a word is a filler."""
-        text = self._normalize(word.text)
-        return text in self.fillers
-
-    def _is_repetition(self, prev_word: Word, curr_word: Word) -> bool:
-        """Check if current word is a repetition of the previous word."""
-        prev_text = self._normalize(prev_word.text)
-        curr_text = self._normalize(curr_word.text)
-        return prev_text == curr_text and len(prev_text) > 1
+        return normalize(text)
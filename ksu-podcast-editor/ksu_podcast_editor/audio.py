@@ -0,0 +1,251 @@
+"""Audio input decoded once and shared by every stage of a run.
+
+Transcription wants 16 kHz mono, rendering and silence detection want the
+native rate and channels. An AudioSource decodes the input on first use into
+an anonymous temporary file of float32 frames and memory-maps it, so each
+stage reads the same buffer instead of decoding the file again, and long
+recordings stay on disk rather than in RAM.
+"""
+
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+from . import metrics
+from .probe import get_duration
+
+# Sample rate Whisper models and the acoustic detector expect
+ASR_SAMPLE_RATE = 16000
+
+# Frames decoded, downmixed or resampled at a time
+_BLOCK = 1 << 18
+
+
+class AudioSource:
+    """An input file decoded at most once per run.
+
+    Nothing is decoded until samples are needed, so a run served from the
+    transcript cache that never renders only reads the file header.
+
+    The source is path-like, so code that only needs the file (cache keys,
+    the transcription server) takes it in place of a path. Use it as a
+    context manager, or call close(), to release the buffers.
+    """
+
+    def __init__(self, path: Path):
+        """Initialize the source.
+
+        Args:
+            path: Path to an audio file libsndfile or FFmpeg can decode
+        """
+        self.path = Path(path)
+        self._data: np.ndarray | None = None
+        self._mono: np.ndarray | None = None
+        self._files = []
+        self._samplerate = 0
+        self._subtype: str | None = None
+        self._duration: float | None = None
+
+    def __fspath__(self) -> str:
+        return str(self.path)
+
+    def __str__(self) -> str:
+        return str(self.path)
+
+    def __enter__(self) -> "AudioSource":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the decoded buffers and their temporary files.
+
+        The duration stays available, so reading it after close() never decodes again.
+        """
+        self._data = self._mono = None
+        for f in self._files:
+            f.close()
+        self._files = []
+
+    @property
+    def data(self) -> np.ndarray:
+        """Native-rate audio as a read-only (frames, channels) float32 array."""
+        if self._data is None:
+            with metrics.stage("decode") as span:
+                self._data = self._decode()
+                self._duration = len(self._data) / self._samplerate
+                if span:
+                    span.set(audio_seconds=self.duration)
+        return self._data
+
+    @property
+    def decoded(self) -> bool:
+        """Whether the samples have been decoded already."""
+        return self._data is not None
+
+    def render_input(self) -> "Path | AudioSource":
+        """What to hand the editor without decoding needlessly.
+
+        The shared buffer once something decoded it; otherwise the file, so
+        rendering reads only the kept intervals, unless libsndfile cannot
+        open it (AAC, Opus) and only a decode through FFmpeg can.
+        """
+        if self.decoded:
+            return self
+        try:
+            sf.info(str(self.path))
+        except sf.LibsndfileError:
+            return self
+        return self.path
+
+    @property
+    def samplerate(self) -> int:
+        """Native sample rate, decoding the audio if needed."""
+        self.data  # Set while decoding
+        return self._samplerate
+
+    @property
+    def subtype(self) -> str | None:
+        """libsndfile sample format of the input, or None for formats it cannot read."""
+        self.data  # Set while decoding
+        return self._subtype
+
+    @property
+    def channels(self) -> int:
+        """Number of channels, decoding the audio if needed."""
+        return self.data.shape[1]
+
+    @property
+    def frames(self) -> int:
+        """Number of frames at the native rate, decoding the audio if needed."""
+        return len(self.data)
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds, from the header until the audio is decoded."""
+        if self._duration is None:
+            try:
+                self._duration = get_duration(self.path)
+            except (RuntimeError, ValueError):
+                # A container the header probe cannot read (AAC, Opus); decoding sets it
+                self.data
+        return self._duration
+
+    def mono16k(self) -> np.ndarray:
+        """The audio downmixed to mono at 16 kHz, as Whisper expects it.
+
+        Derived from the native-rate buffer, so the file is still decoded once.
+        """
+        if self._mono is None:
+            data = self.data
+            with metrics.stage("resample", audio_seconds=self.duration):
+                if data.shape[1] == 1 and self.samplerate == ASR_SAMPLE_RATE:
+                    self._mono = data[:, 0]
+                else:
+                    self._mono = self._map(self._resample_blocks(data), 1)[:, 0]
+        return self._mono
+
+    def _decode(self) -> np.ndarray:
+        try:
+            infile = sf.SoundFile(str(self.path))
+        except sf.LibsndfileError:
+            return self._decode_ffmpeg()
+        with infile:
+            self._samplerate = infile.samplerate
+            self._subtype = infile.subtype
+            blocks = infile.blocks(blocksize=_BLOCK, dtype="float32", always_2d=True)
+            return self._map(blocks, infile.channels)
+
+    def _decode_ffmpeg(self) -> np.ndarray:
+        """Decode formats libsndfile does not read, through PyAV."""
+        import av
+
+        with av.open(str(self.path)) as container:
+            stream = container.streams.audio[0]
+            self._samplerate = stream.rate
+            channels = stream.layout.nb_channels
+            resampler = av.AudioResampler(format="flt", layout=stream.layout.name, rate=stream.rate)
+
+            def blocks():
+                for frame in container.decode(stream):
+                    frame.pts = None
+                    for out in resampler.resample(frame):
+                        yield out.to_ndarray().reshape(-1, channels)
+                for out in resampler.resample(None):
+                    yield out.to_ndarray().reshape(-1, channels)
+
+            return self._map(blocks(), channels)
+
+    def _resample_blocks(self, data: np.ndarray):
+        """Yield 16 kHz mono blocks of the (frames, channels) buffer."""
+        import av
+
+        resampler = av.AudioResampler(format="flt", layout="mono", rate=ASR_SAMPLE_RATE)
+        for start in range(0, len(data), _BLOCK):
+            block = data[start:start + _BLOCK]
+            mono = block[:, 0] if block.shape[1] == 1 else block.mean(axis=1, dtype=np.float32)
+            if self.samplerate == ASR_SAMPLE_RATE:
+                yield mono[:, None]
+                continue
+            frame = av.AudioFrame.from_ndarray(
+                np.ascontiguousarray(mono)[None, :], format="flt", layout="mono"
+            )
+            frame.sample_rate = self.samplerate
+            for out in resampler.resample(frame):
+                yield out.to_ndarray().reshape(-1, 1)
+        if self.samplerate != ASR_SAMPLE_RATE:
+            for out in resampler.resample(None):
+                yield out.to_ndarray().reshape(-1, 1)
+
+    def _map(self, blocks, channels: int) -> np.ndarray:
+        """Write float32 blocks to an anonymous temp file and memory-map it."""
+        f = tempfile.TemporaryFile(prefix="ksu-audio-")
+        self._files.append(f)
+        frames = 0
+        for block in blocks:
+            np.ascontiguousarray(block, dtype=np.float32).tofile(f)
+            frames += len(block)
+        f.flush()
+        if not frames:
+            return np.zeros((0, channels), dtype=np.float32)
+        return np.memmap(f, dtype=np.float32, mode="r", shape=(frames, channels))
+
+
+class BufferReader:
+    """The sequential part of the SoundFile reading interface, over a decoded buffer."""
+
+    def __init__(self, source: AudioSource):
+        self.data = source.data
+        self.samplerate = source.samplerate
+        self.subtype = source.subtype
+        self.channels = self.data.shape[1]
+        self.frames = len(self.data)
+        self.position = 0
+
+    def __enter__(self) -> "BufferReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+    def seek(self, frame: int) -> None:
+        self.position = frame
+
+    def read(self, frames: int, dtype: str = "float32", always_2d: bool = True) -> np.ndarray:
+        """Read up to `frames` frames; the buffer is float32 (frames, channels) already."""
+        block = self.data[self.position:self.position + frames]
+        self.position += len(block)
+        return block
+
+
+def open_reader(audio: "Path | AudioSource") -> "sf.SoundFile | BufferReader":
+    """Open a file with soundfile, or read an AudioSource's buffer the same way.
+
+    Block-wise readers take either without decoding a shared source again.
+    """
+    if isinstance(audio, AudioSource):
+        return BufferReader(audio)
+    return sf.SoundFile(str(audio))
@@ -0,0 +1,256 @@
+"""Batch processing of many episodes with one loaded model."""
+
+import contextvars
+import csv
+import glob
+import json
+import logging
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+from .analyzer import Analyzer
+from .audio import AudioSource
+from .editor import Editor
+from .models import EditDecision, Segment
+from .probe import get_duration
+from .results import save_results
+from .transcriber import Transcriber
+
+logger = logging.getLogger(__name__)
+
+AUDIO_EXTENSIONS = {".wav", ".mp3", ".flac", ".ogg", ".m4a"}
+
+REPORT_FILE = "report.jsonl"
+SUMMARY_FILE = "summary.json"
+
+
+class BatchJob(NamedTuple):
+    """One episode to process."""
+
+    input: Path
+    language: str | None = None
+    name: str | None = None  # Output file stem, defaults to the input stem
+
+
+def collect_jobs(source: str) -> list[BatchJob]:
+    """Build jobs from a directory, a glob pattern or a CSV/JSONL manifest.
+
+    Manifests have an ``input`` column/key and optional ``language`` and
+    ``name``; relative inputs are resolved against the manifest's directory.
+
+    Args:
+        source: Directory, glob pattern, or path to a .csv/.jsonl manifest
+
+    Returns:
+        Jobs in a stable order
+    """
+    path = Path(source)
+    if path.is_dir():
+        return [
+            BatchJob(input=p)
+            for p in sorted(path.iterdir())
+            if p.is_file() and p.suffix.lower() in AUDIO_EXTENSIONS
+        ]
+
+    if path.suffix.lower() in (".csv", ".jsonl") and path.is_file():
+        with open(path, encoding="utf-8", newline="") as f:
+            if path.suffix.lower() == ".csv":
+                rows = list(csv.DictReader(f))
+            else:
+                rows = [json.loads(line) for line in f if line.strip()]
+        return [
+            BatchJob(
+                input=(path.parent / row["input"]).resolve(),
+                language=row.get("language") or None,
+                name=row.get("name") or None,
+            )
+            for row in rows
+        ]
+
+    return [BatchJob(input=Path(p)) for p in sorted(glob.glob(source, recursive=True))]
+
+
+def load_report(output_dir: Path) -> dict[str, dict]:
+    """Return the latest report record per input from a previous run."""
+    records = {}
+    report_path = Path(output_dir) / REPORT_FILE
+    if report_path.exists():
+        with open(report_path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    records[record["input"]] = record
+    return records
+
+
+class BatchRunner:
+    """Runs transcription, analysis and rendering over many files.
+
+    Transcription runs one file at a time on the shared model, while saving
+    results and rendering audio for finished files happen on a small thread
+    pool, so rendering episode N overlaps transcribing episode N+1.
+    """
+
+    def __init__(
+        self,
+        transcriber: Transcriber,
+        output_dir: Path,
+        language: str | None = None,
+        concurrency: int = 2,
+        analyze_only: bool = False,
+        editor: Editor | None = None,
+    ):
+        """Initialize the runner.
+
+        Args:
+            transcriber: Transcriber shared by every job (model loaded once)
+            output_dir: Directory for edited audio, per-file results and reports
+            language: Default language for jobs that do not set one
+            concurrency: Maximum number of files rendering at the same time
+            analyze_only: Only write results, do not render edited audio
+            editor: Editor used for rendering
+        """
+        self.transcriber = transcriber
+        self.output_dir = Path(output_dir)
+        self.language = language
+        self.concurrency = max(1, concurrency)
+        self.analyze_only = analyze_only
+        self.editor = editor or Editor()
+
+    def run(
+        self,
+        jobs: list[BatchJob],
+        force: bool = False,
+        on_record: Callable[[dict], None] | None = None,
+    ) -> dict:
+        """Process jobs, skipping files that already succeeded in this output dir.
+
+        Args:
+            jobs: Files to process
+            force: Re-process files even if a previous run succeeded
+            on_record: Called with each report record as files finish
+
+        Returns:
+            Summary of the whole batch, also written to summary.json
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        previous = load_report(self.output_dir)
+
+        pending = []
+        names: set[str] = set()
+        for job in jobs:
+            name = job.name or job.input.stem
+            while name in names:
+                name = f"{name}_"
+            names.add(name)
+            key = str(job.input.resolve())
+            if force or previous.get(key, {}).get("status") != "done":
+                pending.append((job, name))
+
+        skipped = len(jobs) - len(pending)
+        logger.info(f"Batch: {len(pending)} to process, {skipped} already done")
+
+        with (
+            open(self.output_dir / REPORT_FILE, "a", encoding="utf-8") as report,
+            ThreadPoolExecutor(max_workers=self.concurrency) as pool,
+        ):
+
+            def record(result: dict) -> None:
+                previous[result["input"]] = result
+                report.write(json.dumps(result, ensure_ascii=False) + "\n")
+                report.flush()
+                if on_record:
+                    on_record(result)
+
+            in_flight: deque[Future] = deque()
+            for job, name in pending:
+                started = time.perf_counter()
+                # Shared by transcription and rendering; _finish closes it
+                source = AudioSource(job.input)
+                try:
+                    segments, decisions = self._analyze(job, source)
+                except Exception as e:
+                    source.close()
+                    logger.exception(f"Transcription failed: {job.input}")
+                    record(self._record(job, "failed", started, error=str(e)))
+                    continue
+
+                # Copy the context so metrics stages on the pool attach to this run
+                in_flight.append(
+                    pool.submit(
+                        contextvars.copy_context().run,
+                        self._finish, job, source, name, segments, decisions, started,
+                    )
+                )
+                while len(in_flight) >= self.concurrency:
+                    record(in_flight.popleft().result())
+
+            while in_flight:
+                record(in_flight.popleft().result())
+
+        wanted = {str(job.input.resolve()) for job in jobs}
+        records = [r for key, r in previous.items() if key in wanted]
+        summary = {
+            "total": len(jobs),
+            "done": sum(r["status"] == "done" for r in records),
+            "failed": sum(r["status"] == "failed" for r in records),
+            "skipped": skipped,
+            "original_duration": round(sum(r.get("original_duration", 0.0) for r in records), 3),
+            "new_duration": round(sum(r.get("new_duration", 0.0) for r in records), 3),
+            "files": records,
+        }
+        with open(self.output_dir / SUMMARY_FILE, "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+        return summary
+
+    def _analyze(self, job: BatchJob, source: AudioSource) -> tuple[list[Segment], list[EditDecision]]:
+        language = job.language or self.language
+        segments = self.transcriber.transcribe(source, language=language)
+        decisions = Analyzer(language=language or "ru").analyze(segments)
+        return segments, decisions
+
+    def _finish(
+        self,
+        job: BatchJob,
+        source: AudioSource,
+        name: str,
+        segments: list[Segment],
+        decisions: list[EditDecision],
+        started: float,
+    ) -> dict:
+        """Save results and render audio for one analyzed file."""
+        try:
+            results_path = self.output_dir / f"{name}.json"
+            transcription = self.transcriber.record(job.language or self.language)
+            save_results(segments, decisions, results_path, transcription=transcription)
+            extra = {
+                "results": str(results_path),
+                "words": sum(len(s.words) for s in segments),
+                "decisions": len(decisions),
+            }
+
+            if not self.analyze_only:
+                output_path = self.output_dir / f"{name}.wav"
+                self.editor.edit(source, output_path, decisions)
+                extra.update(
+                    output=str(output_path),
+                    original_duration=round(source.duration, 3),
+                    new_duration=round(get_duration(output_path), 3),
+                )
+            return self._record(job, "done", started, **extra)
+        except Exception as e:
+            logger.exception(f"Rendering failed: {job.input}")
+            return self._record(job, "failed", started, error=str(e))
+        finally:
+            source.close()
+
+    def _record(self, job: BatchJob, status: str, started: float, **extra) -> dict:
+        return {
+            "input": str(job.input.resolve()),
+            "status": status,
+            "elapsed": round(time.perf_counter() - started, 3),
+            **extra,
+        }
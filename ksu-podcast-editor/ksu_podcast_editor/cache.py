@@ -0,0 +1,263 @@
+"""On-disk caches keyed by audio content: transcripts and rendered fragments."""
+
+import contextlib
+import fcntl
+import hashlib
+import json
+import logging
+import os
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+
+import numpy as np
+
+from .models import Segment
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024  # 1 GiB
+DEFAULT_RENDER_MAX_BYTES = 8 * DEFAULT_MAX_BYTES
+
+# (path, mtime_ns, size) -> content hash
+_hash_cache: dict[tuple[str, int, int], str] = {}
+
+
+def default_cache_dir(kind: str = "transcripts") -> Path:
+    """Return the cache directory for transcripts or renders, honouring XDG_CACHE_HOME."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "ksu-podcast-editor" / kind
+
+
+def hash_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """Hash file contents in chunks, memoized per (path, mtime, size)."""
+    path = Path(path).resolve()
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+
+    digest = _hash_cache.get(key)
+    if digest is None:
+        h = hashlib.blake2b(digest_size=20)
+        with open(path, "rb") as f:
+            while chunk := f.read(chunk_size):
+                h.update(chunk)
+        digest = h.hexdigest()
+        _hash_cache[key] = digest
+    return digest
+
+
+class TranscriptCache:
+    """Size-bounded LRU cache of transcripts stored as JSONL files."""
+
+    def __init__(self, directory: Path | None = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Initialize the cache.
+
+        Args:
+            directory: Cache directory (default: ~/.cache/ksu-podcast-editor/transcripts)
+            max_bytes: Total size above which least recently used entries are evicted
+        """
+        self.directory = Path(directory) if directory else default_cache_dir()
+        self.max_bytes = max_bytes
+
+    def key(self, audio_path: Path, settings: dict) -> str:
+        """Build a cache key from the audio content and transcription settings."""
+        payload = json.dumps(settings, sort_keys=True, default=str)
+        h = hashlib.blake2b(digest_size=20)
+        h.update(hash_file(audio_path).encode())
+        h.update(payload.encode())
+        return h.hexdigest()
+
+    def load(self, key: str) -> Iterator[Segment] | None:
+        """Return an iterator over cached segments, or None on a miss."""
+        path = self._path(key)
+        if not path.exists():
+            return None
+        # Mark as recently used
+        os.utime(path)
+        return self._read(path)
+
+    def store(self, key: str, segments: Iterable[Segment]) -> Iterator[Segment]:
+        """Pass segments through while writing them to the cache.
+
+        The entry only becomes visible once the input is exhausted, so an
+        interrupted transcription never leaves a partial transcript behind.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for segment in segments:
+                    f.write(segment.model_dump_json())
+                    f.write("\n")
+                    yield segment
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        self.evict()
+
+    def store_resumable(
+        self, key: str, transcribe: Callable[[float], Iterable[Segment]]
+    ) -> Iterator[Segment]:
+        """Like store(), but checkpoint every segment so an interrupted run can resume.
+
+        Segments are appended and flushed to a sidecar ``<key>.jsonl.partial``
+        as they arrive. If an earlier run left one, its segments are yielded
+        first and transcribe() is asked to continue from the end of the last
+        one; a line cut short by a crash is dropped. The sidecar becomes the
+        cache entry once transcribe() is exhausted.
+
+        Args:
+            key: Cache key of the transcript
+            transcribe: Called with the start time in seconds; yields the
+                segments from there to the end of the audio
+
+        Yields:
+            Every segment of the transcript, in order
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        partial = path.with_name(f"{path.name}.partial")
+
+        with open(partial, "a+b") as f:
+            try:
+                fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                taken = True
+            else:
+                # Eviction may have unlinked the checkpoint between open and lock
+                taken = os.fstat(f.fileno()).st_nlink == 0
+            if taken:
+                # Another process is transcribing the same audio or evicting the
+                # checkpoint; do not share it
+                yield from self.store(key, transcribe(0.0))
+                return
+
+            f.seek(0)
+            committed, size = [], 0
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                committed.append(Segment.model_validate_json(line))
+                size += len(line)
+            f.truncate(size)
+
+            start = committed[-1].end if committed else 0.0
+            if committed:
+                logger.info(f"Resuming transcript from checkpoint at {start:.1f}s ({len(committed)} segments)")
+            yield from committed
+
+            for segment in transcribe(start):
+                f.write(segment.model_dump_json().encode("utf-8") + b"\n")
+                f.flush()
+                yield segment
+            os.replace(partial, path)
+
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove least recently used entries and abandoned checkpoints until the cache fits max_bytes.
+
+        A checkpoint still locked by a running transcription is never
+        evicted; abandoned ones stay locked while evicting so no run can
+        pick one up in the meantime.
+        """
+        with contextlib.ExitStack() as stack:
+            partials = [p for p in self.directory.glob("*.jsonl.partial") if _lock_abandoned(p, stack)]
+            _evict([*self.directory.glob("*.jsonl"), *partials], self.max_bytes)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.jsonl"
+
+    def _read(self, path: Path) -> Iterator[Segment]:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                yield Segment.model_validate_json(line)
+
+
+class RenderCache:
+    """Size-bounded LRU cache of decoded keep intervals, stored as .npy files.
+
+    A fragment holds the source frames of one kept interval before any
+    crossfade is applied, so it is keyed by the audio content and the
+    interval alone: crossfade changes and cuts elsewhere in the episode
+    reuse it.
+    """
+
+    def __init__(self, directory: Path | None = None, max_bytes: int = DEFAULT_RENDER_MAX_BYTES):
+        """Initialize the cache.
+
+        Args:
+            directory: Cache directory (default: ~/.cache/ksu-podcast-editor/renders)
+            max_bytes: Total size above which least recently used fragments are evicted
+        """
+        self.directory = Path(directory) if directory else default_cache_dir("renders")
+        self.max_bytes = max_bytes
+
+    def key(self, audio_path: Path, start: int, end: int, samplerate: int) -> str:
+        """Build a fragment key from the audio content and a frame range."""
+        h = hashlib.blake2b(digest_size=20)
+        h.update(hash_file(audio_path).encode())
+        h.update(f"{start}:{end}@{samplerate}".encode())
+        return h.hexdigest()
+
+    def load(self, key: str) -> np.ndarray | None:
+        """Return a memory-mapped fragment, or None on a miss."""
+        path = self._path(key)
+        try:
+            fragment = np.load(path, mmap_mode="r")
+        except FileNotFoundError:
+            return None
+        os.utime(path)
+        return fragment
+
+    def store(self, key: str, fragment: np.ndarray) -> None:
+        """Write a fragment, replacing it atomically."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_name(f"{key}.{os.getpid()}.tmp.npy")
+        try:
+            np.save(tmp_path, fragment)
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def evict(self) -> None:
+        """Remove least recently used fragments until the cache fits max_bytes."""
+        _evict([p for p in self.directory.glob("*.npy") if ".tmp" not in p.suffixes], self.max_bytes)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.npy"
+
+
+def _lock_abandoned(path: Path, stack: contextlib.ExitStack) -> bool:
+    """Lock a checkpoint no process is writing, holding the lock until `stack` closes."""
+    try:
+        f = stack.enter_context(open(path, "rb"))
+    except FileNotFoundError:
+        return False
+    try:
+        fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return False
+    return True
+
+
+def _evict(paths: list[Path], max_bytes: int) -> None:
+    """Delete the least recently used of `paths` until they total at most max_bytes."""
+    entries = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        logger.info(f"Evicting cache entry: {path.parent.name}/{path.name}")
+        path.unlink(missing_ok=True)
+        total -= size
@@ -1,106 +1,97 @@
-"""Command-line interface."""
+"""Command-line interface.
+
+Only typer, rich's console and the standard library are imported at
+startup. NumPy, soundfile, pydantic and faster-whisper are imported inside
+the commands that use them, so --help, --version and other metadata calls
+start quickly.
+"""
 
-import csv
 import json
+import time
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 
-from .analyzer import Analyzer
-from .editor import Editor
-from .transcriber import Transcriber
+from . import __version__, metrics
+
+if TYPE_CHECKING:
+    from .profiles import TranscriptionProfile
+    from .transcriber import Transcriber
 
 app = typer.Typer(help="KSU Podcast Editor - Remove fillers and repetitions from audio")
 console = Console()
 
 
-def _save_results(segments: list, decisions: list, output_path: Path, verbose: bool = False) -> None:
-    """Save transcription and analysis results to file."""
-    # Build data structure with all words and their labels
-    all_words = []
-    decision_map = {}  # Map (start, end) -> decision for quick lookup
+def _load_profile(name: str | None, config: Path | None) -> "TranscriptionProfile":
+    """Resolve --profile/--config, exiting with a message on errors."""
+    from .profiles import get_profile
 
-    for decision in decisions:
-        decision_map[(round(decision.start, 3), round(decision.end, 3))] = decision
-
-    for segment in segments:
-        for word in segment.words:
-            word_key = (round(word.start, 3), round(word.end, 3))
-            decision = decision_map.get(word_key)
-
-            word_data = {
-                "text": word.text,
-                "start": round(word.start, 3),
-                "end": round(word.end, 3),
-                "confidence": round(word.confidence, 3),
-                "label": decision.reason if decision else "keep",
-            }
-            all_words.append(word_data)
-
-    ext = output_path.suffix.lower()
-
-    if ext == ".json":
-        output_data = {
-            "segments": [
-                {
-                    "text": s.text,
-                    "start": round(s.start, 3),
-                    "end": round(s.end, 3),
-                    "words": [
-                        {
-                            "text": w.text,
-                            "start": round(w.start, 3),
-                            "end": round(w.end, 3),
-                            "confidence": round(w.confidence, 3),
-                        }
-                        for w in s.words
-                    ],
-                }
-                for s in segments
-            ],
-            "words": all_words,
-            "fillers": [
-                {
-                    "text": d.original_text,
-                    "start": round(d.start, 3),
-                    "end": round(d.end, 3),
-                    "reason": d.reason,
-                }
-                for d in decisions
-            ],
-            "summary": {
-                "total_segments": len(segments),
-                "total_words": len(all_words),
-                "fillers_count": len(decisions),
-            },
-        }
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(output_data, f, ensure_ascii=False, indent=2)
-
-    elif ext == ".csv":
-        with open(output_path, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=["text", "start", "end", "confidence", "label"])
-            writer.writeheader()
-            writer.writerows(all_words)
-
-    else:
-        # Default to plain text
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write("# Transcription Results\n\n")
-            f.write("## Words with timestamps\n\n")
-            for word in all_words:
-                label_str = f" [{word['label']}]" if word['label'] != "keep" else ""
-                f.write(f"{word['start']:.3f} - {word['end']:.3f}: {word['text']}{label_str}\n")
-            f.write(f"\n## Summary\n")
-            f.write(f"Total words: {len(all_words)}\n")
-            f.write(f"Fillers to remove: {len(decisions)}\n")
+    try:
+        return get_profile(name, config)
+    except (OSError, ValueError) as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
 
-    if verbose:
-        print(f"[DEBUG] Saved {len(all_words)} words to {output_path}")
+
+def _make_transcriber(
+    model: str,
+    verbose: bool,
+    no_cache: bool,
+    workers: int = 1,
+    draft_model: str | None = None,
+    profile: "TranscriptionProfile | None" = None,
+) -> "Transcriber":
+    """Use a running transcription server if there is one, else a local model."""
+    from .cache import TranscriptCache
+    from .server import RemoteTranscriber, default_socket_path, is_running
+    from .transcriber import Transcriber
+
+    cache = None if no_cache else TranscriptCache()
+    socket_path = default_socket_path()
+    if draft_model:
+        return Transcriber(
+            model_size=model, verbose=verbose, cache=cache, draft_model_size=draft_model, profile=profile
+        )
+    if workers <= 1 and is_running(socket_path):
+        if verbose:
+            console.print(f"[dim][DEBUG] Using transcription server: {socket_path}[/dim]")
+        return RemoteTranscriber(socket_path, model_size=model, verbose=verbose, cache=cache, profile=profile)
+    return Transcriber(model_size=model, verbose=verbose, cache=cache, workers=workers, profile=profile)
+
+
+def _show_version(value: bool) -> None:
+    if value:
+        typer.echo(f"ksu-podcast-editor {__version__}")
+        raise typer.Exit()
+
+
+@app.callback()
+def main_options(
+    ctx: typer.Context,
+    version: bool = typer.Option(
+        False, "--version", callback=_show_version, is_eager=True, help="Show the version and exit"
+    ),
+    metrics_path: Optional[Path] = typer.Option(
+        None, "--metrics", help="Write per-stage timing and memory to this JSON (or appended .jsonl) file"
+    ),
+    trace_path: Optional[Path] = typer.Option(
+        None, "--trace", help="Append per-stage OpenTelemetry-style spans to this JSONL file"
+    ),
+) -> None:
+    """KSU Podcast Editor - Remove fillers and repetitions from audio."""
+    if metrics_path is None and trace_path is None:
+        return
+    recorder = ctx.with_resource(metrics.recording())
+
+    def write() -> None:
+        if metrics_path:
+            recorder.write(metrics_path)
+        if trace_path:
+            recorder.write_spans(trace_path)
+
+    ctx.call_on_close(write)
 
 
 @app.command()
@@ -115,11 +106,44 @@ def analyze(
     model: str = typer.Option(
         "large-v3", "--model", "-m", help="Whisper model size (tiny, base, small, medium, large-v3)"
     ),
+    draft_model: Optional[str] = typer.Option(
+        None, "--draft-model", help="Transcribe with this small model first and use --model only on uncertain spans"
+    ),
+    profile_name: Optional[str] = typer.Option(
+        None, "--profile", "-p", help="Transcription profile (default, fast-cpu, accurate, batch-throughput, or from the config)"
+    ),
+    config: Optional[Path] = typer.Option(
+        None, "--config", help="Profile config file (default: ~/.config/ksu-podcast-editor/profiles.toml)"
+    ),
     output: Optional[Path] = typer.Option(
-        None, "--output", "-o", help="Save results to file (JSON or CSV based on extension)"
+        None, "--output", "-o", help="Save results to file (JSON, JSONL, CSV or text based on extension)"
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Always re-transcribe instead of reusing a cached transcript"
+    ),
+    workers: int = typer.Option(
+        1, "--workers", "-j", help="Transcribe chunks split at silences in N parallel processes"
+    ),
+    cuts_csv: Optional[Path] = typer.Option(
+        None, "--cuts-csv", help="Write merged, padded cuts as start,end,label CSV for REAPER"
+    ),
+    pad_ms: float = typer.Option(
+        100.0, "--pad-ms", help="Padding before and after each cut in --cuts-csv"
+    ),
+    merge_gap_ms: float = typer.Option(
+        50.0, "--merge-gap-ms", help="Merge cuts in --cuts-csv separated by at most this gap"
     ),
 ) -> None:
     """Analyze audio file and show detected fillers without editing."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.table import Table
+
+    from .analyzer import Analyzer
+    from .audio import AudioSource
+    from .cutplan import CutPlanner
+    from .results import save_cuts_csv, save_results, stream_results
+    from .transcript import Transcript
+
     if not input_file.exists():
         console.print(f"[red]Error: File not found: {input_file}[/red]")
         raise typer.Exit(1)
@@ -129,25 +153,46 @@ def analyze(
         console.print(f"[dim][DEBUG] File size: {input_file.stat().st_size / 1024 / 1024:.1f} MB[/dim]")
         console.print(f"[dim][DEBUG] Model: {model}[/dim]")
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-        disable=verbose,  # Disable spinner in verbose mode for cleaner output
-    ) as progress:
+    with (
+        AudioSource(input_file) as source,
+        Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+            disable=verbose,  # Disable spinner in verbose mode for cleaner output
+        ) as progress,
+    ):
         progress.add_task("Transcribing audio...", total=None)
-        transcriber = Transcriber(model_size=model, verbose=verbose)
-        segments = transcriber.transcribe(input_file, language=language)
-
-    detected_lang = language or "auto"
-    analyzer = Analyzer(language=language or "ru")
-    decisions = analyzer.analyze(segments)
+        transcriber = _make_transcriber(
+            model, verbose, no_cache, workers, draft_model, _load_profile(profile_name, config)
+        )
+        analyzer = Analyzer(language=language or "ru")
+        segments = transcriber.iter_segments(source, language=language)
+
+        if output and output.suffix.lower() != ".json":
+            # CSV, JSONL and text are written as segments arrive
+            decisions = stream_results(analyzer.iter_labeled_words(segments), output, verbose)
+        else:
+            transcript = Transcript.from_segments(segments)
+            decisions = analyzer.analyze(transcript)
+            if output:
+                save_results(
+                    transcript, decisions, output, verbose,
+                    transcription=transcriber.record(language),
+                )
+        duration = source.duration
 
-    # Save to file if requested
     if output:
-        _save_results(segments, decisions, output, verbose)
         console.print(f"[green]Results saved to: {output}[/green]")
 
+    if cuts_csv:
+        planner = CutPlanner(
+            merge_gap=merge_gap_ms / 1000, pre_pad=pad_ms / 1000, post_pad=pad_ms / 1000
+        )
+        cuts = planner.plan(decisions, duration)
+        save_cuts_csv(cuts, cuts_csv)
+        console.print(f"[green]{len(cuts)} cuts saved to: {cuts_csv}[/green]")
+
     # Display results
     table = Table(title="Detected Fillers and Repetitions")
     table.add_column("Time", style="cyan")
@@ -178,34 +223,127 @@ def edit(
     model: str = typer.Option(
         "large-v3", "--model", "-m", help="Whisper model size (tiny, base, small, medium, large-v3)"
     ),
+    draft_model: Optional[str] = typer.Option(
+        None, "--draft-model", help="Transcribe with this small model first and use --model only on uncertain spans"
+    ),
+    profile_name: Optional[str] = typer.Option(
+        None, "--profile", "-p", help="Transcription profile (default, fast-cpu, accurate, batch-throughput, or from the config)"
+    ),
+    config: Optional[Path] = typer.Option(
+        None, "--config", help="Profile config file (default: ~/.config/ksu-podcast-editor/profiles.toml)"
+    ),
+    stream: bool = typer.Option(
+        False, "--stream", help="Edit block by block with bounded memory (for very long recordings)"
+    ),
+    incremental: bool = typer.Option(
+        False, "--incremental", help="Cache rendered intervals and only re-read those whose cuts changed since the last edit"
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Always re-transcribe instead of reusing a cached transcript"
+    ),
+    workers: int = typer.Option(
+        1, "--workers", "-j", help="Transcribe chunks split at silences in N parallel processes"
+    ),
+    pad_ms: float = typer.Option(
+        0.0, "--pad-ms", help="Padding before and after each cut in milliseconds"
+    ),
+    merge_gap_ms: float = typer.Option(
+        50.0, "--merge-gap-ms", help="Merge cuts separated by at most this gap, in milliseconds"
+    ),
+    snap_ms: float = typer.Option(
+        0.0, "--snap-ms", help="Move splice points to the nearest zero crossing within this window"
+    ),
+    max_pause_ms: float = typer.Option(
+        0.0, "--max-pause-ms", help="Shorten silences longer than this, in milliseconds (0 disables)"
+    ),
+    pause_target_ms: float = typer.Option(
+        500.0, "--pause-target-ms", help="Length long silences are shortened to, in milliseconds"
+    ),
+    silence_db: float = typer.Option(
+        -40.0, "--silence-db", help="Level in dBFS below which audio counts as silence"
+    ),
+    acoustic: bool = typer.Option(
+        False, "--acoustic", help="Also find hesitation sounds from the audio that Whisper drops"
+    ),
+    acoustic_only: bool = typer.Option(
+        False, "--acoustic-only", help="Only remove hesitation sounds found from the audio, skip full transcription"
+    ),
 ) -> None:
     """Process audio file and remove fillers and repetitions."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    from .analyzer import Analyzer
+    from .audio import AudioSource
+    from .cutplan import CutPlanner
+    from .probe import get_duration
+    from .transcript import Transcript
+
     if not input_file.exists():
         console.print(f"[red]Error: File not found: {input_file}[/red]")
         raise typer.Exit(1)
 
+    if stream and incremental:
+        console.print("[red]Error: --incremental cannot be combined with --stream[/red]")
+        raise typer.Exit(1)
+
     if verbose:
         console.print(f"[dim][DEBUG] Input file: {input_file}[/dim]")
         console.print(f"[dim][DEBUG] File size: {input_file.stat().st_size / 1024 / 1024:.1f} MB[/dim]")
         console.print(f"[dim][DEBUG] Model: {model}[/dim]")
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-        disable=verbose,
-    ) as progress:
-        task = progress.add_task("Transcribing audio...", total=None)
-        transcriber = Transcriber(model_size=model, verbose=verbose)
-        segments = transcriber.transcribe(input_file, language=language)
-
-        progress.update(task, description="Analyzing content...")
-        analyzer = Analyzer(language=language or "ru")
-        decisions = analyzer.analyze(segments)
+    # Decoded at most once, and only if a stage needs samples
+    with (
+        AudioSource(input_file) as source,
+        Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+            disable=verbose,
+        ) as progress,
+    ):
+        task = progress.add_task("Transcribing and analyzing audio...", total=None)
+        if acoustic_only:
+            decisions = []
+        else:
+            transcriber = _make_transcriber(
+                model, verbose, no_cache, workers, draft_model, _load_profile(profile_name, config)
+            )
+            analyzer = Analyzer(language=language or "ru")
+            segments = transcriber.iter_segments(source, language=language)
+            transcript = Transcript.from_segments(segments)
+            decisions = analyzer.analyze(transcript)
+        if acoustic or acoustic_only:
+            progress.update(task, description="Detecting hesitation sounds...")
+            from .acoustic import AcousticFillerDetector, merge_decisions
+
+            detector = AcousticFillerDetector(language=language or "ru", verbose=verbose)
+            decisions = merge_decisions(
+                decisions, detector.detect(source), None if acoustic_only else transcript
+            )
+        if max_pause_ms > 0:
+            progress.update(task, description="Detecting long pauses...")
+            from .silence import SilenceDetector
+
+            silence = SilenceDetector(
+                threshold_db=silence_db,
+                min_silence=max_pause_ms / 1000,
+                target=pause_target_ms / 1000,
+            )
+            decisions = sorted(decisions + silence.detect(source), key=lambda d: d.start)
+        planner = CutPlanner(
+            merge_gap=merge_gap_ms / 1000,
+            pre_pad=pad_ms / 1000,
+            post_pad=pad_ms / 1000,
+            snap_window=snap_ms / 1000,
+        )
 
         if dry_run:
             progress.stop()
-            console.print(f"[yellow]Dry run - would remove {len(decisions)} segments[/yellow]")
+            cuts = planner.plan(decisions, source.duration)
+            console.print(
+                f"[yellow]Dry run - would remove {len(decisions)} segments "
+                f"in {len(cuts)} cuts[/yellow]"
+            )
             for decision in decisions:
                 console.print(
                     f"  {decision.start:.2f}s - {decision.end:.2f}s: "
@@ -214,13 +352,23 @@ def edit(
             return
 
         progress.update(task, description="Editing audio...")
-        editor = Editor()
-        editor.edit(input_file, output_file, decisions)
+        from .editor import Editor
+
+        if incremental:
+            from .cache import RenderCache
+
+            editor = Editor(planner=planner, cache=RenderCache())
+            # Unless analysis decoded it already, read only the intervals not in the cache
+            editor.edit(source.render_input(), output_file, decisions)
+        elif stream:
+            # A cached transcript leaves the input undecoded; stream it from disk then
+            Editor(planner=planner).edit_streaming(source.render_input(), output_file, decisions)
+        else:
+            Editor(planner=planner).edit(source, output_file, decisions)
+        original_duration = source.duration
 
     # Show summary
-    editor = Editor()
-    original_duration = editor.get_duration(input_file)
-    new_duration = editor.get_duration(output_file)
+    new_duration = get_duration(output_file)
     saved_time = original_duration - new_duration
 
     console.print(f"\n[green]Done![/green]")
@@ -230,6 +378,313 @@ def edit(
     console.print(f"Output saved to: {output_file}")
 
 
+@app.command()
+def batch(
+    source: str = typer.Argument(..., help="Directory, glob pattern, or CSV/JSONL manifest of episodes"),
+    output_dir: Path = typer.Argument(..., help="Directory for edited audio, results and reports"),
+    language: Optional[str] = typer.Option(
+        None, "--language", "-l", help="Language code (ru/en) for files the manifest does not set"
+    ),
+    model: str = typer.Option(
+        "large-v3", "--model", "-m", help="Whisper model size (tiny, base, small, medium, large-v3)"
+    ),
+    draft_model: Optional[str] = typer.Option(
+        None, "--draft-model", help="Transcribe with this small model first and use --model only on uncertain spans"
+    ),
+    profile_name: Optional[str] = typer.Option(
+        None, "--profile", "-p", help="Transcription profile (default, fast-cpu, accurate, batch-throughput, or from the config)"
+    ),
+    config: Optional[Path] = typer.Option(
+        None, "--config", help="Profile config file (default: ~/.config/ksu-podcast-editor/profiles.toml)"
+    ),
+    jobs: int = typer.Option(
+        2, "--jobs", "-j", help="Files rendered concurrently while the next one is transcribed"
+    ),
+    analyze_only: bool = typer.Option(
+        False, "--analyze-only", help="Only write per-file results, do not render audio"
+    ),
+    force: bool = typer.Option(
+        False, "--force", help="Re-process files that already succeeded in OUTPUT_DIR"
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Always re-transcribe instead of reusing a cached transcript"
+    ),
+    verbose: bool = typer.Option(
+        False, "--verbose", "-v", help="Enable verbose debug output"
+    ),
+) -> None:
+    """Process many episodes with a single loaded model; re-run to resume failures."""
+    from .batch import SUMMARY_FILE, BatchRunner, collect_jobs
+
+    batch_jobs = collect_jobs(source)
+    if not batch_jobs:
+        console.print(f"[red]Error: No audio files found for: {source}[/red]")
+        raise typer.Exit(1)
+
+    transcriber = _make_transcriber(
+        model, verbose, no_cache, draft_model=draft_model, profile=_load_profile(profile_name, config)
+    )
+    runner = BatchRunner(
+        transcriber, output_dir, language=language, concurrency=jobs, analyze_only=analyze_only
+    )
+
+    def show(record: dict) -> None:
+        if record["status"] == "done":
+            console.print(f"[green]done[/green]   {record['input']} ({record['elapsed']:.1f}s)")
+        else:
+            console.print(f"[red]failed[/red] {record['input']}: {record.get('error')}")
+
+    console.print(f"Processing {len(batch_jobs)} files into {output_dir}")
+    summary = runner.run(batch_jobs, force=force, on_record=show)
+
+    console.print(
+        f"\n[green]Done: {summary['done']}[/green], failed: {summary['failed']}, "
+        f"skipped (already done): {summary['skipped']}"
+    )
+    console.print(f"Summary saved to: {output_dir / SUMMARY_FILE}")
+    if summary["failed"]:
+        raise typer.Exit(1)
+
+
+@app.command()
+def multitrack(
+    stems: list[Path] = typer.Argument(..., help="Aligned stems of one recording, e.g. one file per host"),
+    output_dir: Path = typer.Option(..., "--output-dir", "-o", help="Directory for the edited stems"),
+    language: Optional[str] = typer.Option(
+        None, "--language", "-l", help="Language code (ru/en), auto-detect if not specified"
+    ),
+    mixdown: bool = typer.Option(
+        False, "--mixdown", help="Transcribe one mix of all stems instead of each stem on its own"
+    ),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", "-n", help="Show what would be removed without editing"
+    ),
+    verbose: bool = typer.Option(
+        False, "--verbose", "-v", help="Enable verbose debug output"
+    ),
+    model: str = typer.Option(
+        "large-v3", "--model", "-m", help="Whisper model size (tiny, base, small, medium, large-v3)"
+    ),
+    profile_name: Optional[str] = typer.Option(
+        None, "--profile", "-p", help="Transcription profile (default, fast-cpu, accurate, batch-throughput, or from the config)"
+    ),
+    config: Optional[Path] = typer.Option(
+        None, "--config", help="Profile config file (default: ~/.config/ksu-podcast-editor/profiles.toml)"
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Always re-transcribe instead of reusing a cached transcript"
+    ),
+    jobs: int = typer.Option(
+        0, "--jobs", "-j", help="Stems rendered concurrently (default: all at once)"
+    ),
+    pad_ms: float = typer.Option(
+        0.0, "--pad-ms", help="Padding before and after each cut in milliseconds"
+    ),
+    merge_gap_ms: float = typer.Option(
+        50.0, "--merge-gap-ms", help="Merge cuts separated by at most this gap, in milliseconds"
+    ),
+    snap_ms: float = typer.Option(
+        0.0, "--snap-ms", help="Move splice points to the nearest zero crossing of the mix within this window"
+    ),
+) -> None:
+    """Remove fillers and repetitions from several aligned stems with one shared cut list."""
+    import contextlib
+    import tempfile
+
+    from .analyzer import Analyzer
+    from .audio import AudioSource
+    from .cutplan import CutPlanner
+    from .editor import Editor
+    from .multitrack import MultitrackEditor, union_decisions, write_mixdown
+    from .transcript import Transcript
+
+    missing = [stem for stem in stems if not stem.exists()]
+    if missing:
+        console.print(f"[red]Error: File not found: {missing[0]}[/red]")
+        raise typer.Exit(1)
+    outputs = [output_dir / f"{stem.stem}.wav" for stem in stems]
+    if len(set(outputs)) < len(outputs):
+        console.print("[red]Error: Stems must have distinct file names[/red]")
+        raise typer.Exit(1)
+
+    transcriber = _make_transcriber(model, verbose, no_cache, profile=_load_profile(profile_name, config))
+    analyzer = Analyzer(language=language or "ru")
+
+    with contextlib.ExitStack() as stack:
+        # Each stem is decoded at most once, shared by transcription and rendering
+        sources = [stack.enter_context(AudioSource(stem)) for stem in stems]
+        try:
+            if mixdown:
+                mix_path = Path(stack.enter_context(tempfile.TemporaryDirectory())) / "mix.wav"
+                write_mixdown(sources, mix_path)
+                console.print(f"Transcribing a mix of {len(stems)} stems...")
+                mix = Transcript.from_segments(transcriber.iter_segments(mix_path, language=language))
+                decisions = analyzer.analyze(mix)
+            else:
+                transcripts = []
+                for source in sources:
+                    console.print(f"Transcribing {source.path.name}...")
+                    transcripts.append(Transcript.from_segments(transcriber.iter_segments(source, language=language)))
+                decisions = union_decisions(transcripts, analyzer)
+        except ValueError as e:
+            console.print(f"[red]Error: {e}[/red]")
+            raise typer.Exit(1)
+
+        if dry_run:
+            console.print(f"[yellow]Dry run - would remove {len(decisions)} segments from {len(stems)} stems[/yellow]")
+            for decision in decisions:
+                console.print(
+                    f"  {decision.start:.2f}s - {decision.end:.2f}s: "
+                    f"[{decision.reason}] {decision.original_text}"
+                )
+            return
+
+        planner = CutPlanner(
+            merge_gap=merge_gap_ms / 1000,
+            pre_pad=pad_ms / 1000,
+            post_pad=pad_ms / 1000,
+            snap_window=snap_ms / 1000,
+        )
+        output_dir.mkdir(parents=True, exist_ok=True)
+        console.print(f"Editing {len(stems)} stems...")
+        # Stems decoded for transcription are read from memory, the others streamed from disk if possible
+        inputs = [source.render_input() for source in sources]
+        editor = MultitrackEditor(Editor(planner=planner), workers=jobs or None)
+        try:
+            intervals = editor.edit(inputs, outputs, decisions)
+        except ValueError as e:
+            console.print(f"[red]Error: {e}[/red]")
+            raise typer.Exit(1)
+
+    console.print(f"\n[green]Done![/green] Removed {len(decisions)} segments, kept {len(intervals)} intervals per stem")
+    for output in outputs:
+        console.print(f"Output saved to: {output}")
+
+
+@app.command()
+def bench(
+    sample: Path = typer.Argument(..., help="Sample audio file to transcribe with each profile"),
+    profiles: Optional[str] = typer.Option(
+        None, "--profiles", help="Comma-separated profiles to time (default: all built-in and configured)"
+    ),
+    language: Optional[str] = typer.Option(
+        None, "--language", "-l", help="Language code (ru/en), auto-detect if not specified"
+    ),
+    model: str = typer.Option(
+        "large-v3", "--model", "-m", help="Whisper model size (tiny, base, small, medium, large-v3)"
+    ),
+    config: Optional[Path] = typer.Option(
+        None, "--config", help="Profile config file (default: ~/.config/ksu-podcast-editor/profiles.toml)"
+    ),
+    output: Optional[Path] = typer.Option(
+        None, "--output", "-o", help="Also save the timings as JSON"
+    ),
+    verbose: bool = typer.Option(
+        False, "--verbose", "-v", help="Enable verbose debug output"
+    ),
+) -> None:
+    """Time transcription profiles on a sample file and report the real-time factor."""
+    from rich.table import Table
+
+    from .probe import get_duration
+    from .profiles import load_profiles
+    from .transcriber import Transcriber
+
+    if not sample.exists():
+        console.print(f"[red]Error: File not found: {sample}[/red]")
+        raise typer.Exit(1)
+
+    try:
+        available = load_profiles(config)
+    except (OSError, ValueError) as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+    names = [name.strip() for name in profiles.split(",")] if profiles else list(available)
+    unknown = [name for name in names if name not in available]
+    if unknown:
+        console.print(f"[red]Error: Unknown profile(s): {', '.join(unknown)}[/red]")
+        raise typer.Exit(1)
+
+    duration = get_duration(sample)
+    results = []
+    for name in names:
+        console.print(f"Timing profile [cyan]{name}[/cyan]...")
+        transcriber = Transcriber(model_size=model, verbose=verbose, profile=available[name])
+        started = time.perf_counter()
+        transcriber.model
+        loaded = time.perf_counter()
+        segments = transcriber.transcribe(sample, language=language)
+        finished = time.perf_counter()
+        results.append({
+            "profile": name,
+            "load_seconds": round(loaded - started, 3),
+            "transcribe_seconds": round(finished - loaded, 3),
+            "rtf": round((finished - loaded) / duration, 4) if duration else None,
+            "words": sum(len(s.words) for s in segments),
+        })
+
+    table = Table(title=f"Transcription profiles on {sample.name} ({duration:.1f}s, {model})")
+    table.add_column("Profile", style="cyan")
+    table.add_column("Load", justify="right")
+    table.add_column("Transcribe", justify="right")
+    table.add_column("RTF", justify="right", style="magenta")
+    table.add_column("Words", justify="right")
+    for result in results:
+        rtf = "-" if result["rtf"] is None else f"{result['rtf']:.3f}"
+        table.add_row(
+            result["profile"],
+            f"{result['load_seconds']:.1f}s",
+            f"{result['transcribe_seconds']:.1f}s",
+            rtf,
+            str(result["words"]),
+        )
+    console.print(table)
+
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump({"sample": str(sample), "duration": duration, "model": model, "results": results}, f, indent=2)
+        console.print(f"[green]Timings saved to: {output}[/green]")
+
+
+@app.command()
+def serve(
+    model: str = typer.Option(
+        "large-v3", "--model", "-m", help="Whisper model to load at startup"
+    ),
+    socket_path: Optional[Path] = typer.Option(
+        None, "--socket", help="Unix socket to listen on (default: per-user runtime dir)"
+    ),
+    profile_name: Optional[str] = typer.Option(
+        None, "--profile", "-p", help="Transcription profile of the model to load at startup"
+    ),
+    config: Optional[Path] = typer.Option(
+        None, "--config", help="Profile config file (default: ~/.config/ksu-podcast-editor/profiles.toml)"
+    ),
+    verbose: bool = typer.Option(
+        False, "--verbose", "-v", help="Enable verbose debug output"
+    ),
+) -> None:
+    """Keep Whisper models loaded and serve transcription jobs for analyze/edit."""
+    from .server import TranscriptionServer, default_socket_path
+
+    profile = _load_profile(profile_name, config)
+    socket_path = socket_path or default_socket_path()
+    try:
+        server = TranscriptionServer(socket_path, verbose=verbose)
+    except RuntimeError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+    with server:
+        console.print(f"Loading model {model}...")
+        server.get_transcriber(model, profile)
+        console.print(f"[green]Serving transcription jobs on {socket_path}[/green] (Ctrl+C to stop)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            console.print("\nStopping server")
+
+
 def main() -> None:
     """Entry point for the CLI."""
     app()
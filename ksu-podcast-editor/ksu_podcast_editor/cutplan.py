@@ -0,0 +1,174 @@
+"""Cut planning shared by all renderers.
+
+Turns raw edit decisions into a compact plan: sorted, padded, merged cuts
+clamped to the file, and the complementary list of intervals to keep.
+"""
+
+from collections.abc import Callable
+
+import numpy as np
+
+from . import metrics
+from .models import EditDecision
+
+# Reads `count` frames starting at `start` as a (frames, channels) array
+FrameReader = Callable[[int, int], np.ndarray]
+
+
+class CutPlanner:
+    """Merges and pads edit decisions into the cut list renderers apply."""
+
+    def __init__(
+        self,
+        merge_gap: float = 0.0,
+        pre_pad: float = 0.0,
+        post_pad: float = 0.0,
+        snap_window: float = 0.0,
+    ):
+        """Initialize the planner.
+
+        Args:
+            merge_gap: Cuts separated by at most this many seconds become one cut
+            pre_pad: Seconds added before each cut
+            post_pad: Seconds added after each cut
+            snap_window: Move frame boundaries to the nearest zero crossing
+                within this many seconds (0 disables snapping)
+        """
+        self.merge_gap = merge_gap
+        self.pre_pad = pre_pad
+        self.post_pad = post_pad
+        self.snap_window = snap_window
+
+    def plan(self, decisions: list[EditDecision], duration: float) -> list[EditDecision]:
+        """Merge decisions into sorted, non-overlapping cuts.
+
+        Padding is applied first, so cuts that touch after padding merge.
+        Merged cuts keep a single reason when all parts agree, otherwise
+        the reasons are joined with "+".
+
+        Args:
+            decisions: Segments to remove, in any order, possibly overlapping
+            duration: Length of the audio in seconds, used to clamp cuts
+
+        Returns:
+            Cuts in time order
+        """
+        with metrics.stage("plan", audio_seconds=duration, decisions=len(decisions)) as span:
+            cuts = self._plan(decisions, duration)
+            if span:
+                span.set(cuts=len(cuts))
+        return cuts
+
+    def _plan(self, decisions: list[EditDecision], duration: float) -> list[EditDecision]:
+        padded = sorted(
+            (
+                (max(0.0, d.start - self.pre_pad), min(duration, d.end + self.post_pad), d)
+                for d in decisions
+                if d.end > d.start
+            ),
+            key=lambda item: item[:2],
+        )
+
+        groups: list[tuple[float, float, list[EditDecision]]] = []
+        for start, end, decision in padded:
+            if end <= start:
+                continue
+            if groups and start - groups[-1][1] <= self.merge_gap:
+                prev_start, prev_end, parts = groups[-1]
+                groups[-1] = (prev_start, max(prev_end, end), parts + [decision])
+            else:
+                groups.append((start, end, [decision]))
+
+        cuts = []
+        for start, end, parts in groups:
+            reasons = list(dict.fromkeys(d.reason for d in parts))
+            cuts.append(
+                EditDecision(
+                    start=start,
+                    end=end,
+                    reason="+".join(reasons),
+                    original_text=" ".join(d.original_text for d in parts if d.original_text),
+                )
+            )
+        return cuts
+
+    def keep_intervals(self, decisions: list[EditDecision], duration: float) -> list[tuple[float, float]]:
+        """Return the (start, end) intervals in seconds that survive the cuts."""
+        intervals = []
+        pos = 0.0
+        for cut in self.plan(decisions, duration):
+            if cut.start > pos:
+                intervals.append((pos, cut.start))
+            pos = max(pos, cut.end)
+        if pos < duration:
+            intervals.append((pos, duration))
+        return intervals
+
+    def keep_frames(
+        self,
+        decisions: list[EditDecision],
+        n_frames: int,
+        samplerate: int,
+        read: FrameReader | None = None,
+    ) -> list[tuple[int, int]]:
+        """Return sample-accurate (start_frame, end_frame) intervals to keep.
+
+        Args:
+            decisions: Segments to remove
+            n_frames: Length of the audio in frames
+            samplerate: Sample rate used to convert seconds to frames
+            read: Reads audio around boundaries for zero-crossing snapping;
+                required when snap_window is set, ignored otherwise
+
+        Returns:
+            Sorted, non-overlapping intervals, end exclusive
+        """
+        duration = n_frames / samplerate
+        intervals = []
+        for start, end in self.keep_intervals(decisions, duration):
+            start_frame = int(round(start * samplerate))
+            end_frame = min(n_frames, int(round(end * samplerate)))
+            if end_frame > start_frame:
+                intervals.append((start_frame, end_frame))
+
+        if self.snap_window > 0 and read is not None:
+            window = int(round(self.snap_window * samplerate))
+            with metrics.stage("snap", boundaries=2 * len(intervals)):
+                intervals = snap_to_zero_crossings(intervals, read, n_frames, window)
+        return intervals
+
+
+def nearest_zero_crossing(samples: np.ndarray, center: int) -> int | None:
+    """Index of the zero crossing in a mono signal closest to `center`."""
+    negative = np.signbit(samples)
+    crossings = np.flatnonzero(negative[1:] != negative[:-1]) + 1
+    if not len(crossings):
+        return None
+    return int(crossings[np.argmin(np.abs(crossings - center))])
+
+
+def snap_to_zero_crossings(
+    intervals: list[tuple[int, int]], read: FrameReader, n_frames: int, window: int
+) -> list[tuple[int, int]]:
+    """Move interval boundaries to nearby zero crossings of the channel mix.
+
+    Boundaries at the very start or end of the file are left alone, and
+    intervals that would collapse or overlap their neighbour are dropped or
+    clamped.
+    """
+    def snap(frame: int) -> int:
+        if frame <= 0 or frame >= n_frames:
+            return frame
+        lo = max(0, frame - window)
+        samples = read(lo, min(n_frames, frame + window + 1) - lo)
+        found = nearest_zero_crossing(samples.mean(axis=1), frame - lo)
+        return frame if found is None else lo + found
+
+    snapped = []
+    for start, end in intervals:
+        start, end = snap(start), snap(end)
+        if snapped:
+            start = max(start, snapped[-1][1])
+        if end > start:
+            snapped.append((start, end))
+    return snapped
@@ -1,64 +1,319 @@
 """Audio editing operations."""
 
+import contextlib
 from pathlib import Path
 
 import numpy as np
 import soundfile as sf
-from pydub import AudioSegment
 
+from . import metrics
+from .audio import AudioSource, BufferReader, open_reader
+from .cache import RenderCache
+from .cutplan import CutPlanner
 from .models import EditDecision
+from .probe import get_duration
 
 
 class Editor:
     """Edits audio files based on edit decisions."""
 
-    def __init__(self, crossfade_ms: int = 20):
+    def __init__(
+        self,
+        crossfade_ms: int = 20,
+        block_frames: int = 65536,
+        planner: CutPlanner | None = None,
+        cache: RenderCache | None = None,
+    ):
         """Initialize the editor.
 
         Args:
             crossfade_ms: Duration of crossfade in milliseconds
+            block_frames: Frames read per block by edit_streaming
+            planner: Merges, pads and snaps decisions into the keep-list
+            cache: Keeps each rendered interval, so edit() only reads the
+                intervals whose cuts changed since an earlier render
         """
         self.crossfade_ms = crossfade_ms
+        self.block_frames = block_frames
+        self.planner = planner or CutPlanner()
+        self.cache = cache
 
     def edit(
-        self, input_path: Path, output_path: Path, decisions: list[EditDecision]
+        self, input_path: "Path | AudioSource", output_path: Path, decisions: list[EditDecision]
     ) -> None:
         """Edit an audio file by removing specified segments.
 
+        All cuts are merged into one list of kept intervals and the output is
+        assembled in a single preallocated buffer, with an equal-power
+        crossfade at every splice. With a render cache, only the kept
+        intervals missing from it are read from the input.
+
         Args:
-            input_path: Path to input WAV file
-            output_path: Path to output WAV file
+            input_path: Path to input audio file, or a source already decoded for this run
+            output_path: Path to output audio file
             decisions: List of edit decisions (segments to remove)
         """
-        if not decisions:
-            # No edits needed, just copy the file
-            audio = AudioSegment.from_wav(str(input_path))
-            audio.export(str(output_path), format="wav")
+        if self.cache is not None:
+            self._edit_incremental(input_path, output_path, decisions)
             return
 
-        audio = AudioSegment.from_wav(str(input_path))
+        if isinstance(input_path, AudioSource):
+            duration, subtype = input_path.duration, None
+        else:
+            info = sf.info(str(input_path))
+            duration, subtype = info.duration, info.subtype
+        with metrics.stage("render", audio_seconds=duration, mode="memory"):
+            if isinstance(input_path, AudioSource):
+                data, samplerate, subtype = input_path.data, input_path.samplerate, input_path.subtype
+            else:
+                with metrics.stage("decode", audio_seconds=duration):
+                    data, samplerate = sf.read(str(input_path), dtype="float32", always_2d=True)
 
-        # Sort decisions by start time in reverse order
-        # This allows us to remove from the end first, preserving earlier timestamps
-        sorted_decisions = sorted(decisions, key=lambda d: d.start, reverse=True)
+            intervals = self.planner.keep_frames(
+                decisions, len(data), samplerate, read=lambda start, count: data[start:start + count]
+            )
+            fade = int(round(self.crossfade_ms * samplerate / 1000))
+            output = splice(data, intervals, fade)
 
-        for decision in sorted_decisions:
-            start_ms = int(decision.start * 1000)
-            end_ms = int(decision.end * 1000)
+            with metrics.stage("encode", audio_seconds=len(output) / samplerate):
+                sf.write(
+                    str(output_path),
+                    output,
+                    samplerate,
+                    subtype=_output_subtype(output_path, subtype),
+                )
 
-            # Get the parts before and after the segment to remove
-            before = audio[:start_ms]
-            after = audio[end_ms:]
+    def _edit_incremental(
+        self, input_path: "Path | AudioSource", output_path: Path, decisions: list[EditDecision]
+    ) -> None:
+        """edit() through the render cache: reuse fragments, read only new intervals."""
+        if isinstance(input_path, AudioSource):
+            n_frames, samplerate, subtype = input_path.frames, input_path.samplerate, input_path.subtype
+        else:
+            info = sf.info(str(input_path))
+            n_frames, samplerate, subtype = info.frames, info.samplerate, info.subtype
 
-            # Apply crossfade if possible
-            if len(before) >= self.crossfade_ms and len(after) >= self.crossfade_ms:
-                audio = before.append(after, crossfade=self.crossfade_ms)
-            else:
-                audio = before + after
+        with (
+            metrics.stage("render", audio_seconds=n_frames / samplerate, mode="incremental") as span,
+            contextlib.ExitStack() as stack,
+        ):
+            infile = None
+
+            def read(start: int, count: int) -> np.ndarray:
+                # The input is only opened when snapping or a changed interval needs it
+                nonlocal infile
+                if infile is None:
+                    infile = stack.enter_context(open_reader(input_path))
+                return _read_at(infile, start, count)
+
+            intervals = self.planner.keep_frames(decisions, n_frames, samplerate, read=read)
+            fragments = []
+            reused = 0
+            for start, end in intervals:
+                key = self.cache.key(input_path, start, end, samplerate)
+                fragment = self.cache.load(key)
+                if fragment is None:
+                    fragment = read(start, end - start)
+                    self.cache.store(key, fragment)
+                else:
+                    reused += 1
+                fragments.append(fragment)
+            if span:
+                span.set(fragments=len(intervals), reused=reused)
+
+            fade = int(round(self.crossfade_ms * samplerate / 1000))
+            output = splice_fragments(fragments, fade)
 
-        audio.export(str(output_path), format="wav")
+            with metrics.stage("encode", audio_seconds=len(output) / samplerate):
+                sf.write(str(output_path), output, samplerate, subtype=_output_subtype(output_path, subtype))
+        self.cache.evict()
+
+    def edit_streaming(
+        self, input_path: "Path | AudioSource", output_path: Path, decisions: list[EditDecision]
+    ) -> None:
+        """Edit an audio file block by block, for files larger than RAM.
+
+        Produces the same output as edit(), but only seeks to and reads the
+        kept intervals, and holds at most one block plus one crossfade window
+        in memory.
+
+        Args:
+            input_path: Path to input audio file, or a source already decoded for this run
+            output_path: Path to output audio file
+            decisions: List of edit decisions (segments to remove)
+        """
+        with (
+            open_reader(input_path) as infile,
+            metrics.stage("render", audio_seconds=infile.frames / infile.samplerate, mode="streaming"),
+        ):
+            intervals = self.planner.keep_frames(
+                decisions, infile.frames, infile.samplerate, read=lambda start, count: _read_at(infile, start, count)
+            )
+            self._write_intervals(infile, output_path, intervals)
+
+    def render(
+        self, input_path: "Path | AudioSource", output_path: Path, intervals: list[tuple[int, int]]
+    ) -> None:
+        """Write the given frame intervals of a file, streaming like edit_streaming().
+
+        For keep-lists planned elsewhere, such as one shared by several
+        aligned tracks.
+
+        Args:
+            input_path: Path to input audio file, or a source already decoded for this run
+            output_path: Path to output audio file
+            intervals: Sorted (start_frame, end_frame) intervals to keep
+        """
+        with (
+            open_reader(input_path) as infile,
+            metrics.stage("render", audio_seconds=infile.frames / infile.samplerate, mode="streaming"),
+        ):
+            self._write_intervals(infile, output_path, intervals)
+
+    def _write_intervals(
+        self, infile: "sf.SoundFile | BufferReader", output_path: Path, intervals: list[tuple[int, int]]
+    ) -> None:
+        """Copy intervals block by block into a new file, crossfading each join."""
+        fade = int(round(self.crossfade_ms * infile.samplerate / 1000))
+        with sf.SoundFile(
+            str(output_path),
+            "w",
+            samplerate=infile.samplerate,
+            channels=infile.channels,
+            subtype=_output_subtype(output_path, infile.subtype),
+        ) as outfile:
+            writer = _TailWriter(outfile, fade, infile.channels)
+            fade_out, fade_in = equal_power_fades(fade) if fade > 0 else (None, None)
+
+            for start, end in intervals:
+                infile.seek(start)
+                remaining = end - start
+                if fade > 0 and writer.total >= fade and remaining >= fade:
+                    head = infile.read(fade, dtype="float32", always_2d=True)
+                    writer.mix(head, fade_out, fade_in)
+                    remaining -= fade
+                while remaining > 0:
+                    block = infile.read(
+                        min(self.block_frames, remaining), dtype="float32", always_2d=True
+                    )
+                    if not len(block):
+                        break
+                    writer.write(block)
+                    remaining -= len(block)
+
+            writer.flush()
 
     def get_duration(self, audio_path: Path) -> float:
         """Get the duration of an audio file in seconds."""
-        data, samplerate = sf.read(str(audio_path))
-        return len(data) / samplerate
+        return get_duration(audio_path)
+
+
+def equal_power_fades(length: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return (fade_out, fade_in) gain curves of the given length."""
+    t = (np.arange(length, dtype=np.float32) + 0.5) / length * (np.pi / 2)
+    return np.cos(t)[:, None], np.sin(t)[:, None]
+
+
+def splice(data: np.ndarray, intervals: list[tuple[int, int]], fade: int) -> np.ndarray:
+    """Concatenate intervals of `data` with crossfades at each join.
+
+    Each join overlaps the last `fade` frames written with the first `fade`
+    frames of the next interval, like pydub's append(crossfade=...). A join
+    is hard-cut when either side is shorter than the fade.
+
+    Args:
+        data: Audio as a (frames, channels) array
+        intervals: Sorted (start_frame, end_frame) intervals to keep
+        fade: Crossfade length in frames (0 disables crossfades)
+
+    Returns:
+        The edited audio as a new (frames, channels) array
+    """
+    return splice_fragments([data[start:end] for start, end in intervals], fade, data.shape[1])
+
+
+def splice_fragments(fragments: list[np.ndarray], fade: int, channels: int | None = None) -> np.ndarray:
+    """Concatenate (frames, channels) arrays with crossfades at each join, like splice().
+
+    Args:
+        fragments: Audio of each kept interval, in order
+        fade: Crossfade length in frames (0 disables crossfades)
+        channels: Channel count, needed only when there are no fragments
+
+    Returns:
+        The edited audio as a new (frames, channels) array
+    """
+    # First pass: decide which joins get a crossfade to size the output
+    faded = []
+    total = 0
+    for chunk in fragments:
+        use_fade = fade > 0 and total >= fade and len(chunk) >= fade
+        faded.append(use_fade)
+        total += len(chunk) - (fade if use_fade else 0)
+
+    if fragments:
+        channels, dtype = fragments[0].shape[1], fragments[0].dtype
+    else:
+        channels, dtype = channels or 1, np.float32
+    output = np.empty((total, channels), dtype=dtype)
+    fade_out, fade_in = equal_power_fades(fade) if fade > 0 else (None, None)
+
+    pos = 0
+    for chunk, use_fade in zip(fragments, faded):
+        if use_fade:
+            pos -= fade
+            output[pos:pos + fade] = output[pos:pos + fade] * fade_out + chunk[:fade] * fade_in
+            output[pos + fade:pos + len(chunk)] = chunk[fade:]
+        else:
+            output[pos:pos + len(chunk)] = chunk
+        pos += len(chunk)
+
+    return output
+
+
+class _TailWriter:
+    """Writes audio to a SoundFile, holding back the last frames for a crossfade."""
+
+    def __init__(self, outfile: sf.SoundFile, hold: int, channels: int):
+        self.outfile = outfile
+        self.hold = hold
+        self.tail = np.zeros((0, channels), dtype=np.float32)
+        self.total = 0  # Frames written so far, including the held tail
+
+    def write(self, block: np.ndarray) -> None:
+        """Append frames, flushing everything but the last `hold` frames."""
+        self.total += len(block)
+        pending = np.concatenate([self.tail, block]) if len(self.tail) else block
+        split = max(0, len(pending) - self.hold)
+        if split:
+            self.outfile.write(pending[:split])
+        self.tail = pending[split:].copy()
+
+    def mix(self, head: np.ndarray, fade_out: np.ndarray, fade_in: np.ndarray) -> None:
+        """Crossfade the held tail into the first frames of the next interval."""
+        self.tail = self.tail * fade_out + head * fade_in
+
+    def flush(self) -> None:
+        """Write the held tail."""
+        if len(self.tail):
+            self.outfile.write(self.tail)
+        self.tail = self.tail[:0]
+
+
+def _read_at(infile: sf.SoundFile, start: int, count: int) -> np.ndarray:
+    infile.seek(start)
+    return infile.read(count, dtype="float32", always_2d=True)
+
+
+def _output_subtype(output_path: Path, subtype: str | None) -> str | None:
+    """Keep the input sample format when the output container supports it.
+
+    Only PCM and float formats carry over; a compressed input (MP3, Vorbis)
+    gets the output container's default instead of its codec.
+    """
+    fmt = output_path.suffix.lstrip(".").upper()
+    if not subtype or not subtype.startswith(("PCM_", "FLOAT", "DOUBLE")):
+        return None
+    if fmt in sf.available_formats() and sf.check_format(fmt, subtype):
+        return subtype
+    return None
@@ -0,0 +1,241 @@
+"""Stage-level timing and memory instrumentation.
+
+Code marks pipeline stages with ``stage()`` or ``timed()``; they cost
+almost nothing unless a ``Recorder`` is active. An active recorder keeps
+one record per stage with wall time, CPU time, peak RSS, audio seconds
+and real-time factor, and writes them as JSON/JSONL metrics or as
+OpenTelemetry-style spans.
+"""
+
+import contextvars
+import json
+import os
+import resource
+import sys
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+_recorder: contextvars.ContextVar["Recorder | None"] = contextvars.ContextVar("recorder", default=None)
+_parent: contextvars.ContextVar[str | None] = contextvars.ContextVar("parent_span", default=None)
+
+# ru_maxrss is in kilobytes on Linux and bytes on macOS
+_RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+def _cpu_seconds() -> float:
+    """CPU time of this process and its finished children (e.g. worker pools)."""
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+
+
+def _peak_rss() -> int:
+    """Peak resident set size of this process in bytes."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _RSS_UNIT
+
+
+class Span:
+    """An in-progress stage; attributes can be added until it ends."""
+
+    def __init__(self, name: str, parent: str | None, attributes: dict):
+        self.name = name
+        self.span_id = os.urandom(8).hex()
+        self.parent = parent
+        self.attributes = attributes
+        self.audio_seconds: float | None = attributes.pop("audio_seconds", None)
+        self.start_ns = time.time_ns()
+        self.wall = 0.0
+        self.cpu = 0.0
+
+    def set(self, **attributes) -> None:
+        """Add attributes; ``audio_seconds`` sets the audio processed."""
+        if "audio_seconds" in attributes:
+            self.audio_seconds = attributes.pop("audio_seconds")
+        self.attributes.update(attributes)
+
+
+class Recorder:
+    """Collects stage records for one run."""
+
+    def __init__(self):
+        self.trace_id = os.urandom(16).hex()
+        self.records: list[dict] = []
+        self._lock = threading.Lock()
+
+    def finish(self, span: Span, error: BaseException | None = None) -> None:
+        """Store the record of an ended span."""
+        record = {
+            "stage": span.name,
+            "trace_id": self.trace_id,
+            "span_id": span.span_id,
+            "parent_id": span.parent,
+            "start_ns": span.start_ns,
+            "end_ns": time.time_ns(),
+            "wall_seconds": round(span.wall, 6),
+            "cpu_seconds": round(span.cpu, 6),
+            "peak_rss_bytes": _peak_rss(),
+            "audio_seconds": span.audio_seconds,
+            "rtf": round(span.wall / span.audio_seconds, 6) if span.audio_seconds else None,
+            "status": "error" if error else "ok",
+            "attributes": span.attributes,
+        }
+        if error:
+            record["error"] = str(error)
+        with self._lock:
+            self.records.append(record)
+
+    def write(self, path: Path) -> None:
+        """Write records as JSONL (``.jsonl``) or as one JSON document."""
+        path = Path(path)
+        if path.suffix.lower() == ".jsonl":
+            with open(path, "a", encoding="utf-8") as f:
+                for record in self.records:
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"trace_id": self.trace_id, "stages": self.records}, f, ensure_ascii=False, indent=2)
+
+    def write_spans(self, path: Path) -> None:
+        """Append records as OpenTelemetry-style spans, one JSON object per line.
+
+        The layout follows OTLP/JSON span fields, so the file can be replayed
+        into a collector or read by tools that understand OTLP.
+        """
+        with open(path, "a", encoding="utf-8") as f:
+            for record in self.records:
+                span = {
+                    "traceId": record["trace_id"],
+                    "spanId": record["span_id"],
+                    "parentSpanId": record["parent_id"] or "",
+                    "name": record["stage"],
+                    "kind": 1,  # SPAN_KIND_INTERNAL
+                    "startTimeUnixNano": str(record["start_ns"]),
+                    "endTimeUnixNano": str(record["end_ns"]),
+                    "attributes": [
+                        {"key": key, "value": _otel_value(value)}
+                        for key, value in _span_attributes(record).items()
+                    ],
+                    "status": {"code": 2 if record["status"] == "error" else 1},
+                }
+                f.write(json.dumps(span, ensure_ascii=False) + "\n")
+
+
+def _span_attributes(record: dict) -> dict:
+    attributes = {
+        "stage.wall_seconds": record["wall_seconds"],
+        "stage.cpu_seconds": record["cpu_seconds"],
+        "process.peak_rss_bytes": record["peak_rss_bytes"],
+    }
+    if record["audio_seconds"] is not None:
+        attributes["audio.seconds"] = record["audio_seconds"]
+        attributes["audio.rtf"] = record["rtf"]
+    attributes.update(record["attributes"])
+    return {k: v for k, v in attributes.items() if v is not None}
+
+
+def _otel_value(value) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def active() -> bool:
+    """Check whether a recorder is collecting stages, to skip costly attributes."""
+    return _recorder.get() is not None
+
+
+@contextmanager
+def recording() -> Iterator[Recorder]:
+    """Activate a recorder for the code run inside the block."""
+    recorder = Recorder()
+    token = _recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _recorder.reset(token)
+
+
+@contextmanager
+def stage(name: str, **attributes) -> Iterator[Span | None]:
+    """Measure a pipeline stage.
+
+    Stages opened inside another become its children. Yields None when no
+    recorder is active.
+
+    Args:
+        name: Stage name, e.g. "asr", "render"
+        **attributes: Extra attributes; ``audio_seconds`` enables the RTF
+    """
+    recorder = _recorder.get()
+    if recorder is None:
+        yield None
+        return
+
+    span = Span(name, _parent.get(), attributes)
+    token = _parent.set(span.span_id)
+    wall, cpu = time.perf_counter(), _cpu_seconds()
+    error = None
+    try:
+        yield span
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        span.wall = time.perf_counter() - wall
+        span.cpu = _cpu_seconds() - cpu
+        _parent.reset(token)
+        recorder.finish(span, error)
+
+
+def timed(name: str, items: Iterable, **attributes) -> Iterator:
+    """Measure a stage that produces items lazily.
+
+    Only time spent producing items counts, not time the consumer spends
+    between them, so a streaming pipeline gets one record per stage.
+
+    Args:
+        name: Stage name
+        items: Iterable to wrap
+        **attributes: Extra attributes; ``audio_seconds`` enables the RTF
+
+    Yields:
+        The wrapped items
+    """
+    recorder = _recorder.get()
+    if recorder is None:
+        yield from items
+        return
+
+    span = Span(name, _parent.get(), attributes)
+    iterator = iter(items)
+    count = 0
+    error = None
+    try:
+        while True:
+            token = _parent.set(span.span_id)
+            wall, cpu = time.perf_counter(), _cpu_seconds()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                break
+            finally:
+                span.wall += time.perf_counter() - wall
+                span.cpu += _cpu_seconds() - cpu
+                _parent.reset(token)
+            count += 1
+            yield item
+    except GeneratorExit:
+        raise  # The consumer stopped early; not a failure
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        span.set(items=count)
+        recorder.finish(span, error)
@@ -0,0 +1,174 @@
+"""Multitrack editing: one cut list applied to several aligned stems.
+
+Stems are separate recordings of the same session, one per speaker, that
+start together and share a sample rate. Cuts are decided once, from each
+speaker's own transcript or from a mix, and every stem is rendered with
+the same sample-accurate keep-list so the edited stems stay aligned.
+"""
+
+import contextlib
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+from . import metrics
+from .analyzer import Analyzer
+from .audio import AudioSource, open_reader
+from .editor import Editor
+from .models import EditDecision
+from .transcript import Transcript
+
+
+def union_decisions(transcripts: list[Transcript], analyzer: Analyzer) -> list[EditDecision]:
+    """Analyze each speaker's transcript and merge the cuts that are safe for every stem.
+
+    Fillers and repetitions are found per speaker, so one host repeating
+    another is not a repetition. A cut that overlaps a word another speaker
+    keeps is dropped, since the cut applies to all stems and would clip
+    that word.
+
+    Args:
+        transcripts: One transcript per stem
+        analyzer: Analyzer used for every transcript
+
+    Returns:
+        Decisions from all stems, sorted by start time
+    """
+    per_stem = [analyzer.analyze(transcript) for transcript in transcripts]
+
+    # Start and end of the words each stem keeps; words in a stem do not overlap
+    speech = []
+    for transcript, decisions in zip(transcripts, per_stem):
+        kept = np.ones(len(transcript), dtype=bool)
+        for d in decisions:
+            kept[np.searchsorted(transcript.end, d.start, "right"):np.searchsorted(transcript.start, d.end)] = False
+        speech.append((transcript.start[kept], transcript.end[kept]))
+
+    merged = []
+    for i, decisions in enumerate(per_stem):
+        for d in decisions:
+            clashes = False
+            for j, (starts, ends) in enumerate(speech):
+                first = np.searchsorted(ends, d.start, "right")
+                if j != i and first < len(starts) and starts[first] < d.end:
+                    clashes = True
+                    break
+            if not clashes:
+                merged.append(d)
+
+    merged.sort(key=lambda d: d.start)
+    return merged
+
+
+def write_mixdown(stems: list["Path | AudioSource"], path: Path, block_frames: int = 1 << 18) -> None:
+    """Write the average of all stems and channels as one mono file.
+
+    The mix is as long as the shortest stem.
+
+    Args:
+        stems: Aligned stems with the same sample rate
+        path: Output file
+        block_frames: Frames mixed at a time
+    """
+    with contextlib.ExitStack() as stack:
+        files = [stack.enter_context(open_reader(stem)) for stem in stems]
+        samplerate, n_frames = _check_aligned(stems, files)
+        channels = sum(f.channels for f in files)
+        with sf.SoundFile(str(path), "w", samplerate=samplerate, channels=1, subtype="FLOAT") as out:
+            for start in range(0, n_frames, block_frames):
+                count = min(block_frames, n_frames - start)
+                mix = sum(f.read(count, dtype="float32", always_2d=True).sum(axis=1) for f in files)
+                out.write(mix / channels)
+
+
+class MultitrackEditor:
+    """Renders one keep-list to every stem concurrently."""
+
+    def __init__(self, editor: Editor | None = None, workers: int | None = None):
+        """Initialize the editor.
+
+        Args:
+            editor: Plans the keep-list and renders each stem (crossfade, planner)
+            workers: Stems rendered at the same time (default: all of them)
+        """
+        self.editor = editor or Editor()
+        self.workers = workers
+
+    def keep_frames(
+        self, stems: list["Path | AudioSource"], decisions: list[EditDecision]
+    ) -> list[tuple[int, int]]:
+        """Plan the keep-list shared by all stems.
+
+        Splice points are snapped to zero crossings of the mix of all stems,
+        so every stem is cut at exactly the same frames.
+
+        Args:
+            stems: Aligned stems with the same sample rate
+            decisions: Segments to remove
+
+        Returns:
+            Sorted (start_frame, end_frame) intervals, within the shortest stem
+        """
+        with contextlib.ExitStack() as stack:
+            files = [stack.enter_context(open_reader(stem)) for stem in stems]
+            samplerate, n_frames = _check_aligned(stems, files)
+
+            def read(start: int, count: int) -> np.ndarray:
+                blocks = []
+                for f in files:
+                    f.seek(start)
+                    blocks.append(f.read(count, dtype="float32", always_2d=True))
+                return np.concatenate(blocks, axis=1)
+
+            return self.editor.planner.keep_frames(decisions, n_frames, samplerate, read=read)
+
+    def edit(
+        self,
+        stems: list["Path | AudioSource"],
+        outputs: list[Path],
+        decisions: list[EditDecision],
+    ) -> list[tuple[int, int]]:
+        """Remove the same segments from every stem.
+
+        Each stem is streamed block by block on its own thread, so memory
+        stays bounded and wall time grows with the longest stem rather than
+        the number of stems.
+
+        Args:
+            stems: Aligned stems with the same sample rate
+            outputs: Output file for each stem
+            decisions: Segments to remove
+
+        Returns:
+            The keep-list applied to every stem
+        """
+        if len(outputs) != len(stems):
+            raise ValueError(f"Got {len(stems)} stems but {len(outputs)} outputs")
+
+        intervals = self.keep_frames(stems, decisions)
+        with (
+            metrics.stage("multitrack", stems=len(stems), intervals=len(intervals)),
+            ThreadPoolExecutor(max_workers=self.workers or len(stems)) as pool,
+        ):
+            # Copy the context so each stem's render stage attaches to this one
+            futures = [
+                pool.submit(contextvars.copy_context().run, self.editor.render, stem, output, intervals)
+                for stem, output in zip(stems, outputs)
+            ]
+            for future in futures:
+                future.result()
+        return intervals
+
+
+def _check_aligned(stems: list, files: list) -> tuple[int, int]:
+    """Return the shared sample rate and the shortest length, in frames."""
+    if not files:
+        raise ValueError("No stems given")
+    rates = {f.samplerate for f in files}
+    if len(rates) > 1:
+        found = ", ".join(f"{stem}: {f.samplerate} Hz" for stem, f in zip(stems, files))
+        raise ValueError(f"Stems must share one sample rate ({found})")
+    return rates.pop(), min(f.frames for f in files)
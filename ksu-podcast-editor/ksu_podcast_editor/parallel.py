@@ -0,0 +1,187 @@
+"""Parallel transcription of long recordings split at silences."""
+
+import logging
+import os
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+from faster_whisper import WhisperModel, decode_audio
+from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+from . import metrics
+from .models import Segment
+from .transcriber import convert_segment
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+
+
+class Chunk(NamedTuple):
+    """A window of audio sent to one worker.
+
+    Words are transcribed over [start, end) but only those whose midpoint
+    falls in [keep_start, keep_end) are kept, so overlaps are not duplicated.
+    """
+
+    start: float
+    end: float
+    keep_start: float
+    keep_end: float
+
+
+def plan_chunks(
+    speech: list[tuple[float, float]],
+    duration: float,
+    target_s: float = 300.0,
+    overlap_s: float = 2.0,
+) -> list[Chunk]:
+    """Split a recording into overlapping chunks, cutting inside silences.
+
+    Args:
+        speech: Sorted (start, end) speech regions in seconds, e.g. from VAD
+        duration: Total duration in seconds
+        target_s: Preferred chunk length; a chunk ends at the first silence after it
+        overlap_s: Audio added on each side of a chunk so words at a cut survive
+
+    Returns:
+        Chunks covering the whole recording in order
+    """
+    gaps = [
+        (prev_end + next_start) / 2
+        for (_, prev_end), (next_start, _) in zip(speech, speech[1:])
+        if next_start > prev_end
+    ]
+
+    cuts = [0.0]
+    for point in gaps + [duration]:
+        # No silence for too long: cut anyway and rely on the overlap
+        while point - cuts[-1] > 2 * target_s:
+            cuts.append(cuts[-1] + target_s)
+        if point - cuts[-1] >= target_s and point < duration:
+            cuts.append(point)
+    cuts.append(duration)
+
+    return [
+        Chunk(
+            start=max(0.0, keep_start - overlap_s),
+            end=min(duration, keep_end + overlap_s),
+            keep_start=keep_start,
+            keep_end=keep_end,
+        )
+        for keep_start, keep_end in zip(cuts, cuts[1:])
+        if keep_end > keep_start
+    ]
+
+
+def stitch(chunk: Chunk, segments: list[Segment]) -> list[Segment]:
+    """Drop words that belong to a neighbouring chunk's keep range."""
+    result = []
+    for segment in segments:
+        words = [
+            w for w in segment.words
+            if chunk.keep_start <= (w.start + w.end) / 2 < chunk.keep_end
+        ]
+        if not words:
+            continue
+        if len(words) == len(segment.words):
+            result.append(segment)
+        else:
+            result.append(
+                Segment(
+                    start=words[0].start,
+                    end=words[-1].end,
+                    words=words,
+                    text=" ".join(w.text for w in words),
+                )
+            )
+    return result
+
+
+def transcribe_parallel(
+    audio_path: str | np.ndarray,
+    model_size: str,
+    workers: int,
+    language: str | None = None,
+    device: str = "cpu",
+    compute_type: str = "auto",
+    options: dict | None = None,
+    target_s: float = 300.0,
+    overlap_s: float = 2.0,
+) -> Iterator[Segment]:
+    """Transcribe an audio file in chunks across a process pool.
+
+    Each worker loads its own model with the CPU threads divided between
+    workers. Segments are yielded in order as chunks complete.
+
+    Args:
+        audio_path: Path to the audio file, or 16 kHz mono samples already decoded
+        model_size: Whisper model size
+        workers: Number of worker processes
+        language: Language code or None for auto-detect (per chunk)
+        device: Device for the worker models
+        compute_type: Compute type for the worker models
+        options: Extra keyword arguments for WhisperModel.transcribe
+        target_s: Preferred chunk length in seconds
+        overlap_s: Overlap between neighbouring chunks in seconds
+
+    Yields:
+        Segments with word-level timestamps
+    """
+    if isinstance(audio_path, np.ndarray):
+        audio = audio_path
+    else:
+        with metrics.stage("decode") as span:
+            audio = decode_audio(audio_path, sampling_rate=SAMPLE_RATE)
+            if span:
+                span.set(audio_seconds=len(audio) / SAMPLE_RATE)
+    duration = len(audio) / SAMPLE_RATE
+
+    with metrics.stage("vad", audio_seconds=duration):
+        speech = [
+            (ts["start"] / SAMPLE_RATE, ts["end"] / SAMPLE_RATE)
+            for ts in get_speech_timestamps(audio, VadOptions(min_silence_duration_ms=500))
+        ]
+    chunks = plan_chunks(speech, duration, target_s=target_s, overlap_s=overlap_s)
+    cpu_threads = max(1, (os.cpu_count() or 1) // workers)
+    logger.info(f"Transcribing {len(chunks)} chunks with {workers} workers x {cpu_threads} threads")
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(model_size, device, compute_type, cpu_threads),
+    ) as pool:
+        futures = [
+            pool.submit(
+                _transcribe_chunk,
+                # A plain copy, so a memory-mapped buffer pickles as samples
+                np.array(audio[int(chunk.start * SAMPLE_RATE):int(chunk.end * SAMPLE_RATE)]),
+                chunk.start,
+                language,
+                options or {},
+            )
+            for chunk in chunks
+        ]
+        del audio
+        for chunk, future in zip(chunks, futures):
+            yield from stitch(chunk, future.result())
+
+
+# Model owned by each worker process
+_worker_model: WhisperModel | None = None
+
+
+def _init_worker(model_size: str, device: str, compute_type: str, cpu_threads: int) -> None:
+    global _worker_model
+    _worker_model = WhisperModel(
+        model_size, device=device, compute_type=compute_type, cpu_threads=cpu_threads
+    )
+
+
+def _transcribe_chunk(
+    audio: np.ndarray, offset: float, language: str | None, options: dict
+) -> list[Segment]:
+    segments, _ = _worker_model.transcribe(audio, language=language, **options)
+    return [convert_segment(segment, offset=offset) for segment in segments]
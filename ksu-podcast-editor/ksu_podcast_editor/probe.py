@@ -0,0 +1,174 @@
+"""Audio metadata probing from file headers."""
+
+import struct
+from pathlib import Path
+
+import soundfile as sf
+
+# (path, mtime_ns, size) -> duration in seconds
+_duration_cache: dict[tuple[str, int, int], float] = {}
+
+# Bitrates in kbps, indexed by the 4-bit bitrate index
+_MPEG1_BITRATES = {
+    1: [0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448],
+    2: [0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384],
+    3: [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+}
+_MPEG2_BITRATES = {
+    1: [0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256],
+    2: [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+    3: [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+# Sample rates by version bits (3 = MPEG1, 2 = MPEG2, 0 = MPEG2.5)
+_SAMPLE_RATES = {3: [44100, 48000, 32000], 2: [22050, 24000, 16000], 0: [11025, 12000, 8000]}
+
+
+def get_duration(audio_path: Path) -> float:
+    """Get the duration of an audio file in seconds without decoding it.
+
+    WAV, FLAC and other libsndfile formats are read from their headers; MP3
+    durations come from the Xing/VBRI header or a scan of frame headers.
+    Results are cached per (path, mtime, size).
+
+    Args:
+        audio_path: Path to the audio file
+
+    Returns:
+        Duration in seconds
+    """
+    path = Path(audio_path).resolve()
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+
+    duration = _duration_cache.get(key)
+    if duration is None:
+        if path.suffix.lower() == ".mp3":
+            duration = _mp3_duration(path)
+        else:
+            duration = sf.info(str(path)).duration
+        _duration_cache[key] = duration
+    return duration
+
+
+def _mp3_duration(path: Path) -> float:
+    """Compute MP3 duration from frame headers."""
+    with open(path, "rb") as f:
+        data_start = _skip_id3v2(f)
+        f.seek(data_start)
+        first = _find_frame(f)
+        if first is None:
+            raise ValueError(f"No MPEG audio frames found in {path}")
+
+        pos, header = first
+        samples, samplerate, length = header
+        f.seek(pos)
+        frame = f.read(length)
+
+        vbr_samples = _vbr_sample_count(frame, samples)
+        if vbr_samples is not None:
+            return vbr_samples / samplerate
+
+        # No VBR header: walk every frame header
+        total_samples = 0
+        while True:
+            f.seek(pos)
+            parsed = _parse_header(f.read(4))
+            if parsed is None:
+                break
+            total_samples += parsed[0]
+            pos += parsed[2]
+        return total_samples / samplerate
+
+
+def _skip_id3v2(f) -> int:
+    """Return the offset of the first byte after an ID3v2 tag, if any."""
+    f.seek(0)
+    header = f.read(10)
+    if len(header) == 10 and header[:3] == b"ID3":
+        size = 0
+        for byte in header[6:10]:
+            size = (size << 7) | (byte & 0x7F)
+        footer = 10 if header[5] & 0x10 else 0
+        return 10 + size + footer
+    return 0
+
+
+def _find_frame(f, limit: int = 65536) -> tuple[int, tuple[int, int, int]] | None:
+    """Find the first valid frame header within `limit` bytes of the position."""
+    start = f.tell()
+    buf = f.read(limit)
+    for i in range(len(buf) - 3):
+        if buf[i] == 0xFF and buf[i + 1] & 0xE0 == 0xE0:
+            parsed = _parse_header(buf[i:i + 4])
+            if parsed is not None:
+                return start + i, parsed
+    return None
+
+
+def _parse_header(data: bytes) -> tuple[int, int, int] | None:
+    """Parse a 4-byte MPEG audio frame header.
+
+    Returns:
+        (samples per frame, sample rate, frame length in bytes) or None
+    """
+    if len(data) < 4:
+        return None
+    (value,) = struct.unpack(">I", data)
+    if value >> 21 != 0x7FF:
+        return None
+
+    version = (value >> 19) & 0x3
+    layer_bits = (value >> 17) & 0x3
+    bitrate_index = (value >> 12) & 0xF
+    rate_index = (value >> 10) & 0x3
+    padding = (value >> 9) & 0x1
+    if version == 1 or layer_bits == 0 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+
+    layer = 4 - layer_bits
+    mpeg1 = version == 3
+    bitrate = (_MPEG1_BITRATES if mpeg1 else _MPEG2_BITRATES)[layer][bitrate_index] * 1000
+    samplerate = _SAMPLE_RATES[version][rate_index]
+
+    if layer == 1:
+        return 384, samplerate, (12 * bitrate // samplerate + padding) * 4
+    if layer == 2 or mpeg1:
+        return 1152, samplerate, 144 * bitrate // samplerate + padding
+    return 576, samplerate, 72 * bitrate // samplerate + padding
+
+
+def _vbr_sample_count(frame: bytes, samples_per_frame: int) -> int | None:
+    """Read the sample count from a Xing/Info or VBRI header in the first frame.
+
+    When a LAME tag follows the Xing header, encoder delay and padding are
+    subtracted so the result matches what a gapless decoder returns.
+    """
+    version = (frame[1] >> 3) & 0x3
+    mono = (frame[3] >> 6) == 0x3
+    if version == 3:
+        side_info = 17 if mono else 32
+    else:
+        side_info = 9 if mono else 17
+
+    offset = 4 + side_info
+    tag = frame[offset:offset + 4]
+    if tag in (b"Xing", b"Info") and len(frame) >= offset + 12:
+        (flags,) = struct.unpack(">I", frame[offset + 4:offset + 8])
+        if not flags & 0x1:
+            return None
+        frames = struct.unpack(">I", frame[offset + 8:offset + 12])[0]
+        total = frames * samples_per_frame
+
+        # Frames, bytes, TOC and quality fields are present per flag bit
+        lame = offset + 8 + sum(size for bit, size in ((1, 4), (2, 4), (4, 100), (8, 4)) if flags & bit)
+        if frame[lame:lame + 4] == b"LAME" and len(frame) >= lame + 24:
+            gapless = frame[lame + 21:lame + 24]
+            delay = (gapless[0] << 4) | (gapless[1] >> 4)
+            padding = ((gapless[1] & 0xF) << 8) | gapless[2]
+            total = max(0, total - delay - padding)
+        return total
+
+    if frame[36:40] == b"VBRI" and len(frame) >= 36 + 18:
+        return struct.unpack(">I", frame[36 + 14:36 + 18])[0] * samples_per_frame
+
+    return None
@@ -0,0 +1,142 @@
+"""Named faster-whisper runtime settings (transcription profiles)."""
+
+import os
+import tomllib
+from pathlib import Path
+
+from pydantic import BaseModel, ConfigDict
+
+
+class TranscriptionProfile(BaseModel):
+    """Model loading and decoding settings for faster-whisper.
+
+    Fields left as None keep faster-whisper's own defaults.
+    """
+
+    model_config = ConfigDict(extra="forbid")  # Catch typos in config files
+
+    name: str = "default"
+    compute_type: str = "auto"
+    cpu_threads: int | None = None
+    num_workers: int | None = None
+    beam_size: int | None = None
+    vad_filter: bool | None = None
+    vad_parameters: dict | None = None
+    condition_on_previous_text: bool | None = None
+
+    def model_options(self) -> dict:
+        """Keyword arguments for WhisperModel()."""
+        options = {"compute_type": self.compute_type}
+        if self.cpu_threads is not None:
+            options["cpu_threads"] = self.cpu_threads
+        if self.num_workers is not None:
+            options["num_workers"] = self.num_workers
+        return options
+
+    def transcribe_options(self) -> dict:
+        """Keyword arguments for WhisperModel.transcribe() that change the transcript."""
+        options = {}
+        for field in ("beam_size", "vad_filter", "vad_parameters", "condition_on_previous_text"):
+            value = getattr(self, field)
+            if value is not None:
+                options[field] = value
+        return options
+
+
+PROFILES = {
+    "default": TranscriptionProfile(),
+    # Quantized greedy decoding; VAD skips silence, and not conditioning on
+    # previous text avoids repetition loops on long files
+    "fast-cpu": TranscriptionProfile(
+        name="fast-cpu",
+        compute_type="int8",
+        beam_size=1,
+        vad_filter=True,
+        vad_parameters={"min_silence_duration_ms": 500},
+        condition_on_previous_text=False,
+    ),
+    "accurate": TranscriptionProfile(
+        name="accurate",
+        compute_type="float32",
+        beam_size=5,
+        vad_filter=False,
+        condition_on_previous_text=True,
+    ),
+    # Several files in flight on one model: more workers, fewer threads each
+    "batch-throughput": TranscriptionProfile(
+        name="batch-throughput",
+        compute_type="int8",
+        cpu_threads=2,
+        num_workers=4,
+        beam_size=2,
+        vad_filter=True,
+        vad_parameters={"min_silence_duration_ms": 500},
+        condition_on_previous_text=False,
+    ),
+}
+
+
+def default_config_path() -> Path:
+    """Return the profile config file path, honouring XDG_CONFIG_HOME."""
+    base = os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config"
+    return Path(base) / "ksu-podcast-editor" / "profiles.toml"
+
+
+def _read_config(config_path: Path | None) -> dict:
+    """Read the config file; a missing default config is empty, a missing explicit one an error."""
+    path = Path(config_path) if config_path else default_config_path()
+    if not path.exists():
+        if config_path:
+            raise FileNotFoundError(f"Profile config not found: {path}")
+        return {}
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+def load_profiles(config_path: Path | None = None) -> dict[str, TranscriptionProfile]:
+    """Return the built-in profiles plus those defined in the config file.
+
+    The config file has one table per profile; ``base`` names a profile to
+    start from, and any other key overrides that field. A top-level
+    ``profile`` key selects the profile used when none is given::
+
+        profile = "overnight"
+
+        [profiles.overnight]
+        base = "fast-cpu"
+        cpu_threads = 16
+
+    Args:
+        config_path: TOML file to read, defaults to default_config_path()
+
+    Returns:
+        Profiles by name
+    """
+    return _profiles_from(_read_config(config_path))
+
+
+def get_profile(name: str | None = None, config_path: Path | None = None) -> TranscriptionProfile:
+    """Look up a profile by name, or the one the config file selects.
+
+    Raises:
+        ValueError: If no built-in or configured profile has that name
+    """
+    config = _read_config(config_path)
+    profiles = _profiles_from(config)
+    name = name or config.get("profile", "default")
+    if name not in profiles:
+        raise ValueError(f"Unknown profile {name!r}; available: {', '.join(profiles)}")
+    return profiles[name]
+
+
+def _profiles_from(config: dict) -> dict[str, TranscriptionProfile]:
+    profiles = dict(PROFILES)
+    for name, fields in config.get("profiles", {}).items():
+        fields = dict(fields)
+        base = fields.pop("base", "default")
+        if base not in profiles:
+            raise ValueError(f"Profile {name!r} is based on unknown profile {base!r}")
+        profiles[name] = TranscriptionProfile.model_validate(
+            {**profiles[base].model_dump(), **fields, "name": name}
+        )
+    return profiles
@@ -0,0 +1,166 @@
+"""Vectorized detection of repeated words, phrases and stutters."""
+
+from typing import NamedTuple
+
+import numpy as np
+
+
+class Repetition(NamedTuple):
+    """Consecutive copies of the same words, of which one is kept.
+
+    ``copies`` are word indices where each copy starts; every copy is
+    ``length`` words long. For stutters the copies are the broken-off
+    fragments followed by the completed word, which is always kept.
+    """
+
+    copies: tuple[int, ...]
+    length: int
+    keep: int  # Index into copies
+    kind: str  # "repeat" or "stutter"
+
+    @property
+    def dropped(self) -> list[int]:
+        """Start indices of the copies to cut."""
+        return [c for i, c in enumerate(self.copies) if i != self.keep]
+
+
+class RepetitionDetector:
+    """Finds repeats over interned token ids in a few array passes.
+
+    Every pass compares the id array with itself shifted by n, so the
+    cost is linear in the number of words for a fixed ``max_ngram``.
+    """
+
+    def __init__(
+        self,
+        max_ngram: int = 3,
+        max_gap: float = 1.0,
+        stutter_gap: float = 0.25,
+        min_fragment: int = 2,
+    ):
+        """Initialize the detector.
+
+        Args:
+            max_ngram: Longest repeated phrase to look for, in words
+            max_gap: A repeat after a longer pause is taken as deliberate
+                (emphasis or restatement) and kept
+            stutter_gap: Longest pause between a fragment and the word it starts
+            min_fragment: Shortest fragment, in letters, counted as a stutter
+                unless it is written with a trailing hyphen ("пре-")
+        """
+        self.max_ngram = max_ngram
+        self.max_gap = max_gap
+        self.stutter_gap = stutter_gap
+        self.min_fragment = min_fragment
+
+    def find(
+        self,
+        token_ids: np.ndarray,
+        tokens: list[str],
+        start: np.ndarray,
+        end: np.ndarray,
+        confidence: np.ndarray,
+        skip: np.ndarray | None = None,
+    ) -> list[Repetition]:
+        """Find repeats and stutters, longest phrases first.
+
+        Args:
+            token_ids: Normalized token id per word
+            tokens: Token strings indexed by id
+            start: Word start times in seconds
+            end: Word end times in seconds
+            confidence: Word confidences, used to pick the copy to keep
+            skip: Words already cut for another reason; they are never dropped
+                as a repeat, but a repeat of them right after is
+
+        Returns:
+            Repetitions sorted by their first copy
+        """
+        n_words = len(token_ids)
+        skip = np.zeros(n_words, dtype=bool) if skip is None else skip
+        taken = skip.copy()
+        if n_words < 2:
+            return []
+
+        token_len = np.fromiter((len(t) for t in tokens), dtype=np.int32, count=len(tokens))
+        gaps = start[1:] - end[:-1]  # gaps[i]: pause before word i + 1
+        conf_sum = np.concatenate(([0.0], np.cumsum(confidence, dtype=np.float64)))
+        same_next = np.concatenate(([0], np.cumsum(token_ids[1:] == token_ids[:-1])))
+
+        found = []
+        for n in range(min(self.max_ngram, n_words // 2), 0, -1):
+            # Word j + n repeats word j; a copy at j repeats when n of these line up
+            equal = np.concatenate(([0], np.cumsum(token_ids[n:] == token_ids[:-n])))
+            j = np.arange(n_words - 2 * n + 1)
+            mask = (equal[j + n] - equal[j] == n) & (gaps[j + n - 1] <= self.max_gap)
+            if n == 1:
+                mask &= token_len[token_ids[j]] > 1
+            else:
+                # "да да да да" is a chain of single-word repeats, not a repeated pair
+                mask &= same_next[j + n - 1] - same_next[j] < n - 1
+
+            chains: list[list[int]] = []
+            for j in np.flatnonzero(mask).tolist():
+                if chains and chains[-1][-1] == j:
+                    if not taken[j + n:j + 2 * n].any():
+                        chains[-1].append(j + n)
+                        taken[j + n:j + 2 * n] = True
+                    continue
+                first = taken[j:j + n]
+                if taken[j + n:j + 2 * n].any() or (first.any() and not skip[j:j + n].all()):
+                    continue
+                chains.append([j, j + n])
+                taken[j:j + 2 * n] = True
+
+            for copies in chains:
+                if skip[copies[0]]:
+                    # The first copy is cut anyway (e.g. "в общем общем"), so drop the rest
+                    keep = 0
+                else:
+                    # Keep the copy recognised most confidently, the first one on ties
+                    scores = [conf_sum[c + n] - conf_sum[c] for c in copies]
+                    keep = scores.index(max(scores))
+                found.append(Repetition(tuple(copies), n, keep, "repeat"))
+
+        found.extend(self._find_stutters(token_ids, tokens, gaps, taken))
+        found.sort(key=lambda r: r.copies[0])
+        return found
+
+    def _find_stutters(
+        self, token_ids: np.ndarray, tokens: list[str], gaps: np.ndarray, taken: np.ndarray
+    ) -> list[Repetition]:
+        """Find fragments like "пре- предлагаю" cut off and restarted without a pause."""
+        first_letter = np.fromiter((ord(t[0]) if t else -1 for t in tokens), dtype=np.int32, count=len(tokens))
+        a, b = token_ids[:-1], token_ids[1:]
+        candidates = np.flatnonzero(
+            (first_letter[a] == first_letter[b])
+            & (a != b)
+            & (gaps <= self.stutter_gap)
+            & ~taken[:-1]
+            & ~taken[1:]
+        )
+
+        is_fragment: dict[tuple[int, int], bool] = {}
+        fragments = []
+        for i in candidates.tolist():
+            pair = (int(a[i]), int(b[i]))
+            if pair not in is_fragment:
+                fragment, word = tokens[pair[0]], tokens[pair[1]]
+                stem = fragment.rstrip("-")
+                is_fragment[pair] = (
+                    0 < len(stem) < len(word)
+                    and word.startswith(stem)
+                    and (stem != fragment or len(stem) >= self.min_fragment)
+                )
+            if is_fragment[pair]:
+                fragments.append(i)
+
+        # Consecutive fragments ("п- пре- предлагаю") form one stutter
+        found: list[Repetition] = []
+        for i in fragments:
+            if found and found[-1].copies[-1] == i:
+                copies = found[-1].copies + (i + 1,)
+                found[-1] = Repetition(copies, 1, len(copies) - 1, "stutter")
+            else:
+                found.append(Repetition((i, i + 1), 1, 1, "stutter"))
+        return found
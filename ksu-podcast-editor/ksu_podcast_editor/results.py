@@ -0,0 +1,302 @@
+"""Writing transcription and analysis results to files.
+
+Words are written a block at a time from the transcript's columns, so
+memory use beyond the transcript itself stays flat however long the file is.
+"""
+
+import csv
+import json
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON, the standard library is used without it
+    orjson = None
+
+from . import metrics
+from .transcript import Transcript
+
+# Words written at a time
+_BLOCK = 4096
+
+_WORD_FIELDS = ("text", "start", "end", "confidence", "label")
+
+
+def _dumps(obj) -> str:
+    """Compact JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def _ms(values) -> list[float]:
+    """Values rounded to milliseconds, as Python floats."""
+    return np.round(np.asarray(values, dtype=np.float64), 3).tolist()
+
+
+def _rows(texts: list[str], start, end, confidence, labels: list[str]) -> list[tuple]:
+    """(text, start, end, confidence, label) rows with rounded numbers."""
+    return list(zip(texts, _ms(start), _ms(end), _ms(confidence), labels))
+
+
+def _write_rows(f, kind: str, rows: list[tuple]) -> None:
+    """Write word rows as CSV, JSON lines or text lines."""
+    if kind == "csv":
+        csv.writer(f).writerows(rows)
+    elif kind == "jsonl":
+        f.write("".join(_dumps(dict(zip(_WORD_FIELDS, row))) + "\n" for row in rows))
+    else:
+        f.write("".join(
+            f"{start:.3f} - {end:.3f}: {text}{'' if label == 'keep' else f' [{label}]'}\n"
+            for text, start, end, _, label in rows
+        ))
+
+
+def _write_array(f, blocks) -> None:
+    """Write a JSON array, one element per line, from blocks of encoded elements."""
+    f.write("[")
+    separator = "\n"
+    for block in blocks:
+        if block:
+            f.write(separator + ",\n".join(block))
+            separator = ",\n"
+    f.write("\n]")
+
+
+def assign_labels(start: np.ndarray, end: np.ndarray, decisions: list) -> np.ndarray:
+    """Find the decision covering each word.
+
+    A word is covered when its midpoint lies inside a decision, so every
+    word of a phrase or repeated n-gram gets the label, not just an exact
+    match. Decisions are swept in start order keeping the furthest end
+    seen so far; where several cover a word, the one reaching furthest wins.
+
+    Args:
+        start: Word start times in seconds, in time order
+        end: Word end times in seconds
+        decisions: Edit decisions in any order
+
+    Returns:
+        Index into ``decisions`` for every word, -1 where none covers it
+    """
+    labels = np.full(len(start), -1, dtype=np.int64)
+    if not decisions or not len(start):
+        return labels
+
+    order = np.argsort(np.array([d.start for d in decisions]), kind="stable")
+    cut_start = np.array([decisions[i].start for i in order])
+    cut_end = np.array([decisions[i].end for i in order])
+    reach = np.maximum.accumulate(cut_end)
+    # Index of the cut reaching furthest among those starting up to each one
+    furthest = np.maximum.accumulate(np.where(cut_end == reach, np.arange(len(order)), 0))
+
+    middle = (np.asarray(start) + np.asarray(end)) / 2
+    last = np.searchsorted(cut_start, middle, "right") - 1
+    covered = (last >= 0) & (reach[np.maximum(last, 0)] >= middle)
+    labels[covered] = order[furthest[last[covered]]]
+    return labels
+
+
+def _label_ids(transcript: Transcript, decisions: list) -> tuple[np.ndarray, list[str]]:
+    """Label of every word as an index into the distinct reasons, "keep" first."""
+    labels = ["keep"]
+    index = {"keep": 0}
+    of_decision = np.array([index.setdefault(d.reason, len(index)) for d in decisions] + [0], dtype=np.int64)
+    labels.extend(list(index)[1:])
+    # -1 (no decision) picks the trailing 0
+    return of_decision[assign_labels(transcript.start, transcript.end, decisions)], labels
+
+
+def _word_blocks(transcript: Transcript, label_ids: np.ndarray, labels: list[str]) -> Iterator[list[tuple]]:
+    """Yield the transcript's labelled word rows, _BLOCK words at a time."""
+    for i in range(0, len(transcript), _BLOCK):
+        block = slice(i, i + _BLOCK)
+        yield _rows(
+            [transcript.texts[t] for t in transcript.text_ids[block].tolist()],
+            transcript.start[block],
+            transcript.end[block],
+            transcript.confidence[block],
+            [labels[j] for j in label_ids[block].tolist()],
+        )
+
+
+def _decision_record(decision) -> dict:
+    return {
+        "text": decision.original_text,
+        "start": round(decision.start, 3),
+        "end": round(decision.end, 3),
+        "reason": decision.reason,
+    }
+
+
+def _segment_blocks(transcript: Transcript, chunk: int = 256) -> Iterator[list[str]]:
+    """Yield encoded segments with their words, ``chunk`` segments at a time."""
+    offsets = transcript.segment_offsets.tolist()
+    for first in range(0, transcript.n_segments, chunk):
+        last = min(first + chunk, transcript.n_segments)
+        base = offsets[first]
+        words = slice(base, offsets[last])
+        records = [
+            {"text": text, "start": start, "end": end, "confidence": confidence}
+            for text, start, end, confidence in zip(
+                [transcript.texts[t] for t in transcript.text_ids[words].tolist()],
+                _ms(transcript.start[words]),
+                _ms(transcript.end[words]),
+                _ms(transcript.confidence[words]),
+            )
+        ]
+        starts, ends = _ms(transcript.segment_start[first:last]), _ms(transcript.segment_end[first:last])
+        yield [
+            _dumps({
+                "text": transcript.segment_text[i],
+                "start": starts[i - first],
+                "end": ends[i - first],
+                "words": records[offsets[i] - base:offsets[i + 1] - base],
+            })
+            for i in range(first, last)
+        ]
+
+
+def _write_json(f, transcript: Transcript, decisions: list, transcription: dict | None) -> None:
+    """Write the JSON document: segments with their words, labelled words, cuts and a summary."""
+    label_ids, labels = _label_ids(transcript, decisions)
+    f.write('{"segments": ')
+    _write_array(f, _segment_blocks(transcript))
+    f.write(',\n"words": ')
+    _write_array(f, (
+        [_dumps(dict(zip(_WORD_FIELDS, row))) for row in rows]
+        for rows in _word_blocks(transcript, label_ids, labels)
+    ))
+    f.write(',\n"fillers": ')
+    _write_array(f, [[_dumps(_decision_record(d)) for d in decisions]])
+    summary = {
+        "total_segments": transcript.n_segments,
+        "total_words": len(transcript),
+        "fillers_count": len(decisions),
+    }
+    f.write(',\n"summary": ' + _dumps(summary))
+    if transcription is not None:
+        f.write(',\n"transcription": ' + _dumps(transcription))
+    f.write("\n}\n")
+
+
+def _write_header(f, kind: str) -> None:
+    if kind == "csv":
+        csv.writer(f).writerow(_WORD_FIELDS)
+    elif kind == "text":
+        f.write("# Transcription Results\n\n## Words with timestamps\n\n")
+
+
+def _write_footer(f, kind: str, word_count: int, decision_count: int) -> None:
+    if kind == "text":
+        f.write(f"\n## Summary\nTotal words: {word_count}\nFillers to remove: {decision_count}\n")
+
+
+def _kind(output_path: Path) -> str:
+    """Output format from the file extension; plain text by default."""
+    return {".json": "json", ".jsonl": "jsonl", ".csv": "csv"}.get(output_path.suffix.lower(), "text")
+
+
+def save_results(
+    segments,
+    decisions: list,
+    output_path: Path,
+    verbose: bool = False,
+    transcription: dict | None = None,
+) -> None:
+    """Save transcription and analysis results to file.
+
+    Every word covered by a decision is labelled with its reason.
+
+    Args:
+        segments: List of segments, or a columnar Transcript
+        decisions: Edit decisions from the analyzer
+        output_path: Output file; ".json", ".jsonl" (one word per line), ".csv" or plain text
+        verbose: Enable verbose debug output
+        transcription: Settings that produced the transcript, recorded in JSON output
+    """
+    with metrics.stage("export", format=_kind(output_path)):
+        _save_results(segments, decisions, output_path, verbose, transcription)
+
+
+def _save_results(segments, decisions, output_path, verbose, transcription) -> None:
+    transcript = segments if isinstance(segments, Transcript) else Transcript.from_segments(segments)
+    kind = _kind(output_path)
+
+    with open(output_path, "w", encoding="utf-8", newline="") as f:
+        if kind == "json":
+            _write_json(f, transcript, decisions, transcription)
+        else:
+            label_ids, labels = _label_ids(transcript, decisions)
+            _write_header(f, kind)
+            for rows in _word_blocks(transcript, label_ids, labels):
+                _write_rows(f, kind, rows)
+            _write_footer(f, kind, len(transcript), len(decisions))
+
+    if verbose:
+        print(f"[DEBUG] Saved {len(transcript)} words to {output_path}")
+
+
+def stream_results(labeled_words, output_path: Path, verbose: bool = False) -> list:
+    """Write CSV, JSONL or text results as analysis produces words.
+
+    Args:
+        labeled_words: (word, decision) pairs from Analyzer.iter_labeled_words
+        output_path: Output file; ".csv" writes CSV, ".jsonl" one JSON object
+            per word, anything else plain text
+        verbose: Enable verbose debug output
+
+    Returns:
+        The edit decisions seen in the stream
+    """
+    with metrics.stage("export", format=_kind(output_path), streaming=True):
+        return _stream_results(labeled_words, output_path, verbose)
+
+
+def _stream_results(labeled_words, output_path: Path, verbose: bool) -> list:
+    kind = _kind(output_path)
+    if kind == "json":
+        raise ValueError("JSON results need the whole transcript; use save_results")
+    decisions = []
+    word_count = 0
+
+    with open(output_path, "w", encoding="utf-8", newline="") as f:
+        _write_header(f, kind)
+        pending: list[tuple] = []
+        for word, decision in labeled_words:
+            word_count += 1
+            if decision is not None and (not decisions or decisions[-1] is not decision):
+                decisions.append(decision)
+            pending.append((word.text, word.start, word.end, word.confidence, decision.reason if decision else "keep"))
+            if len(pending) == _BLOCK:
+                _write_rows(f, kind, _rows(*map(list, zip(*pending))))
+                pending.clear()
+        if pending:
+            _write_rows(f, kind, _rows(*map(list, zip(*pending))))
+        _write_footer(f, kind, word_count, len(decisions))
+
+    if verbose:
+        print(f"[DEBUG] Saved {word_count} words to {output_path}")
+
+    return decisions
+
+
+# Region name prefixes recognised by AutoCutByRegions.lua
+_REAPER_PREFIXES = {"filler": "FILLER", "repetition": "REPEAT"}
+
+
+def save_cuts_csv(cuts: list, output_path: Path) -> None:
+    """Save planned cuts as start,end,label rows for ImportRegionsFromCSV.lua.
+
+    Args:
+        cuts: Cuts from CutPlanner.plan (already merged and padded)
+        output_path: Output CSV file
+    """
+    with metrics.stage("export", format="reaper-csv", cuts=len(cuts)), open(output_path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        for cut in cuts:
+            prefix = _REAPER_PREFIXES.get(cut.reason, "CUT")
+            writer.writerow([f"{cut.start:.3f}", f"{cut.end:.3f}", f"{prefix}: {cut.original_text}"])
@@ -0,0 +1,161 @@
+"""Long-lived transcription server that keeps Whisper models resident.
+
+Protocol: the client sends one JSON line
+``{"audio_path": ..., "language": ..., "model_size": ..., "profile": {...}}`` over a Unix
+socket; the server answers with one JSON line per segment
+(``{"segment": {...}}``) and a final ``{"done": true}`` or
+``{"error": "..."}`` line.
+"""
+
+import json
+import logging
+import os
+import socket
+import socketserver
+from collections.abc import Iterator
+from pathlib import Path
+
+from .models import Segment
+from .profiles import TranscriptionProfile
+from .transcriber import Transcriber
+
+logger = logging.getLogger(__name__)
+
+
+def default_socket_path() -> Path:
+    """Return the per-user server socket path."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "ksu-podcast-editor.sock"
+    return Path(f"/tmp/ksu-podcast-editor-{os.getuid()}.sock")
+
+
+class _JobHandler(socketserver.StreamRequestHandler):
+    """Handles one transcription job per connection."""
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line.strip():
+            # is_running() probes connect and close without sending a job
+            return
+        try:
+            request = json.loads(line)
+            profile = TranscriptionProfile.model_validate(request.get("profile") or {})
+            transcriber = self.server.get_transcriber(request["model_size"], profile)
+            segments = transcriber.iter_segments(
+                Path(request["audio_path"]), language=request.get("language")
+            )
+            for segment in segments:
+                self._send({"segment": segment.model_dump()})
+            self._send({"done": True})
+        except (BrokenPipeError, ConnectionResetError):
+            logger.info("Client disconnected before the job finished")
+        except Exception as e:
+            logger.exception("Transcription job failed")
+            try:
+                self._send({"error": str(e)})
+            except OSError:
+                pass
+
+    def _send(self, message: dict) -> None:
+        self.wfile.write(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+        self.wfile.flush()
+
+
+class TranscriptionServer(socketserver.UnixStreamServer):
+    """Serves transcription jobs one at a time with models kept in memory."""
+
+    def __init__(self, socket_path: Path, device: str = "auto", verbose: bool = False):
+        """Bind the server socket.
+
+        Args:
+            socket_path: Unix socket to listen on; a stale socket file is replaced
+            device: Device for models loaded by the server (auto, cpu, cuda)
+            verbose: Enable verbose logging
+        """
+        self.socket_path = Path(socket_path)
+        self.device = device
+        self.verbose = verbose
+        self.transcribers: dict[tuple[str, str], Transcriber] = {}
+
+        if self.socket_path.exists():
+            if is_running(self.socket_path):
+                raise RuntimeError(f"A transcription server is already running at {self.socket_path}")
+            self.socket_path.unlink()
+        super().__init__(str(self.socket_path), _JobHandler)
+
+    def get_transcriber(self, model_size: str, profile: TranscriptionProfile | None = None) -> Transcriber:
+        """Return the resident transcriber for a model and profile, loading it on first use."""
+        profile = profile or TranscriptionProfile()
+        key = (model_size, profile.model_dump_json())
+        transcriber = self.transcribers.get(key)
+        if transcriber is None:
+            transcriber = Transcriber(
+                model_size=model_size, device=self.device, verbose=self.verbose, profile=profile
+            )
+            transcriber.model  # Load now so the first job's latency is predictable
+            self.transcribers[key] = transcriber
+        return transcriber
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
+
+
+def is_running(socket_path: Path) -> bool:
+    """Check whether a server is accepting connections on the socket."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(socket_path))
+        except OSError:
+            return False
+    return True
+
+
+class RemoteTranscriber(Transcriber):
+    """Transcriber that sends jobs to a running TranscriptionServer.
+
+    Caching still happens on the client side, so a cache hit does not even
+    touch the server.
+    """
+
+    # The server decodes and transcribes whole files, so jobs are not checkpointed
+    resumable = False
+
+    def __init__(self, socket_path: Path, model_size: str = "large-v3", **kwargs):
+        """Initialize the client.
+
+        Args:
+            socket_path: Unix socket of the server
+            model_size: Whisper model size the server should use
+            **kwargs: Passed to Transcriber (verbose, cache, profile)
+        """
+        super().__init__(model_size=model_size, **kwargs)
+        self.socket_path = Path(socket_path)
+
+    def _iter_model_segments(self, audio_path: Path, language: str | None) -> Iterator[Segment]:
+        """Stream segments for the job from the server."""
+        logger.info(f"Sending transcription job to {self.socket_path}: {audio_path}")
+        if self.verbose:
+            print(f"[DEBUG] Sending transcription job to server at {self.socket_path}")
+
+        request = {
+            "audio_path": str(Path(audio_path).resolve()),
+            "language": language,
+            "model_size": self.model_size,
+            "profile": self.profile.model_dump(),
+        }
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(self.socket_path))
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with sock.makefile("r", encoding="utf-8") as reader:
+                for line in reader:
+                    message = json.loads(line)
+                    if "segment" in message:
+                        yield Segment.model_validate(message["segment"])
+                    elif message.get("done"):
+                        return
+                    else:
+                        raise RuntimeError(f"Transcription server error: {message.get('error')}")
+
+        raise RuntimeError("Transcription server closed the connection unexpectedly")
@@ -0,0 +1,124 @@
+"""Energy-based detection of long pauses in the audio itself."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+from . import metrics
+from .audio import AudioSource, open_reader
+from .models import EditDecision
+
+
+class SilenceDetector:
+    """Finds silences from per-frame RMS levels, streaming the file in blocks."""
+
+    def __init__(
+        self,
+        threshold_db: float = -40.0,
+        min_silence: float = 1.0,
+        target: float = 0.5,
+        frame_ms: float = 20.0,
+        block_frames: int = 1 << 18,
+    ):
+        """Initialize the detector.
+
+        Args:
+            threshold_db: Frames with RMS below this level (dBFS) are silent
+            min_silence: Silences longer than this many seconds are shortened
+            target: Length in seconds a long silence is shortened to
+            frame_ms: Analysis frame length in milliseconds
+            block_frames: Audio frames read from the file at a time
+        """
+        self.threshold_db = threshold_db
+        self.min_silence = min_silence
+        self.target = min(target, min_silence)
+        self.frame_ms = frame_ms
+        self.block_frames = block_frames
+
+    def iter_silences(self, audio_path: "Path | AudioSource") -> Iterator[tuple[float, float]]:
+        """Yield (start, end) of every silence of at least min_silence seconds.
+
+        Memory use is bounded by one block regardless of file length.
+
+        Args:
+            audio_path: Path to the audio file, or a source already decoded for this run
+
+        Yields:
+            Silences in seconds, in time order
+        """
+        with open_reader(audio_path) as infile:
+            samplerate = infile.samplerate
+            frame = max(1, int(round(self.frame_ms * samplerate / 1000)))
+            block_frames = max(frame, self.block_frames // frame * frame)
+            # Sum of squares over a frame and all channels, compared without a log
+            threshold = 10 ** (self.threshold_db / 10) * frame * infile.channels
+
+            carry = np.zeros((0, infile.channels), dtype=np.float32)
+            offset = 0  # Index of the first frame of the current block
+            run_start = None  # Frame where the current silence began
+
+            while True:
+                block = infile.read(block_frames, dtype="float32", always_2d=True)
+                at_end = len(block) < block_frames
+                if len(carry):
+                    block = np.concatenate([carry, block])
+
+                n_frames = len(block) // frame
+                frames = block[: n_frames * frame].reshape(n_frames, frame, block.shape[1])
+                energy = np.einsum("ijk,ijk->i", frames, frames)
+                carry = block[n_frames * frame:]
+                if at_end and len(carry):
+                    # Score the partial last frame as if it were a full one
+                    energy = np.append(energy, np.einsum("jk,jk->", carry, carry) * frame / len(carry))
+
+                silent = energy < threshold
+                edges = np.diff(silent.astype(np.int8), prepend=np.int8(run_start is not None))
+                for index in np.flatnonzero(edges).tolist():
+                    if silent[index]:
+                        run_start = offset + index
+                    else:
+                        yield from self._long(run_start * frame, (offset + index) * frame, samplerate)
+                        run_start = None
+                offset += len(energy)
+
+                if at_end:
+                    break
+
+            if run_start is not None:
+                yield from self._long(run_start * frame, infile.frames, samplerate)
+
+    def _long(self, start: int, end: int, samplerate: int) -> Iterator[tuple[float, float]]:
+        """Yield a silence given in audio frames if it is long enough."""
+        if end - start >= self.min_silence * samplerate:
+            yield start / samplerate, end / samplerate
+
+    def iter_decisions(self, audio_path: "Path | AudioSource") -> Iterator[EditDecision]:
+        """Yield long_pause decisions that shorten each long silence to the target.
+
+        Half the target is kept on each side of the silence, so the cut sits
+        in the middle of the pause.
+
+        Args:
+            audio_path: Path to the audio file, or a source already decoded for this run
+
+        Yields:
+            Edit decisions in time order
+        """
+        keep = self.target / 2
+        for start, end in self.iter_silences(audio_path):
+            if end - start > self.target:
+                yield EditDecision(start=start + keep, end=end - keep, reason="long_pause")
+
+    def detect(self, audio_path: "Path | AudioSource") -> list[EditDecision]:
+        """Return long_pause decisions for the whole file."""
+        with metrics.stage("silence") as span:
+            decisions = list(self.iter_decisions(audio_path))
+            if span:
+                if isinstance(audio_path, AudioSource):
+                    audio_seconds = audio_path.duration
+                else:
+                    audio_seconds = sf.info(str(audio_path)).duration
+                span.set(audio_seconds=audio_seconds, pauses=len(decisions))
+        return decisions
@@ -0,0 +1,129 @@
+"""Two-tier transcription: a draft model everywhere, the large model where it matters."""
+
+from bisect import bisect_left, bisect_right
+
+from .analyzer import Analyzer
+from .models import Segment, Word
+
+
+def uncertain_spans(
+    segments: list[Segment],
+    language: str = "ru",
+    min_confidence: float = 0.6,
+    context: float = 1.0,
+    join_gap: float = 2.0,
+) -> list[tuple[float, float]]:
+    """Find spans of a draft transcript worth re-transcribing.
+
+    A span starts from every word below ``min_confidence`` and every
+    candidate filler or repetition, widened by ``context`` seconds on each
+    side and extended to whole words. Spans closer than ``join_gap`` are
+    joined, so the large model sees fewer, longer clips.
+
+    Args:
+        segments: Draft transcript
+        language: Language for filler and repetition detection
+        min_confidence: Words recognised less confidently than this are uncertain
+        context: Seconds of surrounding speech included with each span
+        join_gap: Spans separated by at most this many seconds are joined
+
+    Returns:
+        Sorted, non-overlapping (start, end) spans in seconds
+    """
+    words = [w for s in segments for w in s.words]
+    seeds = [(w.start, w.end) for w in words if w.confidence < min_confidence]
+    seeds.extend((d.start, d.end) for d in Analyzer(language=language).analyze(segments))
+    if not seeds:
+        return []
+
+    spans: list[list[float]] = []
+    for start, end in sorted(seeds):
+        start, end = start - context, end + context
+        if spans and start - spans[-1][1] <= join_gap:
+            spans[-1][1] = max(spans[-1][1], end)
+        else:
+            spans.append([start, end])
+
+    # Snap to word boundaries so splices never split a draft word
+    starts = [w.start for w in words]
+    ends = [w.end for w in words]
+    result = []
+    for start, end in spans:
+        first, last = bisect_right(ends, start), bisect_left(starts, end)
+        if first < last:
+            start, end = min(start, starts[first]), max(end, ends[last - 1])
+        result.append((max(0.0, start), end))
+    return result
+
+
+def splice_refined(
+    draft: list[Segment], spans: list[tuple[float, float]], refined: list[Segment]
+) -> list[Segment]:
+    """Replace the draft words inside each span with the large model's words.
+
+    Words belong to a span when their midpoint falls inside it. Draft
+    segments that touch no span are kept as they are; each run of segments
+    touching a span becomes one segment with the spliced words.
+
+    Args:
+        draft: Draft transcript
+        spans: Spans that were re-transcribed
+        refined: Segments from the large model, with absolute timestamps
+
+    Returns:
+        The combined transcript in time order
+    """
+    span_starts = [start for start, _ in spans]
+    span_ends = [end for _, end in spans]
+
+    def span_of(word: Word) -> int | None:
+        middle = (word.start + word.end) / 2
+        i = bisect_right(span_starts, middle) - 1
+        return i if i >= 0 and middle < spans[i][1] else None
+
+    refined_words: dict[int, list[Word]] = {}
+    for segment in refined:
+        for word in segment.words:
+            i = span_of(word)
+            if i is not None:
+                refined_words.setdefault(i, []).append(word)
+
+    result = []
+    pending: list[Word] = []  # Words of the current run of touched segments
+    used: set[int] = set()
+    for segment in draft:
+        touched = [span_of(w) for w in segment.words]
+        overlapping = range(bisect_right(span_ends, segment.start), bisect_left(span_starts, segment.end))
+        if all(i is None for i in touched) and not overlapping:
+            if pending:
+                result.append(_joined(pending))
+                pending = []
+            result.append(segment)
+            continue
+
+        for word, i in zip(segment.words, touched):
+            if i is None:
+                pending.append(word)
+            elif i not in used:
+                used.add(i)
+                pending.extend(refined_words.get(i, []))
+
+        # Spans the draft heard nothing in can still hold refined words
+        for i in overlapping:
+            if i not in used:
+                used.add(i)
+                pending.extend(refined_words.get(i, []))
+
+    if pending:
+        result.append(_joined(pending))
+    return result
+
+
+def _joined(words: list[Word]) -> Segment:
+    words = sorted(words, key=lambda w: w.start)
+    return Segment(
+        start=words[0].start,
+        end=words[-1].end,
+        words=words,
+        text=" ".join(w.text for w in words),
+    )
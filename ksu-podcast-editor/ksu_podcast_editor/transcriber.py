@@ -1,11 +1,22 @@
 """Speech-to-text transcription with timestamps."""
 
+import contextlib
 import logging
+from collections.abc import Iterator
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from faster_whisper import WhisperModel
-
+from . import metrics
+from .audio import ASR_SAMPLE_RATE, AudioSource
+from .cache import TranscriptCache
 from .models import Segment, Word
+from .probe import get_duration
+from .profiles import TranscriptionProfile
+from .tiered import splice_refined, uncertain_spans
+
+if TYPE_CHECKING:
+    import numpy as np
+    from faster_whisper import WhisperModel
 
 logger = logging.getLogger(__name__)
 
@@ -13,80 +24,317 @@ logger = logging.getLogger(__name__)
 class Transcriber:
     """Transcribes audio files using faster-whisper."""
 
-    def __init__(self, model_size: str = "large-v3", device: str = "auto", verbose: bool = False):
+    # Whether single-model runs checkpoint to the cache and resume after a crash
+    resumable = True
+
+    def __init__(
+        self,
+        model_size: str = "large-v3",
+        device: str = "auto",
+        verbose: bool = False,
+        cache: TranscriptCache | None = None,
+        workers: int = 1,
+        draft_model_size: str | None = None,
+        min_confidence: float = 0.6,
+        profile: TranscriptionProfile | None = None,
+    ):
         """Initialize the transcriber.
 
+        The model is loaded on first use, so cached transcripts never pay for it.
+
         Args:
             model_size: Whisper model size (tiny, base, small, medium, large-v3)
             device: Device to use (auto, cpu, cuda)
             verbose: Enable verbose logging
+            cache: Transcript cache to read from and write to, or None to disable
+            workers: Worker processes; above 1 the audio is split at silences and
+                chunks are transcribed in parallel, each worker with its own model
+                (ignored in tiered mode)
+            draft_model_size: Small model (tiny, base) that transcribes the whole
+                file first; model_size then only re-transcribes uncertain spans
+            min_confidence: In tiered mode, draft words below this confidence
+                are re-transcribed
+            profile: Runtime settings (quantization, threads, beam size, VAD)
         """
+        self.model_size = model_size
+        self.device = device
+        self.profile = profile or TranscriptionProfile()
+        self.compute_type = self.profile.compute_type
         self.verbose = verbose
-        logger.info(f"Loading Whisper model: {model_size} (device={device})")
-        if verbose:
-            print(f"[DEBUG] Loading Whisper model: {model_size} (device={device})")
-            print("[DEBUG] This may take a while on first run (downloading model)...")
-        self.model = WhisperModel(model_size, device=device, compute_type="auto")
-        logger.info("Model loaded successfully")
-        if verbose:
-            print("[DEBUG] Model loaded successfully")
-
-    def transcribe(self, audio_path: Path, language: str | None = None) -> list[Segment]:
+        self.cache = cache
+        self.workers = workers
+        self.draft_model_size = draft_model_size
+        self.min_confidence = min_confidence
+        self._model = None
+        self._draft_model = None
+
+    @property
+    def model(self) -> "WhisperModel":
+        """The Whisper model, loaded on first access."""
+        if self._model is None:
+            # Imported here so cached transcripts never load the inference stack
+            from faster_whisper import WhisperModel
+
+            logger.info(f"Loading Whisper model: {self.model_size} (device={self.device})")
+            if self.verbose:
+                print(f"[DEBUG] Loading Whisper model: {self.model_size} (device={self.device})")
+                print("[DEBUG] This may take a while on first run (downloading model)...")
+            with metrics.stage("model_load", model=self.model_size, device=self.device):
+                self._model = WhisperModel(self.model_size, device=self.device, **self.profile.model_options())
+            logger.info("Model loaded successfully")
+            if self.verbose:
+                print("[DEBUG] Model loaded successfully")
+        return self._model
+
+    @property
+    def draft_model(self) -> "WhisperModel":
+        """The draft model used in tiered mode, loaded on first access."""
+        if self._draft_model is None:
+            from faster_whisper import WhisperModel
+
+            logger.info(f"Loading draft Whisper model: {self.draft_model_size}")
+            if self.verbose:
+                print(f"[DEBUG] Loading draft Whisper model: {self.draft_model_size}")
+            with metrics.stage("model_load", model=self.draft_model_size, device=self.device):
+                self._draft_model = WhisperModel(
+                    self.draft_model_size, device=self.device, **self.profile.model_options()
+                )
+        return self._draft_model
+
+    def settings(self, language: str | None = None) -> dict:
+        """Return every setting that affects the transcript, for cache keys."""
+        settings = {
+            "model_size": self.model_size,
+            "compute_type": self.compute_type,
+            "language": language,
+            "chunked": self.workers > 1 and not self.draft_model_size,
+            "options": {"word_timestamps": True, **self.profile.transcribe_options()},
+        }
+        if self.draft_model_size:
+            settings["tiered"] = {"draft": self.draft_model_size, "min_confidence": self.min_confidence}
+        return settings
+
+    def record(self, language: str | None = None) -> dict:
+        """Return the profile name and settings, for results files."""
+        return {"profile": self.profile.name, **self.settings(language)}
+
+    def transcribe(self, audio_path: "Path | AudioSource", language: str | None = None) -> list[Segment]:
         """Transcribe an audio file.
 
         Args:
-            audio_path: Path to the audio file
+            audio_path: Path to the audio file, or a source decoded once for the whole run
             language: Language code (e.g., "ru", "en") or None for auto-detect
 
         Returns:
             List of segments with word-level timestamps
         """
+        return list(self.iter_segments(audio_path, language=language))
+
+    def iter_segments(self, audio_path: "Path | AudioSource", language: str | None = None) -> Iterator[Segment]:
+        """Transcribe an audio file, yielding segments as they are decoded.
+
+        Given an AudioSource, the model is fed its 16 kHz buffer instead of
+        decoding the file again.
+
+        Args:
+            audio_path: Path to the audio file, or a source decoded once for the whole run
+            language: Language code (e.g., "ru", "en") or None for auto-detect
+
+        Yields:
+            Segments with word-level timestamps
+        """
+        audio_seconds = _audio_seconds(audio_path) if metrics.active() else None
+        yield from metrics.timed(
+            "asr",
+            self._iter_cached_segments(audio_path, language),
+            audio_seconds=audio_seconds,
+            model=self.model_size,
+            profile=self.profile.name,
+        )
+
+    def _iter_cached_segments(self, audio_path: "Path | AudioSource", language: str | None) -> Iterator[Segment]:
+        """Serve the transcript from the cache, or run the model and cache it."""
+        if self.cache is None:
+            yield from self._iter_model_segments(audio_path, language)
+            return
+
+        key = self.cache.key(audio_path, self.settings(language))
+        cached = self.cache.load(key)
+        if cached is not None:
+            logger.info(f"Using cached transcript: {audio_path}")
+            if self.verbose:
+                print(f"[DEBUG] Using cached transcript ({key})")
+            yield from cached
+            return
+
+        if not self.resumable or self.draft_model_size or self.workers > 1:
+            yield from self.cache.store(key, self._iter_model_segments(audio_path, language))
+            return
+
+        # Segments are checkpointed as they arrive, so a crash hours in costs seconds
+        yield from self.cache.store_resumable(
+            key, lambda start: self._iter_model_segments(audio_path, language, start=start)
+        )
+
+    def _iter_model_segments(
+        self, audio_path: "Path | AudioSource", language: str | None, start: float = 0.0
+    ) -> Iterator[Segment]:
+        """Run the Whisper model and yield converted segments.
+
+        Args:
+            audio_path: Path to the audio file, or a source decoded once for the whole run
+            language: Language code or None for auto-detect
+            start: Seconds into the audio to begin at, when resuming from a
+                checkpoint (single-model mode only)
+        """
         logger.info(f"Starting transcription: {audio_path}")
         if self.verbose:
             print(f"[DEBUG] Starting transcription of: {audio_path}")
             print(f"[DEBUG] Language: {language or 'auto-detect'}")
 
+        if start > 0:
+            # Seek by slicing the decoded audio: clip_timestamps is ignored when VAD is on
+            with _opened(audio_path) as source:
+                first = int(start * ASR_SAMPLE_RATE)
+                if self.verbose:
+                    print(f"[DEBUG] Resuming from checkpoint at {first / ASR_SAMPLE_RATE:.1f}s")
+                yield from self._convert(
+                    source.mono16k()[first:], language, offset=first / ASR_SAMPLE_RATE
+                )
+            return
+
+        if self.draft_model_size:
+            yield from self._iter_tiered_segments(audio_path, language)
+            return
+
+        if self.workers > 1:
+            # Imported here: parallel imports this module for convert_segment
+            from .parallel import transcribe_parallel
+
+            if self.verbose:
+                print(f"[DEBUG] Transcribing in parallel with {self.workers} workers")
+            yield from transcribe_parallel(
+                _model_input(audio_path),
+                self.model_size,
+                self.workers,
+                language=language,
+                device="cpu" if self.device == "auto" else self.device,
+                compute_type=self.compute_type,
+                options=self.settings(language)["options"],
+            )
+            return
+
+        yield from self._convert(_model_input(audio_path), language)
+
+    def _convert(self, audio: "str | np.ndarray", language: str | None, offset: float = 0.0) -> Iterator[Segment]:
+        """Transcribe with the main model, yielding segments shifted by offset seconds."""
         segments, info = self.model.transcribe(
-            str(audio_path),
+            audio,
             language=language,
-            word_timestamps=True,
+            **self.settings(language)["options"],
         )
 
         if self.verbose:
             print(f"[DEBUG] Detected language: {info.language} (probability: {info.language_probability:.2f})")
             print("[DEBUG] Processing segments...")
 
-        result = []
         segment_count = 0
+        total_words = 0
         for segment in segments:
             segment_count += 1
             if self.verbose and segment_count % 10 == 0:
                 print(f"[DEBUG] Processed {segment_count} segments, current: {segment.start:.1f}s - {segment.end:.1f}s")
-            words = []
-            if segment.words:
-                for word in segment.words:
-                    words.append(
-                        Word(
-                            text=word.word.strip(),
-                            start=word.start,
-                            end=word.end,
-                            confidence=word.probability,
-                        )
-                    )
-
-            result.append(
-                Segment(
-                    start=segment.start,
-                    end=segment.end,
-                    words=words,
-                    text=segment.text.strip(),
-                )
-            )
+            result = convert_segment(segment, offset=offset)
+            total_words += len(result.words)
+            yield result
 
-        logger.info(f"Transcription complete: {len(result)} segments")
+        logger.info(f"Transcription complete: {segment_count} segments")
         if self.verbose:
             print(f"[DEBUG] Transcription complete: {segment_count} segments processed")
-            total_words = sum(len(s.words) for s in result)
             print(f"[DEBUG] Total words extracted: {total_words}")
 
-        return result
+    def _iter_tiered_segments(self, audio_path: "Path | AudioSource", language: str | None) -> Iterator[Segment]:
+        """Draft the whole file with the small model, then refine uncertain spans."""
+        audio = _model_input(audio_path)
+        segments, info = self.draft_model.transcribe(
+            audio, language=language, **self.settings(language)["options"]
+        )
+        draft = [convert_segment(segment) for segment in segments]
+        language = language or info.language
+
+        spans = uncertain_spans(draft, language=language, min_confidence=self.min_confidence)
+        total = info.duration or 1.0
+        refined_seconds = sum(end - start for start, end in spans)
+        logger.info(f"Re-transcribing {len(spans)} spans ({refined_seconds / total:.0%} of the audio)")
+        if self.verbose:
+            print(
+                f"[DEBUG] Draft ({self.draft_model_size}) done; re-transcribing {len(spans)} spans, "
+                f"{refined_seconds:.1f}s of {total:.1f}s, with {self.model_size}"
+            )
+        if not spans:
+            yield from draft
+            return
+
+        # One pass over the file that decodes only the listed clips (VAD would override them)
+        options = {
+            **self.settings(language)["options"],
+            "condition_on_previous_text": False,
+            "vad_filter": False,
+        }
+        options.pop("vad_parameters", None)
+        segments, _ = self.model.transcribe(
+            audio,
+            language=language,
+            clip_timestamps=[t for span in spans for t in span],
+            **options,
+        )
+        yield from splice_refined(draft, spans, [convert_segment(segment) for segment in segments])
+
+
+def _model_input(audio_path: "Path | AudioSource") -> "str | np.ndarray":
+    """What faster-whisper transcribes: the shared 16 kHz buffer, else the path."""
+    if isinstance(audio_path, AudioSource):
+        return audio_path.mono16k()
+    return str(audio_path)
+
+
+def _opened(audio_path: "Path | AudioSource") -> contextlib.AbstractContextManager[AudioSource]:
+    """The run's shared source, or a new one to close after use."""
+    if isinstance(audio_path, AudioSource):
+        return contextlib.nullcontext(audio_path)
+    return AudioSource(audio_path)
+
+
+def _audio_seconds(audio_path: Path) -> float | None:
+    """Duration for metrics; formats the header probe cannot read are skipped."""
+    try:
+        return get_duration(audio_path)
+    except (OSError, RuntimeError, ValueError):
+        return None
+
+
+def convert_segment(segment, offset: float = 0.0) -> Segment:
+    """Convert a faster-whisper segment into our model.
+
+    Args:
+        segment: Segment yielded by WhisperModel.transcribe
+        offset: Seconds added to every timestamp (for audio that was clipped)
+    """
+    words = []
+    if segment.words:
+        for word in segment.words:
+            words.append(
+                Word(
+                    text=word.word.strip(),
+                    start=word.start + offset,
+                    end=word.end + offset,
+                    confidence=word.probability,
+                )
+            )
+
+    return Segment(
+        start=segment.start + offset,
+        end=segment.end + offset,
+        words=words,
+        text=segment.text.strip(),
+    )
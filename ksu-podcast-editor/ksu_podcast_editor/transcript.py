@@ -0,0 +1,131 @@
+"""Columnar, array-backed transcript representation."""
+
+from array import array
+from collections.abc import Iterable
+
+import numpy as np
+
+from .models import Segment, Word
+
+
+def normalize(text: str) -> str:
+    """Normalize word text for comparison."""
+    return text.lower().strip().rstrip(".,!?:;")
+
+
+class Transcript:
+    """A transcript stored as parallel NumPy arrays instead of Word objects.
+
+    Word texts are interned: ``text_ids`` index into ``texts`` (as spoken)
+    and ``token_ids`` into ``tokens`` (normalized), so each distinct word is
+    normalized once. Segment boundaries are kept as offsets into the word
+    arrays: segment ``i`` holds words ``segment_offsets[i]:segment_offsets[i + 1]``.
+    """
+
+    def __init__(
+        self,
+        texts: list[str],
+        text_ids: np.ndarray,
+        start: np.ndarray,
+        end: np.ndarray,
+        confidence: np.ndarray,
+        segment_offsets: np.ndarray,
+        segment_start: np.ndarray,
+        segment_end: np.ndarray,
+        segment_text: list[str],
+    ):
+        self.texts = texts
+        self.text_ids = text_ids
+        self.start = start
+        self.end = end
+        self.confidence = confidence
+        self.segment_offsets = segment_offsets
+        self.segment_start = segment_start
+        self.segment_end = segment_end
+        self.segment_text = segment_text
+
+        # Intern normalized tokens; several spellings ("Ну", "ну,") share one id
+        self.token_index: dict[str, int] = {}
+        token_of_text = np.fromiter(
+            (self.token_index.setdefault(normalize(t), len(self.token_index)) for t in texts),
+            dtype=np.int32,
+            count=len(texts),
+        )
+        self.tokens = list(self.token_index)
+        self.token_ids = token_of_text[text_ids] if len(text_ids) else np.zeros(0, dtype=np.int32)
+
+    @classmethod
+    def from_segments(cls, segments: Iterable[Segment]) -> "Transcript":
+        """Build a transcript, consuming segments one at a time."""
+        index: dict[str, int] = {}
+        text_ids = array("i")
+        start = array("d")
+        end = array("d")
+        confidence = array("f")
+        offsets = array("q", [0])
+        segment_start = array("d")
+        segment_end = array("d")
+        segment_text = []
+
+        for segment in segments:
+            for word in segment.words:
+                text_ids.append(index.setdefault(word.text, len(index)))
+                start.append(word.start)
+                end.append(word.end)
+                confidence.append(word.confidence)
+            offsets.append(len(text_ids))
+            segment_start.append(segment.start)
+            segment_end.append(segment.end)
+            segment_text.append(segment.text)
+
+        return cls(
+            texts=list(index),
+            text_ids=np.frombuffer(text_ids, dtype=np.int32),
+            start=np.frombuffer(start, dtype=np.float64),
+            end=np.frombuffer(end, dtype=np.float64),
+            confidence=np.frombuffer(confidence, dtype=np.float32),
+            segment_offsets=np.frombuffer(offsets, dtype=np.int64),
+            segment_start=np.frombuffer(segment_start, dtype=np.float64),
+            segment_end=np.frombuffer(segment_end, dtype=np.float64),
+            segment_text=segment_text,
+        )
+
+    def __len__(self) -> int:
+        """Number of words."""
+        return len(self.text_ids)
+
+    @property
+    def n_segments(self) -> int:
+        return len(self.segment_text)
+
+    def text(self, i: int) -> str:
+        """Text of word i as spoken."""
+        return self.texts[self.text_ids[i]]
+
+    def span_text(self, i: int, j: int) -> str:
+        """Space-joined text of words i..j-1."""
+        return " ".join(self.texts[k] for k in self.text_ids[i:j])
+
+    def word(self, i: int) -> Word:
+        """Word i as a model object."""
+        return Word(
+            text=self.text(i),
+            start=float(self.start[i]),
+            end=float(self.end[i]),
+            confidence=float(self.confidence[i]),
+        )
+
+    def to_segments(self) -> list[Segment]:
+        """Convert back to model objects."""
+        segments = []
+        for s in range(self.n_segments):
+            first, last = self.segment_offsets[s], self.segment_offsets[s + 1]
+            segments.append(
+                Segment(
+                    start=float(self.segment_start[s]),
+                    end=float(self.segment_end[s]),
+                    words=[self.word(i) for i in range(first, last)],
+                    text=self.segment_text[s],
+                )
+            )
+        return segments
@@ -1,7 +1,10 @@
 -- AutoCutByRegions.lua
 local CUT_PREFIXES = { "FILLER:", "REPEAT:", "CUT:" }
-local PRE_PAD_SEC  = 0.10
-local POST_PAD_SEC = 0.10
+-- Padding and merging are done by the Python cut planner when exporting
+-- (ksu-podcast-editor analyze --cuts-csv, see --pad-ms); only set these for
+-- regions created some other way.
+local PRE_PAD_SEC  = 0.0
+local POST_PAD_SEC = 0.0
 
 local function starts_with_any(name, prefixes)
   for _, p in ipairs(prefixes) do
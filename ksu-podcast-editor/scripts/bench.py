@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""Reproducible benchmark suite on synthetic podcasts.
+
+Generates seeded transcripts and audio, times the main pipeline stages
+(analysis, analysis with many custom filler phrases, result export,
+in-memory and streaming edits, ffmpeg graph building) and writes a JSON report. Given a stored report with
+--baseline, it compares the two and exits with status 1 on regressions.
+
+Runs against the installed package, so install it first with
+`pip install -e .` from the project root.
+"""
+
+import argparse
+import fnmatch
+import importlib.util
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import soundfile as sf
+
+from ksu_podcast_editor.analyzer import FILLER_PHRASES, FILLERS, Analyzer
+from ksu_podcast_editor.editor import Editor
+from ksu_podcast_editor.models import EditDecision, Segment, Word
+from ksu_podcast_editor.results import save_results
+
+
+def _load_script(name: str):
+    """Import a sibling script by path, however this one was loaded."""
+    spec = importlib.util.spec_from_file_location(name, Path(__file__).resolve().with_name(f"{name}.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+ffmpeg_edit = _load_script("ffmpeg_edit")
+
+SCHEMA = 1
+
+VOCABULARY = [
+    "мы", "сегодня", "говорим", "про", "музыку", "и", "звук", "очень",
+    "интересно", "когда", "люди", "слушают", "подкаст", "дома", "или", "в", "машине",
+    "запись", "микрофон", "гость", "вопрос", "ответ", "история", "потом",
+]
+
+# Sizes of the full suite; --quick uses the first entries only
+WORDS = [1_000, 10_000, 50_000, 200_000]
+AUDIO = [(60, 16000, 1), (60, 44100, 2), (600, 44100, 2)]  # (seconds, samplerate, channels)
+CUTS = [100, 1_000, 5_000]
+PHRASES = [10, 100, 1_000]  # Custom filler phrases
+PHRASE_WORDS = 10_000  # Transcript size for the phrase cases
+
+# Fast cases are called repeatedly until one timed sample lasts this long
+MIN_SAMPLE_SECONDS = 0.5
+
+
+def make_segments(
+    n_words: int,
+    filler_rate: float = 0.04,
+    repeat_rate: float = 0.02,
+    seed: int = 0,
+    words_per_segment: int = 20,
+) -> list[Segment]:
+    """Generate a synthetic Russian transcript with a given density of edits.
+
+    Args:
+        n_words: Number of words in the transcript
+        filler_rate: Share of positions that get a filler word or phrase
+        repeat_rate: Share of positions that repeat the previous one or two words
+        seed: Random seed; the same arguments always give the same transcript
+        words_per_segment: Words per segment
+
+    Returns:
+        Segments in time order
+    """
+    rng = random.Random(seed)
+    fillers = sorted(FILLERS["ru"])
+    phrases = sorted(FILLER_PHRASES["ru"])
+    texts: list[str] = []
+    while len(texts) < n_words:
+        roll = rng.random()
+        if roll < filler_rate:
+            texts.extend(rng.choice(phrases).split() if rng.random() < 0.25 else [rng.choice(fillers)])
+        elif roll < filler_rate + repeat_rate and len(texts) >= 2:
+            texts.extend(texts[-rng.randint(1, 2):])
+        else:
+            texts.append(rng.choice(VOCABULARY))
+    texts = texts[:n_words]
+
+    segments = []
+    words: list[Word] = []
+    t = 0.0
+    for i, text in enumerate(texts):
+        length = rng.uniform(0.15, 0.45)
+        words.append(Word(text=text, start=round(t, 3), end=round(t + length, 3), confidence=round(rng.uniform(0.5, 1.0), 3)))
+        t += length + (rng.uniform(0.5, 2.0) if rng.random() < 0.02 else rng.uniform(0.02, 0.12))
+        if len(words) == words_per_segment or i == len(texts) - 1:
+            segments.append(Segment(
+                start=words[0].start, end=words[-1].end, words=words, text=" ".join(w.text for w in words),
+            ))
+            words = []
+    return segments
+
+
+def make_phrases(count: int, seed: int = 0) -> set[str]:
+    """Generate distinct multi-word phrases to use as custom fillers."""
+    rng = random.Random(seed)
+    phrases: set[str] = set()
+    while len(phrases) < count:
+        phrases.add(" ".join(rng.choice(VOCABULARY) for _ in range(rng.randint(2, 4))))
+    return phrases
+
+
+def make_audio(path: Path, seconds: float, samplerate: int, channels: int = 1, seed: int = 0) -> None:
+    """Write a WAV of tone bursts separated by quiet noise, block by block.
+
+    Args:
+        path: Output WAV file
+        seconds: Length of the audio
+        samplerate: Sample rate in Hz
+        channels: Number of channels
+        seed: Random seed
+    """
+    rng = np.random.default_rng(seed)
+    remaining = int(seconds * samplerate)
+    with sf.SoundFile(str(path), "w", samplerate, channels, subtype="PCM_16") as f:
+        while remaining:
+            n = min(remaining, int(rng.uniform(0.3, 3.0) * samplerate))
+            if rng.random() < 0.8:
+                freq = rng.uniform(100, 400)
+                tone = 0.3 * np.sin(2 * np.pi * freq * np.arange(n) / samplerate)
+                block = tone[:, None] + rng.normal(0, 0.01, (n, channels))
+            else:
+                block = rng.normal(0, 1e-3, (n, channels))
+            f.write(block.astype(np.float32))
+            remaining -= n
+
+
+def make_cuts(count: int, duration: float, seed: int = 0) -> list[EditDecision]:
+    """Generate `count` short cuts spread over `duration` seconds."""
+    rng = random.Random(seed)
+    cuts = []
+    for _ in range(count):
+        start = rng.uniform(0, duration - 1.0)
+        cuts.append(EditDecision(start=round(start, 3), end=round(start + rng.uniform(0.1, 0.8), 3), reason="filler"))
+    return cuts
+
+
+def measure(run, repeat: int, min_seconds: float = MIN_SAMPLE_SECONDS) -> tuple[list[float], object]:
+    """Take `repeat` timings of `run`; return the seconds per call and the last result.
+
+    One untimed call comes first, so first-call costs (lazy imports, page
+    faults on fresh buffers) stay out of the timings. Its time also sets
+    how many calls each sample averages, as timeit's autorange does: a
+    sample lasts at least `min_seconds`, so a short burst of machine noise
+    cannot double the time of a fast case.
+    """
+    started = time.perf_counter()
+    result = run()
+    loops = max(1, math.ceil(min_seconds / max(time.perf_counter() - started, 1e-9)))
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(loops):
+            result = run()
+        times.append((time.perf_counter() - started) / loops)
+    return times, result
+
+
+def run_suite(
+    workdir: Path,
+    words: list[int] = WORDS,
+    audio: list[tuple[int, int, int]] = AUDIO,
+    cuts: list[int] = CUTS,
+    phrases: list[int] = PHRASES,
+    phrase_words: int = PHRASE_WORDS,
+    repeat: int = 3,
+    only: str | None = None,
+    verbose: bool = False,
+) -> dict:
+    """Run every benchmark case and return the report.
+
+    Each case records its parameters, the best and median wall time per
+    call, and a small summary of its output, so a baseline comparison also notices
+    changed results.
+
+    Args:
+        workdir: Directory for generated audio and outputs
+        words: Transcript sizes for analysis and export
+        audio: (seconds, samplerate, channels) of the audio to edit
+        cuts: Cut counts for the ffmpeg graph builder
+        phrases: Custom filler phrase counts for the phrase matcher
+        phrase_words: Transcript size for the phrase cases
+        repeat: Timed samples per case
+        only: Glob pattern selecting case names
+        verbose: Print each case as it finishes
+
+    Returns:
+        The report, with cases keyed by name
+    """
+    cases = {}
+
+    def record(name: str, params: dict, run, summarize) -> None:
+        if only and not fnmatch.fnmatch(name, only):
+            return
+        times, result = measure(run, repeat)
+        cases[name] = {
+            "params": params,
+            "best_seconds": round(min(times), 6),
+            "median_seconds": round(statistics.median(times), 6),
+            "output": summarize(result),
+        }
+        if verbose:
+            print(f"{name:<36} {statistics.median(times) * 1000:>10.1f} ms")
+
+    analyzer = Analyzer(language="ru")
+    for n in words:
+        segments = make_segments(n)
+        params = {"words": n, "filler_rate": 0.04, "repeat_rate": 0.02, "seed": 0}
+        record(f"analyze/{n}w", params, lambda: analyzer.analyze(segments), lambda d: {"decisions": len(d)})
+
+        decisions = analyzer.analyze(segments)
+        out = workdir / f"results-{n}.json"
+        record(
+            f"save_results/{n}w", params,
+            lambda: save_results(segments, decisions, out),
+            lambda _: {"decisions": len(decisions), "segments": len(segments)},
+        )
+
+    segments = make_segments(phrase_words) if phrases else []
+    for count in phrases:
+        custom = Analyzer(language="ru", custom_fillers=make_phrases(count))
+        record(
+            f"analyze_phrases/{count}p", {"words": phrase_words, "phrases": count, "seed": 0},
+            lambda custom=custom: custom.analyze(segments), lambda d: {"decisions": len(d)},
+        )
+
+    editor = Editor()
+    for seconds, samplerate, channels in audio:
+        source = workdir / f"audio-{seconds}s-{samplerate}-{channels}.wav"
+        make_audio(source, seconds, samplerate, channels)
+        decisions = make_cuts(seconds // 10, seconds)
+        out = workdir / "edited.wav"
+        params = {"seconds": seconds, "samplerate": samplerate, "channels": channels, "cuts": len(decisions)}
+        tag = f"{seconds}s-{samplerate}hz-{channels}ch"
+        for mode, run in (("edit", editor.edit), ("edit_streaming", editor.edit_streaming)):
+            record(
+                f"{mode}/{tag}", params,
+                lambda run=run: run(source, out, decisions),
+                lambda _: {"frames": sf.info(str(out)).frames},
+            )
+
+    # ffmpeg itself is stubbed: this measures planning and filter-graph building
+    calls: list[list[str]] = []
+    with mock.patch.object(ffmpeg_edit.subprocess, "run", lambda cmd, **kwargs: calls.append(cmd)):
+        for count in cuts:
+            duration = count * 3.0
+            cut_dicts = [d.model_dump() for d in make_cuts(count, duration)]
+
+            def run(cut_dicts=cut_dicts, duration=duration):
+                calls.clear()
+                ffmpeg_edit.edit_audio(workdir / "in.wav", workdir / "out.wav", cut_dicts, duration=duration)
+                return list(calls)
+
+            record(
+                f"ffmpeg_edit/{count}cuts", {"cuts": count, "duration": duration}, run,
+                lambda commands: {
+                    "commands": len(commands),
+                    "graph_chars": sum(len(c[c.index("-filter_complex") + 1]) for c in commands),
+                },
+            )
+
+    return {
+        "schema": SCHEMA,
+        "repeat": repeat,
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "system": platform.system(),
+            "cpus": os.cpu_count(),
+        },
+        "cases": cases,
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float = 0.25, min_delta: float = 0.02) -> list[str]:
+    """Compare a report with a baseline.
+
+    A case regresses when its median time grows by more than `tolerance`
+    (a fraction) and by more than `min_delta` seconds, so noise in very
+    short cases is ignored. A case whose output summary differs is
+    reported too.
+
+    Args:
+        report: Report from run_suite
+        baseline: Stored report
+        tolerance: Allowed relative slowdown
+        min_delta: Slowdowns below this many seconds are ignored
+
+    Returns:
+        One message per problem; empty when nothing regressed
+    """
+    problems = []
+    for name, case in report["cases"].items():
+        base = baseline.get("cases", {}).get(name)
+        if base is None:
+            continue
+        if case["params"] != base["params"]:
+            problems.append(f"{name}: parameters differ from the baseline")
+            continue
+        if case["output"] != base["output"]:
+            problems.append(f"{name}: output changed {base['output']} -> {case['output']}")
+        new, old = case["median_seconds"], base["median_seconds"]
+        if new > old * (1 + tolerance) and new - old > min_delta:
+            problems.append(f"{name}: {old * 1000:.1f} ms -> {new * 1000:.1f} ms ({new / old:.2f}x)")
+    return problems
+
+
+def print_comparison(report: dict, baseline: dict) -> None:
+    """Print each case's time next to the baseline's."""
+    print(f"{'case':<36} {'baseline, ms':>12} {'now, ms':>10} {'ratio':>7}")
+    for name, case in report["cases"].items():
+        base = baseline.get("cases", {}).get(name)
+        now = case["median_seconds"] * 1000
+        if base is None:
+            print(f"{name:<36} {'-':>12} {now:>10.1f} {'-':>7}")
+        else:
+            old = base["median_seconds"] * 1000
+            print(f"{name:<36} {old:>12.1f} {now:>10.1f} {now / old if old else 0:>7.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the editing pipeline on synthetic podcasts")
+    parser.add_argument("-o", "--output", type=Path, help="Write the JSON report here")
+    parser.add_argument("--baseline", type=Path, help="Compare against this stored report")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown against the baseline (0.25 = 25%%)")
+    parser.add_argument(
+        "--min-delta-ms", type=float, default=20.0, help="Ignore slowdowns smaller than this, in milliseconds"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timed samples per case (the median is compared)")
+    parser.add_argument("--quick", action="store_true", help="Run only the smallest sizes")
+    parser.add_argument("--only", help="Glob selecting cases, e.g. 'analyze/*'")
+    args = parser.parse_args()
+
+    sizes = {"words": WORDS, "audio": AUDIO, "cuts": CUTS, "phrases": PHRASES}
+    if args.quick:
+        sizes = {"words": WORDS[:2], "audio": AUDIO[:2], "cuts": CUTS[:2], "phrases": PHRASES[:2]}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        report = run_suite(Path(tmp), **sizes, repeat=args.repeat, only=args.only, verbose=True)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Report saved to: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        print()
+        print_comparison(report, baseline)
+        problems = compare(report, baseline, args.tolerance, args.min_delta_ms / 1000)
+        if problems:
+            print("\nRegressions:")
+            for problem in problems:
+                print(f"  {problem}")
+            return 1
+        print("\nNo regressions")
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
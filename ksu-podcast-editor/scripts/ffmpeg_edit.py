@@ -7,9 +7,13 @@ import subprocess
 import tempfile
 from pathlib import Path
 
+# Keep intervals rendered by one ffmpeg invocation. Each one adds ~80 characters
+# to the filter graph, so this stays far below the 128 KiB per-argument limit.
+MAX_INTERVALS_PER_PASS = 400
+
 
 def load_cuts(json_path: Path) -> list[dict]:
-    """Load cuts from JSON file and sort by start time descending."""
+    """Load cuts from JSON file and sort by start time."""
     with open(json_path) as f:
         data = json.load(f)
 
@@ -17,8 +21,7 @@ def load_cuts(json_path: Path) -> list[dict]:
     if isinstance(cuts, dict):
         cuts = list(cuts.values())
 
-    # Sort by start time descending (last first to preserve timestamps)
-    return sorted(cuts, key=lambda x: x["start"], reverse=True)
+    return sorted(cuts, key=lambda x: x["start"])
 
 
 def get_duration(audio_path: Path) -> float:
@@ -35,62 +38,152 @@ def get_duration(audio_path: Path) -> float:
     return float(result.stdout.strip())
 
 
-def remove_segment(input_path: Path, output_path: Path, start: float, end: float) -> None:
-    """Remove a segment from audio using ffmpeg filter_complex."""
-    # Use filter_complex to select parts before and after the cut, then concatenate
-    filter_cmd = (
-        f"[0]atrim=0:{start},asetpts=PTS-STARTPTS[a];"
-        f"[0]atrim={end},asetpts=PTS-STARTPTS[b];"
-        f"[a][b]concat=n=2:v=0:a=1[out]"
-    )
+def keep_intervals(
+    cuts: list[dict], duration: float, merge_gap: float = 0.0, pad: float = 0.0
+) -> list[tuple[float, float]]:
+    """Plan cuts into sorted, non-overlapping (start, end) intervals to keep.
 
-    subprocess.run(
-        [
-            "ffmpeg", "-y", "-i", str(input_path),
-            "-filter_complex", filter_cmd,
-            "-map", "[out]",
-            str(output_path)
-        ],
-        capture_output=True, check=True
+    Follows the package's CutPlanner without importing it, so the script
+    needs nothing but ffmpeg: cuts are padded and clamped to the file
+    first, then cuts separated by at most `merge_gap` seconds merge.
+    """
+    padded = sorted(
+        (max(0.0, cut["start"] - pad), min(duration, cut["end"] + pad))
+        for cut in cuts
+        if cut["end"] > cut["start"]
     )
-
-
-def edit_audio(input_path: Path, output_path: Path, cuts: list[dict], verbose: bool = False) -> None:
-    """Apply all cuts to audio file, processing from last to first."""
+    merged: list[list[float]] = []
+    for start, end in padded:
+        if end <= start:
+            continue
+        if merged and start - merged[-1][1] <= merge_gap:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+
+    intervals = []
+    pos = 0.0
+    for start, end in merged:
+        if start > pos:
+            intervals.append((pos, start))
+        pos = end
+    if pos < duration:
+        intervals.append((pos, duration))
+    return intervals
+
+
+def join_filters(inputs: list[str], lengths: list[float], crossfade: float) -> list[str]:
+    """Filters joining labelled streams into [out], crossfading where both sides allow."""
+    if len(inputs) == 1:
+        return [f"[{inputs[0]}]anull[out]"]
+    if crossfade <= 0:
+        return ["".join(f"[{label}]" for label in inputs) + f"concat=n={len(inputs)}:v=0:a=1[out]"]
+
+    filters = []
+    prev, total = inputs[0], lengths[0]
+    for i in range(1, len(inputs)):
+        label = "out" if i == len(inputs) - 1 else f"j{i}"
+        if total >= crossfade and lengths[i] >= crossfade:
+            filters.append(f"[{prev}][{inputs[i]}]acrossfade=d={crossfade:.6f}:c1=qsin:c2=qsin[{label}]")
+            total += lengths[i] - crossfade
+        else:
+            filters.append(f"[{prev}][{inputs[i]}]concat=n=2:v=0:a=1[{label}]")
+            total += lengths[i]
+        prev = label
+    return filters
+
+
+def build_filter(intervals: list[tuple[float, float]], duration: float, crossfade: float = 0.0) -> str:
+    """Build one filter graph that keeps every interval of input 0."""
+    n = len(intervals)
+    filters = ["[0:a]asplit=" + str(n) + "".join(f"[s{i}]" for i in range(n)) if n > 1 else "[0:a]anull[s0]"]
+    for i, (start, end) in enumerate(intervals):
+        # Leave the last interval open so it is not clipped by ffprobe rounding
+        trim = f"start={start:.6f}" if end >= duration else f"start={start:.6f}:end={end:.6f}"
+        filters.append(f"[s{i}]atrim={trim},asetpts=PTS-STARTPTS[k{i}]")
+    filters.extend(join_filters([f"k{i}" for i in range(n)], [e - s for s, e in intervals], crossfade))
+    return ";".join(filters)
+
+
+def run_ffmpeg(inputs: list[list[str]], filter_graph: str, output_path: Path, extra: list[str] = ()) -> None:
+    """Run ffmpeg with the given input argument groups and filter graph."""
+    cmd = ["ffmpeg", "-y"]
+    for args in inputs:
+        cmd.extend(args)
+    cmd.extend(["-filter_complex", filter_graph, "-map", "[out]", *extra, str(output_path)])
+    subprocess.run(cmd, capture_output=True, check=True)
+
+
+def edit_audio(
+    input_path: Path,
+    output_path: Path,
+    cuts: list[dict],
+    verbose: bool = False,
+    crossfade_ms: float = 0.0,
+    max_intervals: int = MAX_INTERVALS_PER_PASS,
+    duration: float | None = None,
+    merge_gap: float = 0.0,
+    pad: float = 0.0,
+) -> None:
+    """Apply all cuts to audio file in a single ffmpeg pass.
+
+    Cuts are merged into keep intervals and rendered by one filter graph.
+    When there are more than `max_intervals`, groups of intervals are
+    rendered to lossless temp files first and then joined, so no single
+    command line grows too long.
+    """
     if not cuts:
         print("No cuts to apply")
         subprocess.run(["cp", str(input_path), str(output_path)])
         return
 
-    # Work with temp files for intermediate steps
-    current_input = input_path
+    if duration is None:
+        duration = get_duration(input_path)
+    intervals = keep_intervals(cuts, duration, merge_gap, pad)
+    if not intervals:
+        raise ValueError("Cuts remove the whole file")
+    crossfade = crossfade_ms / 1000
 
-    for i, cut in enumerate(cuts):
-        start, end = cut["start"], cut["end"]
-
-        if verbose:
+    if verbose:
+        for cut in cuts:
             text_preview = cut.get("text", "")[:50]
-            print(f"  [{i+1}/{len(cuts)}] Removing {start:.1f}s - {end:.1f}s: {text_preview}...")
-
-        # Use temp file for intermediate, final file for last cut
-        is_last = (i == len(cuts) - 1)
-
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            tmp_path = Path(tmp.name)
-
-        target = output_path if is_last else tmp_path
-
-        try:
-            remove_segment(current_input, target, start, end)
-        except subprocess.CalledProcessError as e:
-            print(f"Error processing cut at {start:.1f}s: {e}")
-            raise
-
-        # Clean up previous temp file (but not original input)
-        if current_input != input_path:
-            current_input.unlink()
-
-        current_input = target
+            print(f"  Removing {cut['start']:.1f}s - {cut['end']:.1f}s: {text_preview}")
+        print(f"  Keeping {len(intervals)} intervals")
+
+    try:
+        if len(intervals) <= max_intervals:
+            run_ffmpeg([["-i", str(input_path)]], build_filter(intervals, duration, crossfade), output_path)
+            return
+
+        with tempfile.TemporaryDirectory() as tmp:
+            parts = []
+            lengths = []
+            for first in range(0, len(intervals), max_intervals):
+                group = intervals[first:first + max_intervals]
+                group_start, group_end = group[0][0], group[-1][1]
+                shifted = [(s - group_start, e - group_start) for s, e in group]
+                part = Path(tmp) / f"part{len(parts):05d}.wav"
+                if verbose:
+                    print(f"  Rendering intervals {first + 1}-{first + len(group)} of {len(intervals)}")
+                run_ffmpeg(
+                    [["-ss", f"{group_start:.6f}", "-t", f"{group_end - group_start:.6f}", "-i", str(input_path)]],
+                    build_filter(shifted, group_end - group_start, crossfade),
+                    part,
+                    extra=["-c:a", "pcm_f32le"],
+                )
+                parts.append(part)
+                lengths.append(sum(e - s for s, e in group))
+
+            if verbose:
+                print(f"  Joining {len(parts)} parts")
+            run_ffmpeg(
+                [["-i", str(part)] for part in parts],
+                ";".join(join_filters([f"{i}:a" for i in range(len(parts))], lengths, crossfade)),
+                output_path,
+            )
+    except subprocess.CalledProcessError as e:
+        print(f"Error running ffmpeg: {e.stderr.decode(errors='replace')[-2000:] if e.stderr else e}")
+        raise
 
 
 def main():
@@ -99,6 +192,13 @@ def main():
     parser.add_argument("output", type=Path, help="Output audio file")
     parser.add_argument("cuts_json", type=Path, help="JSON file with cuts to remove")
     parser.add_argument("-v", "--verbose", action="store_true", help="Show progress")
+    parser.add_argument(
+        "--crossfade-ms", type=float, default=0.0, help="Crossfade at each join in milliseconds (default: hard cuts)"
+    )
+    parser.add_argument("--pad-ms", type=float, default=0.0, help="Padding added before and after each cut")
+    parser.add_argument(
+        "--merge-gap-ms", type=float, default=50.0, help="Merge cuts separated by at most this gap"
+    )
 
     args = parser.parse_args()
 
@@ -117,7 +217,11 @@ def main():
     print(f"Original duration: {original_duration:.1f}s ({original_duration/60:.1f} min)")
 
     print(f"Applying cuts...")
-    edit_audio(args.input, args.output, cuts, verbose=args.verbose)
+    edit_audio(
+        args.input, args.output, cuts,
+        verbose=args.verbose, crossfade_ms=args.crossfade_ms, duration=original_duration,
+        merge_gap=args.merge_gap_ms / 1000, pad=args.pad_ms / 1000,
+    )
 
     new_duration = get_duration(args.output)
     saved = original_duration - new_duration
@@ -0,0 +1,85 @@
+"""Tests for acoustic filler detection."""
+
+from types import SimpleNamespace
+
+import numpy as np
+
+from ksu_podcast_editor.acoustic import SAMPLE_RATE, AcousticFillerDetector, merge_decisions
+from ksu_podcast_editor.models import EditDecision, Segment, Word
+from ksu_podcast_editor.transcript import Transcript
+
+
+def _hum(seconds: float, pitch: float = 120.0) -> np.ndarray:
+    """A steady voiced sound: harmonics of one pitch, like a drawn-out "э"."""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return sum(0.3 / k * np.sin(2 * np.pi * pitch * k * t) for k in range(1, 8)).astype(np.float32)
+
+
+def _syllables(seconds: float) -> np.ndarray:
+    """Speech-like sound whose spectrum changes every 80 ms."""
+    rng = np.random.default_rng(0)
+    n = int(0.08 * SAMPLE_RATE)
+    parts = [_hum(0.08, rng.uniform(100, 300)) * rng.uniform(0.3, 1.0) for _ in range(int(seconds / 0.08))]
+    return np.concatenate(parts)[: n * len(parts)]
+
+
+def _silence(seconds: float) -> np.ndarray:
+    return np.zeros(int(seconds * SAMPLE_RATE), dtype=np.float32)
+
+
+class _FakeModel:
+    """Stands in for WhisperModel: reports one word at the given reel times."""
+
+    def __init__(self, words):
+        self.words = words
+        self.calls = []
+
+    def transcribe(self, audio, **kwargs):
+        self.calls.append((len(audio), kwargs))
+        words = [SimpleNamespace(word=w, start=s, end=e, probability=0.9) for w, s, e in self.words]
+        return [SimpleNamespace(words=words)], None
+
+
+def test_candidates_are_steady_voiced_spans():
+    """Test that a held sound is a candidate but syllables and silence are not."""
+    audio = np.concatenate([_syllables(1.0), _silence(0.3), _hum(0.6), _silence(0.3), _syllables(1.0)])
+    spans = AcousticFillerDetector().find_candidates(audio, block=50)
+    assert len(spans) == 1
+    start, end = spans[0]
+    assert abs(start - 1.3) < 0.05 and abs(end - 1.9) < 0.05
+
+
+def test_confirm_maps_reel_times_back():
+    """Test that only candidates the model hears as fillers become decisions."""
+    audio = np.concatenate([_silence(5.0), _hum(0.5), _silence(5.0), _hum(0.5), _silence(1.0)])
+    detector = AcousticFillerDetector(padding=0.2)
+    candidates = [(5.0, 5.5), (10.5, 11.0)]
+    # Reel: [4.8, 5.7) at 0.0, then 0.5 s gap, [10.3, 11.2) at 1.4
+    detector._model = _FakeModel([("Э-э-э,", 0.25, 0.65), ("да", 1.65, 2.05)])
+
+    decisions = detector.confirm(audio, candidates)
+    assert [(d.start, d.end, d.reason, d.original_text) for d in decisions] == [(5.0, 5.5, "filler", "Э-э-э,")]
+    assert len(detector._model.calls) == 1
+    assert detector._model.calls[0][1]["language"] == "ru"
+
+
+def test_is_filler_spellings():
+    """Test spellings of hesitations the model produces."""
+    detector = AcousticFillerDetector(language="en")
+    assert detector.is_filler("Uhh,") and detector.is_filler("Hmm.") and detector.is_filler("um")
+    assert not detector.is_filler("hello")
+
+
+def test_merge_drops_covered_and_real_words():
+    """Test that acoustic fillers already cut or heard as real words are dropped."""
+    words = [Word(text="хорошо", start=0.0, end=1.0), Word(text="ну", start=1.0, end=1.3), Word(text="да", start=3.0, end=3.4)]
+    transcript = Transcript.from_segments([Segment(start=0.0, end=3.4, words=words)])
+    text = [EditDecision(start=1.0, end=1.3, reason="filler", original_text="ну")]
+    acoustic = [
+        EditDecision(start=0.2, end=0.8, reason="filler", original_text="ээ"),  # inside "хорошо"
+        EditDecision(start=1.1, end=1.4, reason="filler", original_text="ээ"),  # overlaps "ну" cut
+        EditDecision(start=2.0, end=2.6, reason="filler", original_text="ммм"),  # dropped by Whisper
+    ]
+    merged = merge_decisions(text, acoustic, transcript)
+    assert [(d.start, d.original_text) for d in merged] == [(1.0, "ну"), (2.0, "ммм")]
+    assert len(merge_decisions(text, acoustic)) == 3
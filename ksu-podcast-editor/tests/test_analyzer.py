@@ -0,0 +1,84 @@
+"""Tests for filler and repetition detection."""
+
+from ksu_podcast_editor.analyzer import Analyzer, PhraseMatcher
+from ksu_podcast_editor.models import Segment, Word
+
+
+def _segments(text: str, step: float = 0.5) -> list[Segment]:
+    """Build a single segment with evenly spaced words."""
+    words = [
+        Word(text=t, start=i * step, end=i * step + step * 0.8)
+        for i, t in enumerate(text.split())
+    ]
+    return [Segment(start=0.0, end=len(words) * step, words=words, text=text)]
+
+
+def test_phrase_matcher_longest_first():
+    """Test that the longest phrase at a position wins."""
+    matcher = PhraseMatcher([["на", "самом"], ["на", "самом", "деле"]])
+    assert matcher.find_all(["на", "самом", "деле", "да"]) == [(0, 3)]
+
+
+def test_phrase_matcher_no_overlap():
+    """Test that matches never overlap."""
+    matcher = PhraseMatcher([["ну", "вот"], ["вот", "так"]])
+    assert matcher.find_all(["ну", "вот", "так"]) == [(0, 2)]
+
+
+def test_analyze_phrase_filler():
+    """Test multi-word filler detection with punctuation and case."""
+    decisions = Analyzer(language="ru").analyze(_segments("Я, на самом деле, согласен"))
+    assert len(decisions) == 1
+    assert decisions[0].reason == "filler"
+    assert decisions[0].original_text == "на самом деле,"
+
+
+def test_analyze_phrase_across_segments():
+    """Test that phrases spanning a segment boundary are detected."""
+    words = _segments("мы в общем пришли")[0].words
+    segments = [
+        Segment(start=0.0, end=1.0, words=words[:2]),
+        Segment(start=1.0, end=2.0, words=words[2:]),
+    ]
+    decisions = Analyzer(language="ru").analyze(segments)
+    assert [d.original_text for d in decisions] == ["в общем"]
+
+
+def test_analyze_single_filler_and_repetition():
+    """Test single-word fillers and immediate repetitions."""
+    decisions = Analyzer(language="ru").analyze(_segments("э мы мы пошли"))
+    assert [(d.original_text, d.reason) for d in decisions] == [
+        ("э", "filler"),
+        ("мы", "repetition"),
+    ]
+
+
+def test_custom_multiword_filler():
+    """Test that multi-word custom fillers are matched as phrases."""
+    analyzer = Analyzer(language="en", custom_fillers={"Let Me Think"})
+    decisions = analyzer.analyze(_segments("well let me think about it"))
+    assert [d.original_text for d in decisions] == ["well", "let me think"]
+
+
+def test_iter_decisions_is_incremental():
+    """Test that decisions are emitted before the transcript is exhausted."""
+    consumed = []
+
+    def segments():
+        for i in range(100):
+            consumed.append(i)
+            yield _segments("э мы пошли домой ну вот и всё")[0]
+
+    stream = Analyzer(language="ru").iter_decisions(segments(), window=64)
+    first = next(stream)
+    assert first.original_text == "э"
+    assert len(consumed) < 20
+    assert len(list(stream)) == 2 * 100 - 1
+
+
+def test_iter_labeled_words_labels_phrase_words():
+    """Test that every word of a phrase carries the phrase decision."""
+    labeled = list(Analyzer(language="ru").iter_labeled_words(_segments("как бы да")))
+    labels = [d.reason if d else "keep" for _, d in labeled]
+    assert labels == ["filler", "filler", "keep"]
+    assert labeled[0][1] is labeled[1][1]
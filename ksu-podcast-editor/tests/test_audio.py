@@ -0,0 +1,128 @@
+"""Tests for the shared, decode-once audio source."""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from ksu_podcast_editor.audio import AudioSource
+from ksu_podcast_editor.editor import Editor
+from ksu_podcast_editor.models import EditDecision
+from ksu_podcast_editor.silence import SilenceDetector
+from ksu_podcast_editor.transcriber import Transcriber
+
+
+def _tone(seconds: float, samplerate: int, channels: int = 2) -> np.ndarray:
+    t = np.arange(int(seconds * samplerate)) / samplerate
+    tone = 0.5 * np.sin(2 * np.pi * 440 * t).astype(np.float32)
+    tone[int(1.0 * samplerate):int(2.5 * samplerate)] = 0.0  # A long pause
+    return np.repeat(tone[:, None], channels, axis=1)
+
+
+class FakeModel:
+    """Stands in for WhisperModel and records what it was asked to transcribe."""
+
+    def __init__(self):
+        self.inputs = []
+
+    def transcribe(self, audio, **kwargs):
+        self.inputs.append(audio)
+        word = SimpleNamespace(word=" ну", start=0.1, end=0.3, probability=0.9)
+        segment = SimpleNamespace(start=0.1, end=0.3, text=" ну", words=[word])
+        return iter([segment]), SimpleNamespace(language="ru", language_probability=1.0)
+
+
+@pytest.mark.parametrize("ext", ["wav", "mp3", "flac"])
+def test_decodes_formats_to_native_and_asr_views(tmp_path, ext):
+    """Test that every supported format gives a native buffer and a 16 kHz mono view."""
+    path = tmp_path / f"a.{ext}"
+    sf.write(str(path), _tone(3, 44100), 44100)
+
+    with AudioSource(path) as source:
+        assert source.duration == pytest.approx(3.0, abs=0.01)
+        assert (source.samplerate, source.channels) == (44100, 2)
+        assert source.frames == pytest.approx(3 * 44100, abs=1152)
+        mono = source.mono16k()
+        assert mono.ndim == 1 and mono.dtype == np.float32
+        assert len(mono) == pytest.approx(3 * 16000, abs=500)
+        assert np.abs(mono[16000:40000]).max() < 0.01
+        assert np.abs(mono[4000:12000]).max() > 0.4
+
+
+def test_duration_reads_header_without_decoding(tmp_path):
+    """Test that a source is only decoded once samples are needed."""
+    path = tmp_path / "a.wav"
+    sf.write(str(path), _tone(2, 8000), 8000)
+    source = AudioSource(path)
+    assert source.duration == 2.0
+    assert source._data is None
+
+
+def test_duration_after_close_does_not_decode_again(tmp_path, monkeypatch):
+    """Test that a format the header probe cannot read is decoded once, even after close()."""
+    path = tmp_path / "a.wav"
+    sf.write(str(path), _tone(2, 8000), 8000)
+
+    def unreadable_header(path):
+        raise RuntimeError("unsupported container")
+
+    monkeypatch.setattr("ksu_podcast_editor.audio.get_duration", unreadable_header)
+    decodes = []
+    decode = AudioSource._decode
+    monkeypatch.setattr(AudioSource, "_decode", lambda self: decodes.append(1) or decode(self))
+
+    with AudioSource(path) as source:
+        assert source.duration == 2.0
+    assert source.duration == 2.0
+    assert len(decodes) == 1 and source._files == []
+
+
+def test_one_decode_per_run(tmp_path, monkeypatch):
+    """Test that transcription, pause detection and rendering share one decode."""
+    path = tmp_path / "a.wav"
+    sf.write(str(path), _tone(4, 22050), 22050)
+    decodes = []
+    decode = AudioSource._decode
+    monkeypatch.setattr(AudioSource, "_decode", lambda self: decodes.append(1) or decode(self))
+
+    model = FakeModel()
+    transcriber = Transcriber(model_size="tiny")
+    transcriber._model = model
+    with AudioSource(path) as source:
+        transcriber.transcribe(source, language="ru")
+        pauses = SilenceDetector(min_silence=1.0).detect(source)
+        Editor().edit(source, tmp_path / "out.wav", pauses)
+        Editor().edit_streaming(source, tmp_path / "streamed.wav", pauses)
+
+    assert len(decodes) == 1
+    assert isinstance(model.inputs[0], np.ndarray) and len(model.inputs[0]) == 4 * 16000
+    assert [(round(d.start, 2), round(d.end, 2)) for d in pauses] == [(1.25, 2.25)]
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_editing_a_source_matches_editing_the_file(tmp_path, stream):
+    """Test that rendering from the shared buffer writes the same file as from the path."""
+    path = tmp_path / "a.wav"
+    sf.write(str(path), _tone(4, 16000), 16000, subtype="PCM_24")
+    decisions = [EditDecision(start=0.5, end=0.8, reason="filler"), EditDecision(start=3.0, end=3.2, reason="filler")]
+    editor = Editor(block_frames=1000)
+    edit = editor.edit_streaming if stream else editor.edit
+
+    edit(path, tmp_path / "from_path.wav", decisions)
+    with AudioSource(path) as source:
+        edit(source, tmp_path / "from_source.wav", decisions)
+
+    assert sf.info(str(tmp_path / "from_source.wav")).subtype == "PCM_24"
+    assert (tmp_path / "from_source.wav").read_bytes() == (tmp_path / "from_path.wav").read_bytes()
+
+
+def test_mp3_input_renders_to_wav(tmp_path):
+    """Test that an MP3 input is edited into a PCM WAV rather than keeping its codec."""
+    path = tmp_path / "a.mp3"
+    sf.write(str(path), _tone(3, 44100), 44100)
+    with AudioSource(path) as source:
+        Editor().edit(source, tmp_path / "out.wav", [EditDecision(start=0.5, end=1.0, reason="filler")])
+    info = sf.info(str(tmp_path / "out.wav"))
+    assert info.subtype == "PCM_16"
+    assert info.duration == pytest.approx(2.5, abs=0.05)
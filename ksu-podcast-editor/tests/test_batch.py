@@ -0,0 +1,70 @@
+"""Tests for batch processing."""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+from ksu_podcast_editor.batch import BatchRunner, collect_jobs
+from ksu_podcast_editor.models import Segment, Word
+from ksu_podcast_editor.profiles import PROFILES
+from ksu_podcast_editor.transcriber import Transcriber
+
+
+class FakeTranscriber(Transcriber):
+    """Returns a fixed transcript and fails on files named bad*."""
+
+    def __init__(self):
+        super().__init__(model_size="tiny", profile=PROFILES["fast-cpu"])
+        self.calls = []
+
+    def transcribe(self, audio_path, language=None):
+        name = Path(audio_path).name
+        self.calls.append(name)
+        if name.startswith("bad"):
+            raise RuntimeError("decode error")
+        words = [Word(text="ну", start=0.1, end=0.2), Word(text="привет", start=0.3, end=0.6)]
+        return [Segment(start=0.0, end=1.0, words=words, text="ну привет")]
+
+
+def _wav(path):
+    sf.write(path, np.zeros(8000, dtype=np.float32), 8000)
+
+
+def test_collect_jobs_from_manifest(tmp_path):
+    """Test CSV and JSONL manifests with relative paths."""
+    (tmp_path / "m.csv").write_text("input,language\na.wav,en\nsub/b.wav,\n")
+    (tmp_path / "m.jsonl").write_text('{"input": "a.wav", "name": "ep1"}\n')
+
+    csv_jobs = collect_jobs(str(tmp_path / "m.csv"))
+    assert [(j.input, j.language) for j in csv_jobs] == [
+        (tmp_path / "a.wav", "en"),
+        (tmp_path / "sub" / "b.wav", None),
+    ]
+    assert collect_jobs(str(tmp_path / "m.jsonl"))[0].name == "ep1"
+
+
+def test_batch_runs_reports_and_resumes(tmp_path):
+    """Test per-file outputs, the summary, and resuming only failed files."""
+    episodes = tmp_path / "episodes"
+    episodes.mkdir()
+    for name in ("a.wav", "b.wav", "bad.wav"):
+        _wav(episodes / name)
+    (episodes / "notes.txt").write_text("not audio")
+    out = tmp_path / "out"
+
+    transcriber = FakeTranscriber()
+    summary = BatchRunner(transcriber, out, language="ru").run(collect_jobs(str(episodes)))
+
+    assert (summary["done"], summary["failed"]) == (2, 1)
+    assert sf.info(out / "a.wav").frames < 8000
+    results = json.loads((out / "a.json").read_text())
+    assert results["summary"]["fillers_count"] == 1
+    assert results["transcription"]["profile"] == "fast-cpu"
+    assert results["transcription"]["options"]["beam_size"] == 1
+
+    transcriber.calls.clear()
+    summary = BatchRunner(transcriber, out, language="ru").run(collect_jobs(str(episodes)))
+    assert transcriber.calls == ["bad.wav"]
+    assert summary["skipped"] == 2
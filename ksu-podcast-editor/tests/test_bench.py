@@ -0,0 +1,69 @@
+"""Tests for the synthetic benchmark suite script."""
+
+import importlib.util
+import json
+from pathlib import Path
+
+import soundfile as sf
+
+_SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "bench.py"
+_spec = importlib.util.spec_from_file_location("bench", _SCRIPT)
+bench = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(bench)
+
+
+def test_synthetic_transcript_is_seeded():
+    """Test that the same seed gives the same transcript and another seed does not."""
+    first = bench.make_segments(500, seed=1)
+    assert first == bench.make_segments(500, seed=1)
+    assert first != bench.make_segments(500, seed=2)
+    assert sum(len(s.words) for s in first) == 500
+    starts = [w.start for s in first for w in s.words]
+    assert starts == sorted(starts)
+
+
+def test_filler_rate_controls_density():
+    """Test that a higher filler rate yields more filler decisions."""
+    analyzer = bench.Analyzer(language="ru")
+    sparse = analyzer.analyze(bench.make_segments(2000, filler_rate=0.01, repeat_rate=0.0))
+    dense = analyzer.analyze(bench.make_segments(2000, filler_rate=0.1, repeat_rate=0.0))
+    assert 2 * len(sparse) < len(dense)
+
+
+def test_synthetic_audio(tmp_path):
+    """Test that generated audio has the requested length, rate and channels."""
+    path = tmp_path / "a.wav"
+    bench.make_audio(path, 2, 8000, channels=2)
+    info = sf.info(str(path))
+    assert (info.frames, info.samplerate, info.channels) == (16000, 8000, 2)
+
+
+def test_run_suite_report(tmp_path):
+    """Test that a tiny suite yields a JSON-serializable report with every case."""
+    report = bench.run_suite(
+        tmp_path, words=[200], audio=[(5, 8000, 1)], cuts=[10], phrases=[5], phrase_words=200, repeat=1
+    )
+    assert report["schema"] == bench.SCHEMA
+    assert sorted(report["cases"]) == [
+        "analyze/200w", "analyze_phrases/5p", "edit/5s-8000hz-1ch", "edit_streaming/5s-8000hz-1ch",
+        "ffmpeg_edit/10cuts", "save_results/200w",
+    ]
+    assert report["cases"]["ffmpeg_edit/10cuts"]["output"]["commands"] == 1
+    json.dumps(report)
+
+    only = bench.run_suite(tmp_path, words=[200], audio=[], cuts=[], phrases=[], repeat=1, only="analyze/*")
+    assert list(only["cases"]) == ["analyze/200w"]
+    assert only["cases"]["analyze/200w"]["output"] == report["cases"]["analyze/200w"]["output"]
+
+
+def test_compare_flags_slowdowns_and_changed_output():
+    """Test that only real slowdowns and changed outputs are reported."""
+    def case(seconds, decisions=10):
+        return {"params": {"words": 1}, "best_seconds": seconds, "median_seconds": seconds, "output": {"decisions": decisions}}
+
+    baseline = {"cases": {"a": case(1.0), "b": case(0.001), "c": case(1.0), "d": case(1.0)}}
+    report = {"cases": {"a": case(1.5), "b": case(0.002), "c": case(1.1, decisions=11), "e": case(9.0)}}
+    problems = bench.compare(report, baseline, tolerance=0.25)
+    assert len(problems) == 2
+    assert problems[0].startswith("a: 1000.0 ms -> 1500.0 ms")
+    assert problems[1].startswith("c: output changed")
@@ -0,0 +1,152 @@
+"""Tests for the transcript cache."""
+
+import fcntl
+import os
+from types import SimpleNamespace
+
+import numpy as np
+import soundfile as sf
+
+from ksu_podcast_editor.cache import TranscriptCache
+from ksu_podcast_editor.models import Segment, Word
+from ksu_podcast_editor.transcriber import Transcriber
+
+
+class FakeModel:
+    """Stands in for WhisperModel and counts transcribe calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def transcribe(self, audio, **kwargs):
+        self.calls += 1
+        word = SimpleNamespace(word=" привет", start=0.0, end=0.5, probability=0.9)
+        segment = SimpleNamespace(start=0.0, end=0.5, text=" привет", words=[word])
+        info = SimpleNamespace(language="ru", language_probability=1.0)
+        return iter([segment]), info
+
+
+def _transcriber(cache: TranscriptCache | None, model: FakeModel) -> Transcriber:
+    transcriber = Transcriber(model_size="tiny", cache=cache)
+    transcriber._model = model
+    return transcriber
+
+
+def test_cache_hit_skips_model(tmp_path):
+    """Test that a second run with the same settings reuses the transcript."""
+    audio = tmp_path / "a.wav"
+    audio.write_bytes(b"RIFF fake audio")
+    cache = TranscriptCache(tmp_path / "cache")
+    model = FakeModel()
+
+    first = _transcriber(cache, model).transcribe(audio, language="ru")
+    second = _transcriber(cache, model).transcribe(audio, language="ru")
+
+    assert model.calls == 1
+    assert second == first
+    assert second[0].words[0].text == "привет"
+
+
+def test_cache_key_depends_on_settings_and_content(tmp_path):
+    """Test that language and audio content changes miss the cache."""
+    audio = tmp_path / "a.wav"
+    audio.write_bytes(b"one")
+    cache = TranscriptCache(tmp_path / "cache")
+    model = FakeModel()
+
+    _transcriber(cache, model).transcribe(audio, language="ru")
+    _transcriber(cache, model).transcribe(audio, language="en")
+    audio.write_bytes(b"two!")
+    _transcriber(cache, model).transcribe(audio, language="ru")
+
+    assert model.calls == 3
+
+
+def test_interrupted_transcription_is_not_cached(tmp_path):
+    """Test that a partially consumed stream leaves only a checkpoint, not a cache entry."""
+    audio = tmp_path / "a.wav"
+    audio.write_bytes(b"audio")
+    cache = TranscriptCache(tmp_path / "cache")
+    model = FakeModel()
+
+    stream = _transcriber(cache, model).iter_segments(audio)
+    next(stream)
+    stream.close()
+
+    assert [p.suffix for p in (tmp_path / "cache").iterdir()] == [".partial"]
+    assert cache.load(cache.key(audio, _transcriber(cache, model).settings())) is None
+
+
+class SecondsModel:
+    """Stands in for WhisperModel with one segment per second of the audio it is given."""
+
+    def __init__(self):
+        self.lengths = []
+
+    def transcribe(self, audio, **kwargs):
+        if isinstance(audio, str):
+            audio, _ = sf.read(audio, dtype="float32")
+        self.lengths.append(len(audio) / 16000)
+
+        def segments():
+            for i in range(len(audio) // 16000):
+                word = SimpleNamespace(word=f" w{i}", start=i + 0.2, end=i + 0.8, probability=0.9)
+                yield SimpleNamespace(start=i + 0.1, end=i + 0.9, text=f" w{i}", words=[word])
+
+        return segments(), SimpleNamespace(language="ru", language_probability=1.0)
+
+
+def test_crashed_transcription_resumes_from_checkpoint(tmp_path):
+    """Test that a rerun keeps checkpointed segments and transcribes only the rest."""
+    audio = tmp_path / "a.wav"
+    sf.write(str(audio), np.zeros(5 * 16000, dtype=np.float32), 16000)
+    cache = TranscriptCache(tmp_path / "cache")
+    expected = _transcriber(None, SecondsModel()).transcribe(audio)
+
+    model = SecondsModel()
+    stream = _transcriber(cache, model).iter_segments(audio)
+    assert [next(stream), next(stream)] == expected[:2]
+    stream.close()
+    # A crash in the middle of writing the third line
+    (partial,) = (tmp_path / "cache").iterdir()
+    with open(partial, "ab") as f:
+        f.write(b'{"start": 2.1, "end"')
+
+    resumed = _transcriber(cache, model).transcribe(audio)
+    assert model.lengths == [5.0, 5.0 - expected[1].end]
+    # The model saw audio from 1.9s on; its timestamps are shifted back into place
+    assert resumed[:2] == expected[:2]
+    shifted = [(round(s.start, 6), round(s.words[0].start, 6)) for s in resumed[2:]]
+    assert shifted == [(2.0, 2.1), (3.0, 3.1), (4.0, 4.1)]
+    assert not partial.exists()
+    assert list(cache.load(cache.key(audio, _transcriber(cache, model).settings()))) == resumed
+
+
+def test_evict_removes_least_recently_used(tmp_path):
+    """Test LRU eviction by size."""
+    cache = TranscriptCache(tmp_path)
+    segment = Segment(start=0.0, end=1.0, words=[Word(text="x" * 40, start=0.0, end=1.0)])
+    for i, key in enumerate(["old", "mid", "new"]):
+        list(cache.store(key, [segment]))
+        os.utime(tmp_path / f"{key}.jsonl", (1000 + i, 1000 + i))
+    cache.max_bytes = 2 * (tmp_path / "new.jsonl").stat().st_size
+
+    cache.evict()
+
+    assert sorted(p.stem for p in tmp_path.glob("*.jsonl")) == ["mid", "new"]
+
+
+def test_evict_keeps_checkpoints_in_use(tmp_path):
+    """Test that eviction skips a checkpoint another run holds locked, but removes abandoned ones."""
+    cache = TranscriptCache(tmp_path, max_bytes=0)
+    held, abandoned = tmp_path / "held.jsonl.partial", tmp_path / "abandoned.jsonl.partial"
+    for path in (held, abandoned):
+        path.write_text('{"start": 0.0, "end": 1.0, "words": [], "text": ""}\n')
+
+    with open(held, "a+b") as f:
+        fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        cache.evict()
+        assert held.exists() and not abandoned.exists()
+
+    cache.evict()
+    assert not held.exists()
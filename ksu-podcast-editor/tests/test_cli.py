@@ -0,0 +1,109 @@
+"""Tests for the command-line interface."""
+
+import av
+import numpy as np
+import pytest
+import soundfile as sf
+from typer.testing import CliRunner
+
+from ksu_podcast_editor import cli
+from ksu_podcast_editor.audio import AudioSource
+from ksu_podcast_editor.models import Segment, Word
+
+
+class FakeTranscriber:
+    """Serves a fixed transcript with a repeated phrase and a stutter."""
+
+    def iter_segments(self, audio_path, language=None):
+        words = [
+            Word(text=text, start=start, end=start + 0.3, confidence=0.9)
+            for text, start in [
+                ("я", 0.0), ("думаю", 0.4), ("я", 0.8), ("думаю", 1.2), ("что", 1.6),
+                ("пре-", 2.0), ("предлагаю", 2.4), ("идти", 2.8),
+            ]
+        ]
+        yield Segment(start=0.0, end=3.1, words=words, text=" ".join(w.text for w in words))
+
+    def record(self, language=None):
+        return {"profile": "fake"}
+
+
+@pytest.mark.parametrize("ext", ["json", "jsonl", "csv", "txt"])
+def test_analyze_decisions_do_not_depend_on_output_format(tmp_path, monkeypatch, ext):
+    """Test that every output format finds phrase repeats and stutters and plans the same cuts."""
+    audio = tmp_path / "episode.wav"
+    sf.write(str(audio), np.zeros(4 * 8000, dtype=np.float32), 8000)
+    monkeypatch.setattr(cli, "_make_transcriber", lambda *args, **kwargs: FakeTranscriber())
+
+    result = CliRunner().invoke(cli.app, [
+        "analyze", str(audio), "-o", str(tmp_path / f"results.{ext}"),
+        "--cuts-csv", str(tmp_path / "cuts.csv"), "--pad-ms", "0",
+    ])
+
+    assert result.exit_code == 0, result.output
+    assert "Found 2 items to remove" in result.output
+    assert (tmp_path / "cuts.csv").read_text().splitlines() == [
+        "0.800,1.500,REPEAT: я думаю",
+        "2.000,2.300,REPEAT: пре-",
+    ]
+
+
+def test_stream_edit_does_not_decode_the_input(tmp_path, monkeypatch):
+    """Test that with a transcript that needs no samples, --stream reads the file block by block."""
+    audio = tmp_path / "episode.wav"
+    sf.write(str(audio), np.zeros(4 * 8000, dtype=np.float32), 8000)
+    monkeypatch.setattr(cli, "_make_transcriber", lambda *args, **kwargs: FakeTranscriber())
+    decodes = []
+    decode = AudioSource._decode
+    monkeypatch.setattr(AudioSource, "_decode", lambda self: decodes.append(1) or decode(self))
+
+    result = CliRunner().invoke(cli.app, ["edit", str(audio), str(tmp_path / "out.wav"), "--stream"])
+
+    assert result.exit_code == 0, result.output
+    assert decodes == []
+    assert sf.info(str(tmp_path / "out.wav")).duration == pytest.approx(4 - 0.7 - 0.3, abs=0.05)
+
+
+def _write_m4a(path, seconds: float, samplerate: int = 16000) -> None:
+    """Write AAC in an MP4 container, which libsndfile cannot open."""
+    data = np.random.default_rng(0).uniform(-0.1, 0.1, int(seconds * samplerate)).astype(np.float32)
+    with av.open(str(path), "w") as container:
+        stream = container.add_stream("aac", rate=samplerate)
+        stream.layout = "mono"
+        for start in range(0, len(data), 1024):
+            frame = av.AudioFrame.from_ndarray(data[None, start:start + 1024], format="flt", layout="mono")
+            frame.sample_rate = samplerate
+            container.mux(stream.encode(frame))
+        container.mux(stream.encode(None))
+
+
+@pytest.mark.parametrize("mode", ["--stream", "--incremental"])
+def test_edit_reads_containers_libsndfile_cannot_open(tmp_path, monkeypatch, mode):
+    """Test that with a transcript that needs no samples, an .m4a input is decoded instead of opened."""
+    audio = tmp_path / "episode.m4a"
+    _write_m4a(audio, 4.0)
+    monkeypatch.setattr(cli, "_make_transcriber", lambda *args, **kwargs: FakeTranscriber())
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+    with AudioSource(audio) as source:
+        duration = source.duration
+
+    result = CliRunner().invoke(cli.app, ["edit", str(audio), str(tmp_path / "out.wav"), mode])
+
+    assert result.exit_code == 0, result.output
+    assert sf.info(str(tmp_path / "out.wav")).duration == pytest.approx(duration - 0.7 - 0.3, abs=0.05)
+
+
+def test_multitrack_reads_containers_libsndfile_cannot_open(tmp_path, monkeypatch):
+    """Test that undecoded .m4a stems are decoded for rendering while .wav stems are streamed."""
+    _write_m4a(tmp_path / "host.m4a", 4.0)
+    sf.write(str(tmp_path / "guest.wav"), np.zeros(4 * 16000, dtype=np.float32), 16000)
+    monkeypatch.setattr(cli, "_make_transcriber", lambda *args, **kwargs: FakeTranscriber())
+
+    result = CliRunner().invoke(cli.app, [
+        "multitrack", str(tmp_path / "host.m4a"), str(tmp_path / "guest.wav"), "-o", str(tmp_path / "out"),
+    ])
+
+    assert result.exit_code == 0, result.output
+    assert (tmp_path / "out" / "host.wav").exists()
+    assert (tmp_path / "out" / "guest.wav").exists()
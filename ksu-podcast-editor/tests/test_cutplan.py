@@ -0,0 +1,56 @@
+"""Tests for cut planning."""
+
+import numpy as np
+
+from ksu_podcast_editor.cutplan import CutPlanner, nearest_zero_crossing
+from ksu_podcast_editor.models import EditDecision
+
+
+def _cut(start: float, end: float, reason: str = "filler", text: str = "") -> EditDecision:
+    return EditDecision(start=start, end=end, reason=reason, original_text=text)
+
+
+def test_plan_merges_within_gap_tolerance():
+    """Test that near-adjacent cuts merge and keep their labels."""
+    decisions = [_cut(2.0, 2.5, "repetition", "мы"), _cut(1.0, 1.5, text="э"), _cut(1.52, 1.8, text="ну")]
+    cuts = CutPlanner(merge_gap=0.05).plan(decisions, 10.0)
+    assert [(c.start, c.end, c.reason, c.original_text) for c in cuts] == [
+        (1.0, 1.8, "filler", "э ну"),
+        (2.0, 2.5, "repetition", "мы"),
+    ]
+
+
+def test_plan_pads_and_clamps():
+    """Test padding, merging of padded overlaps and clamping to the file."""
+    decisions = [_cut(0.05, 0.3), _cut(0.45, 0.6, "repetition"), _cut(9.95, 10.0)]
+    cuts = CutPlanner(pre_pad=0.1, post_pad=0.1).plan(decisions, 10.0)
+    assert [(round(c.start, 6), round(c.end, 6), c.reason) for c in cuts] == [
+        (0.0, 0.7, "filler+repetition"),
+        (9.85, 10.0, "filler"),
+    ]
+
+
+def test_keep_frames_are_sample_accurate():
+    """Test that boundaries are rounded to the nearest frame, not truncated."""
+    planner = CutPlanner()
+    assert planner.keep_frames([_cut(0.0012345, 0.002)], 480, 48000) == [(0, 59), (96, 480)]
+    assert planner.keep_frames([_cut(0.1, 0.2), _cut(0.15, 0.3), _cut(0.5, 0.7)], 1000, 1000) == [
+        (0, 100), (300, 500), (700, 1000),
+    ]
+
+
+def test_snap_to_zero_crossings():
+    """Test that boundaries move to the nearest sign change."""
+    samplerate = 1000
+    # Sign changes between frames 49/50, 99/100, ...
+    data = np.sin(2 * np.pi * 10 * (np.arange(1000) + 0.5) / samplerate)[:, None]
+    planner = CutPlanner(snap_window=0.02)
+    intervals = planner.keep_frames(
+        [_cut(0.243, 0.41)], 1000, samplerate, read=lambda start, count: data[start:start + count]
+    )
+    assert intervals == [(0, 250), (400, 1000)]
+
+
+def test_nearest_zero_crossing_without_crossing():
+    """Test that a signal without sign changes has no crossing."""
+    assert nearest_zero_crossing(np.ones(10), 5) is None
@@ -0,0 +1,91 @@
+"""Tests for audio editing."""
+
+import numpy as np
+import soundfile as sf
+
+from ksu_podcast_editor import metrics
+from ksu_podcast_editor.cache import RenderCache
+from ksu_podcast_editor.cutplan import CutPlanner
+from ksu_podcast_editor.editor import Editor, splice
+from ksu_podcast_editor.models import EditDecision
+
+
+def _cut(start: float, end: float) -> EditDecision:
+    return EditDecision(start=start, end=end, reason="filler")
+
+
+def test_splice_without_fade_concatenates():
+    """Test hard cuts produce exactly the kept frames."""
+    data = np.arange(10, dtype=np.float32)[:, None]
+    out = splice(data, [(0, 3), (5, 7)], fade=0)
+    assert out[:, 0].tolist() == [0, 1, 2, 5, 6]
+
+
+def test_splice_equal_power_crossfade():
+    """Test that a crossfade overlaps the join and keeps constant power."""
+    data = np.ones((100, 2), dtype=np.float32)
+    out = splice(data, [(0, 40), (60, 100)], fade=10)
+    assert out.shape == (70, 2)
+    # Equal-power gains (cos + sin >= 1) boost identical signals mid-fade
+    assert np.all(out[30:40] >= 1.0 - 1e-6)
+    assert np.allclose(out[:30], 1.0) and np.allclose(out[40:], 1.0)
+
+
+def test_edit_writes_output(tmp_path):
+    """Test a full edit round trip keeps format and removes the cut."""
+    samplerate = 8000
+    data = (np.sin(np.arange(samplerate) / 10) * 0.5).astype(np.float32)
+    input_path = tmp_path / "in.wav"
+    output_path = tmp_path / "out.wav"
+    sf.write(input_path, data, samplerate, subtype="PCM_16")
+
+    Editor(crossfade_ms=0).edit(input_path, output_path, [_cut(0.25, 0.5)])
+
+    info = sf.info(output_path)
+    assert info.subtype == "PCM_16"
+    assert info.frames == samplerate - 2000
+
+
+def test_edit_streaming_matches_edit(tmp_path):
+    """Test that the block-wise editor produces the in-memory result."""
+    samplerate = 16000
+    rng = np.random.default_rng(0)
+    data = rng.uniform(-0.5, 0.5, (samplerate * 2, 2)).astype(np.float32)
+    input_path = tmp_path / "in.wav"
+    sf.write(input_path, data, samplerate, subtype="FLOAT")
+    decisions = [_cut(0.1, 0.2), _cut(0.2004, 0.25), _cut(0.9, 1.3), _cut(1.95, 2.5)]
+
+    editor = Editor(crossfade_ms=10, block_frames=1000)
+    editor.edit(input_path, tmp_path / "memory.wav", decisions)
+    editor.edit_streaming(input_path, tmp_path / "stream.wav", decisions)
+
+    expected, _ = sf.read(tmp_path / "memory.wav", dtype="float32")
+    actual, _ = sf.read(tmp_path / "stream.wav", dtype="float32")
+    assert actual.shape == expected.shape
+    assert np.allclose(actual, expected, atol=1e-6)
+
+
+def test_incremental_edit_reuses_unchanged_fragments(tmp_path):
+    """Test that a render cache gives identical output and re-reads only changed intervals."""
+    samplerate = 8000
+    rng = np.random.default_rng(0)
+    input_path = tmp_path / "in.wav"
+    sf.write(input_path, (rng.standard_normal((5 * samplerate, 2)) * 0.1).astype(np.float32), samplerate)
+    decisions = [_cut(0.5, 0.7), _cut(2.0, 2.2), _cut(4.0, 4.1)]
+    cache = RenderCache(tmp_path / "renders")
+
+    def render(name, decisions):
+        with metrics.recording() as recorder:
+            Editor(cache=cache, planner=CutPlanner(snap_window=0.005)).edit(input_path, tmp_path / name, decisions)
+        (record,) = [r for r in recorder.records if r["stage"] == "render"]
+        return record["attributes"]
+
+    assert render("first.wav", decisions) == {"mode": "incremental", "fragments": 4, "reused": 0}
+    Editor(planner=CutPlanner(snap_window=0.005)).edit(input_path, tmp_path / "plain.wav", decisions)
+    assert (tmp_path / "first.wav").read_bytes() == (tmp_path / "plain.wav").read_bytes()
+
+    # Moving the last cut only changes the two intervals around it
+    moved = decisions[:2] + [_cut(4.2, 4.3)]
+    assert render("second.wav", moved) == {"mode": "incremental", "fragments": 4, "reused": 2}
+    Editor(planner=CutPlanner(snap_window=0.005)).edit(input_path, tmp_path / "plain.wav", moved)
+    assert (tmp_path / "second.wav").read_bytes() == (tmp_path / "plain.wav").read_bytes()
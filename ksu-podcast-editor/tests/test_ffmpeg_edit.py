@@ -0,0 +1,77 @@
+"""Tests for the single-pass ffmpeg renderer script."""
+
+import importlib.util
+import random
+from pathlib import Path
+
+import pytest
+
+from ksu_podcast_editor.cutplan import CutPlanner
+from ksu_podcast_editor.models import EditDecision
+
+_SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "ffmpeg_edit.py"
+_spec = importlib.util.spec_from_file_location("ffmpeg_edit", _SCRIPT)
+ffmpeg_edit = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(ffmpeg_edit)
+
+
+@pytest.fixture
+def ffmpeg_calls(monkeypatch):
+    """Record ffmpeg command lines instead of running them."""
+    calls = []
+    monkeypatch.setattr(ffmpeg_edit.subprocess, "run", lambda cmd, **kwargs: calls.append(cmd))
+    return calls
+
+
+CUTS = [{"start": 5.0, "end": 6.0}, {"start": 1.0, "end": 2.0}, {"start": 1.5, "end": 2.5}]
+
+
+def test_keep_intervals():
+    """Test that cuts merge into sorted keep intervals."""
+    assert ffmpeg_edit.keep_intervals(CUTS, 10.0) == [(0.0, 1.0), (2.5, 5.0), (6.0, 10.0)]
+
+
+def test_keep_intervals_match_cut_planner():
+    """Test that the script's own planning agrees with the package's CutPlanner."""
+    rng = random.Random(0)
+    for _ in range(200):
+        cuts = [{"start": (start := rng.uniform(-0.5, 10.0)), "end": start + rng.uniform(-0.1, 1.0)} for _ in range(8)]
+        merge_gap, pad = rng.choice([0.0, 0.05, 0.3]), rng.choice([0.0, 0.02, 0.2])
+        planner = CutPlanner(merge_gap=merge_gap, pre_pad=pad, post_pad=pad)
+        decisions = [EditDecision(start=c["start"], end=c["end"], reason="cut") for c in cuts]
+        expected = planner.keep_intervals(decisions, 10.0)
+        assert ffmpeg_edit.keep_intervals(cuts, 10.0, merge_gap, pad) == expected
+
+
+def test_single_pass(ffmpeg_calls, tmp_path):
+    """Test that all cuts are rendered by one ffmpeg invocation."""
+    ffmpeg_edit.edit_audio(tmp_path / "in.wav", tmp_path / "out.wav", CUTS, duration=10.0)
+
+    assert len(ffmpeg_calls) == 1
+    graph = ffmpeg_calls[0][ffmpeg_calls[0].index("-filter_complex") + 1]
+    assert "asplit=3" in graph
+    assert "atrim=start=2.500000:end=5.000000" in graph
+    assert "atrim=start=6.000000," in graph
+    assert graph.endswith("concat=n=3:v=0:a=1[out]")
+
+
+def test_crossfade_joins(ffmpeg_calls, tmp_path):
+    """Test acrossfade at joins, with hard cuts where an interval is too short."""
+    cuts = [{"start": 1.0, "end": 2.0}, {"start": 2.01, "end": 3.0}]
+    ffmpeg_edit.edit_audio(tmp_path / "in.wav", tmp_path / "out.wav", cuts, crossfade_ms=20, duration=4.0)
+
+    graph = ffmpeg_calls[0][ffmpeg_calls[0].index("-filter_complex") + 1]
+    assert "[k0][k1]concat=n=2:v=0:a=1[j1]" in graph
+    assert "[j1][k2]acrossfade=d=0.020000:c1=qsin:c2=qsin[out]" in graph
+
+
+def test_large_cut_lists_are_chunked(ffmpeg_calls, tmp_path):
+    """Test that many intervals are rendered in groups and then joined."""
+    cuts = [{"start": i + 0.5, "end": i + 0.6} for i in range(9)]
+    ffmpeg_edit.edit_audio(tmp_path / "in.wav", tmp_path / "out.wav", cuts, duration=10.0, max_intervals=4)
+
+    assert len(ffmpeg_calls) == 4  # 10 intervals -> 3 groups + 1 join
+    assert ffmpeg_calls[1][ffmpeg_calls[1].index("-ss") + 1] == "3.600000"
+    join = ffmpeg_calls[-1]
+    assert join.count("-i") == 3
+    assert join[join.index("-filter_complex") + 1] == "[0:a][1:a][2:a]concat=n=3:v=0:a=1[out]"
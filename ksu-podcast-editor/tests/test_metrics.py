@@ -0,0 +1,111 @@
+"""Tests for stage instrumentation."""
+
+import json
+import time
+
+import pytest
+
+from ksu_podcast_editor import metrics
+from ksu_podcast_editor.analyzer import Analyzer
+from ksu_podcast_editor.models import Segment, Word
+
+
+def test_stages_are_noops_without_recorder():
+    """Test that stages yield None and timed passes items through when nothing records."""
+    assert not metrics.active()
+    with metrics.stage("analyze") as span:
+        assert span is None
+    assert list(metrics.timed("asr", iter([1, 2, 3]))) == [1, 2, 3]
+
+
+def test_nested_stages_record_parent_and_rtf():
+    """Test that an inner stage points at the outer one and audio seconds give an RTF."""
+    with metrics.recording() as recorder:
+        with metrics.stage("render", audio_seconds=10.0) as outer:
+            with metrics.stage("decode"):
+                pass
+            outer.set(cuts=3)
+
+    decode, render = recorder.records
+    assert decode["stage"] == "decode" and render["stage"] == "render"
+    assert decode["parent_id"] == render["span_id"]
+    assert render["parent_id"] is None
+    assert decode["trace_id"] == render["trace_id"] == recorder.trace_id
+    assert render["attributes"] == {"cuts": 3}
+    assert render["rtf"] == pytest.approx(render["wall_seconds"] / 10.0, abs=1e-6)
+    assert render["peak_rss_bytes"] > 0
+    assert decode["rtf"] is None
+
+
+def test_timed_counts_only_producer_time():
+    """Test that time the consumer spends between items is not charged to the stage."""
+    def produce():
+        for i in range(3):
+            time.sleep(0.01)
+            yield i
+
+    with metrics.recording() as recorder:
+        for _ in metrics.timed("asr", produce(), audio_seconds=1.0):
+            time.sleep(0.05)
+
+    (record,) = recorder.records
+    assert record["attributes"]["items"] == 3
+    assert 0.03 <= record["wall_seconds"] < 0.1
+    assert record["status"] == "ok"
+
+
+def test_timed_stopped_early_is_not_an_error():
+    """Test that a consumer breaking out of a timed stage still records it as ok."""
+    with metrics.recording() as recorder:
+        for _ in metrics.timed("asr", iter(range(10))):
+            break
+    (record,) = recorder.records
+    assert record["status"] == "ok" and record["attributes"]["items"] == 1
+
+
+def test_failed_stage_is_recorded():
+    """Test that an exception marks the stage as an error and still propagates."""
+    with metrics.recording() as recorder:
+        with pytest.raises(RuntimeError):
+            with metrics.stage("decode"):
+                raise RuntimeError("bad file")
+    (record,) = recorder.records
+    assert record["status"] == "error" and record["error"] == "bad file"
+
+
+def test_analyzer_stage_attributes():
+    """Test that analysis reports its word count, decisions and audio length."""
+    words = [Word(text=t, start=i * 0.5, end=i * 0.5 + 0.4, confidence=0.9) for i, t in enumerate(["ну", "это", "это", "так"])]
+    segments = [Segment(start=0.0, end=2.0, text="ну это это так", words=words)]
+
+    with metrics.recording() as recorder:
+        decisions = Analyzer(language="ru").analyze(segments)
+
+    (record,) = recorder.records
+    assert record["stage"] == "analyze"
+    assert record["audio_seconds"] == pytest.approx(1.9)
+    assert record["attributes"] == {"words": 4, "decisions": len(decisions)}
+
+
+def test_write_formats(tmp_path):
+    """Test JSON, appended JSONL and OTLP-style span output."""
+    with metrics.recording() as recorder:
+        with metrics.stage("export", format="json"):
+            pass
+
+    recorder.write(tmp_path / "m.json")
+    document = json.loads((tmp_path / "m.json").read_text())
+    assert document["trace_id"] == recorder.trace_id
+    assert [s["stage"] for s in document["stages"]] == ["export"]
+
+    recorder.write(tmp_path / "m.jsonl")
+    recorder.write(tmp_path / "m.jsonl")
+    assert len((tmp_path / "m.jsonl").read_text().splitlines()) == 2
+
+    recorder.write_spans(tmp_path / "trace.jsonl")
+    (span,) = [json.loads(line) for line in (tmp_path / "trace.jsonl").read_text().splitlines()]
+    assert span["name"] == "export" and span["traceId"] == recorder.trace_id
+    assert span["parentSpanId"] == "" and span["status"] == {"code": 1}
+    attributes = {a["key"]: a["value"] for a in span["attributes"]}
+    assert attributes["format"] == {"stringValue": "json"}
+    assert "doubleValue" in attributes["stage.wall_seconds"]
@@ -0,0 +1,103 @@
+"""Tests for multitrack editing."""
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from ksu_podcast_editor import metrics
+from ksu_podcast_editor.analyzer import Analyzer
+from ksu_podcast_editor.audio import AudioSource
+from ksu_podcast_editor.editor import Editor
+from ksu_podcast_editor.models import EditDecision, Segment, Word
+from ksu_podcast_editor.multitrack import MultitrackEditor, union_decisions, write_mixdown
+from ksu_podcast_editor.transcript import Transcript
+
+
+def _transcript(words: list[tuple[str, float, float]]) -> Transcript:
+    segment = Segment(
+        start=words[0][1],
+        end=words[-1][2],
+        words=[Word(text=text, start=start, end=end) for text, start, end in words],
+        text=" ".join(text for text, _, _ in words),
+    )
+    return Transcript.from_segments([segment])
+
+
+def _stem(path, seconds: float, samplerate: int, gain: float, channels: int = 1) -> np.ndarray:
+    rng = np.random.default_rng(int(gain * 100))
+    data = (gain * rng.uniform(-0.5, 0.5, (int(seconds * samplerate), channels))).astype(np.float32)
+    sf.write(str(path), data, samplerate, subtype="FLOAT")
+    return data
+
+
+def test_union_keeps_cuts_that_are_safe_for_every_stem():
+    """Test that one speaker's filler is cut unless another speaker is talking over it."""
+    host = _transcript([("ну", 0.0, 0.4), ("привет", 0.5, 1.0), ("ну", 2.0, 2.4), ("пока", 2.5, 3.0)])
+    guest = _transcript([("да", 2.1, 2.3), ("согласен", 3.5, 4.0)])
+    decisions = union_decisions([host, guest], Analyzer(language="ru"))
+    assert [(d.start, d.end) for d in decisions] == [(0.0, 0.4)]
+
+
+def test_union_ignores_words_the_other_stem_cuts_too():
+    """Test that overlapping fillers on both stems are both cut."""
+    host = _transcript([("ну", 1.0, 1.4), ("привет", 1.5, 2.0)])
+    guest = _transcript([("эээ", 1.1, 1.5), ("здравствуйте", 2.5, 3.0)])
+    decisions = union_decisions([host, guest], Analyzer(language="ru"))
+    assert [(d.start, d.end) for d in decisions] == [(1.0, 1.4), (1.1, 1.5)]
+
+
+def test_stems_are_cut_at_the_same_frames(tmp_path):
+    """Test that every stem gets the same keep-list and stays aligned after editing."""
+    samplerate = 8000
+    first = _stem(tmp_path / "a.wav", 3.0, samplerate, gain=1.0)
+    second = _stem(tmp_path / "b.wav", 3.2, samplerate, gain=0.5, channels=2)
+    decisions = [EditDecision(start=0.5, end=0.9, reason="filler"), EditDecision(start=2.0, end=2.3, reason="filler")]
+    outputs = [tmp_path / "out" / "a.wav", tmp_path / "out" / "b.wav"]
+    outputs[0].parent.mkdir()
+
+    with metrics.recording() as recorder:
+        intervals = MultitrackEditor(Editor(crossfade_ms=0, block_frames=1000)).edit(
+            [tmp_path / "a.wav", tmp_path / "b.wav"], outputs, decisions
+        )
+
+    assert intervals == [(0, 4000), (7200, 16000), (18400, 24000)]
+    edited = [sf.read(str(path), dtype="float32", always_2d=True)[0] for path in outputs]
+    keep = np.concatenate([np.arange(start, end) for start, end in intervals])
+    assert np.array_equal(edited[0], first[keep])
+    assert np.array_equal(edited[1], second[keep])
+    (parent,) = [r["span_id"] for r in recorder.records if r["stage"] == "multitrack"]
+    assert [r["parent_id"] for r in recorder.records if r["stage"] == "render"] == [parent, parent]
+
+
+def test_render_matches_streaming_edit(tmp_path):
+    """Test that rendering a planned keep-list writes the same file as edit_streaming."""
+    samplerate = 8000
+    _stem(tmp_path / "a.wav", 2.0, samplerate, gain=1.0)
+    decisions = [EditDecision(start=0.5, end=0.9, reason="filler")]
+    editor = Editor(block_frames=500)
+    editor.edit_streaming(tmp_path / "a.wav", tmp_path / "streamed.wav", decisions)
+    intervals = MultitrackEditor(editor).keep_frames([tmp_path / "a.wav"], decisions)
+    with AudioSource(tmp_path / "a.wav") as source:
+        editor.render(source, tmp_path / "rendered.wav", intervals)
+    assert (tmp_path / "rendered.wav").read_bytes() == (tmp_path / "streamed.wav").read_bytes()
+
+
+def test_stems_must_share_a_sample_rate(tmp_path):
+    """Test that stems recorded at different rates are rejected."""
+    _stem(tmp_path / "a.wav", 1.0, 8000, gain=1.0)
+    _stem(tmp_path / "b.wav", 1.0, 16000, gain=1.0)
+    with pytest.raises(ValueError, match="sample rate"):
+        MultitrackEditor().edit(
+            [tmp_path / "a.wav", tmp_path / "b.wav"], [tmp_path / "x.wav", tmp_path / "y.wav"], []
+        )
+
+
+def test_mixdown_averages_every_channel(tmp_path):
+    """Test that the mix is the mean of all stems' channels, as long as the shortest stem."""
+    first = _stem(tmp_path / "a.wav", 1.0, 8000, gain=1.0)
+    second = _stem(tmp_path / "b.wav", 1.5, 8000, gain=0.5, channels=2)
+    write_mixdown([tmp_path / "a.wav", tmp_path / "b.wav"], tmp_path / "mix.wav", block_frames=3000)
+    mix, samplerate = sf.read(str(tmp_path / "mix.wav"), dtype="float32")
+    expected = (first[:, 0] + second[:8000].sum(axis=1)) / 3
+    assert samplerate == 8000
+    assert np.allclose(mix, expected, atol=1e-6)
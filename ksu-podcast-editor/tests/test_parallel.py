@@ -0,0 +1,31 @@
+"""Tests for chunk planning and stitching in parallel transcription."""
+
+from ksu_podcast_editor.models import Segment, Word
+from ksu_podcast_editor.parallel import Chunk, plan_chunks, stitch
+
+
+def test_plan_chunks_cuts_in_silences():
+    """Test that chunk boundaries fall in the middle of gaps."""
+    speech = [(0.0, 90.0), (92.0, 250.0), (254.0, 400.0)]
+    chunks = plan_chunks(speech, 400.0, target_s=150.0, overlap_s=1.0)
+    assert [(c.keep_start, c.keep_end) for c in chunks] == [(0.0, 252.0), (252.0, 400.0)]
+    assert chunks[0].end == 253.0 and chunks[1].start == 251.0
+
+
+def test_plan_chunks_forces_cuts_in_long_speech():
+    """Test that continuous speech is still split."""
+    chunks = plan_chunks([(0.0, 1000.0)], 1000.0, target_s=300.0, overlap_s=2.0)
+    assert [c.keep_start for c in chunks] == [0.0, 300.0, 600.0]
+    assert chunks[-1].keep_end == 1000.0
+
+
+def test_stitch_drops_overlap_duplicates():
+    """Test that words from the overlap are kept by exactly one chunk."""
+    words = [Word(text=t, start=s, end=s + 0.4) for t, s in [("a", 9.0), ("b", 9.8), ("c", 10.5)]]
+    segments = [Segment(start=9.0, end=10.9, words=words, text="a b c")]
+    left = stitch(Chunk(start=0.0, end=12.0, keep_start=0.0, keep_end=10.0), segments)
+    right = stitch(Chunk(start=8.0, end=20.0, keep_start=10.0, keep_end=20.0), segments)
+
+    assert [w.text for s in left for w in s.words] == ["a"]
+    assert [w.text for s in right for w in s.words] == ["b", "c"]
+    assert right[0].text == "b c" and right[0].start == 9.8
@@ -0,0 +1,70 @@
+"""Tests for header-only audio probing."""
+
+import struct
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from ksu_podcast_editor import probe
+
+# MPEG1 Layer III, 128 kbps, 44.1 kHz, stereo, no padding: 417-byte frames
+_HEADER = bytes([0xFF, 0xFB, 0x90, 0x00])
+_FRAME_LEN = 417
+
+
+def _write_mp3(path, frames: int, xing_frames: int | None = None) -> None:
+    body = bytearray()
+    if xing_frames is not None:
+        first = bytearray(_HEADER + bytes(_FRAME_LEN - 4))
+        first[36:48] = b"Xing" + struct.pack(">II", 1, xing_frames)
+        body += first
+    for _ in range(frames):
+        body += _HEADER + bytes(_FRAME_LEN - 4)
+    path.write_bytes(b"ID3\x03\x00\x00\x00\x00\x00\x0a" + bytes(10) + bytes(body))
+
+
+def test_wav_duration(tmp_path):
+    """Test WAV duration from the header."""
+    path = tmp_path / "a.wav"
+    sf.write(path, np.zeros(24000, dtype=np.float32), 16000)
+    assert probe.get_duration(path) == 1.5
+
+
+def test_mp3_duration_by_frame_scan(tmp_path):
+    """Test MP3 duration by walking frame headers."""
+    path = tmp_path / "a.mp3"
+    _write_mp3(path, frames=100)
+    assert abs(probe.get_duration(path) - 100 * 1152 / 44100) < 1e-9
+
+
+def test_mp3_duration_from_xing_header(tmp_path):
+    """Test MP3 duration from the Xing frame count."""
+    path = tmp_path / "a.mp3"
+    _write_mp3(path, frames=10, xing_frames=5000)
+    assert abs(probe.get_duration(path) - 5000 * 1152 / 44100) < 1e-9
+
+
+@pytest.mark.skipif("MP3" not in sf.available_formats(), reason="libsndfile without MP3")
+def test_mp3_duration_matches_decoder(tmp_path):
+    """Test that LAME gapless info gives the decoded length."""
+    path = tmp_path / "a.mp3"
+    sf.write(path, np.zeros((44100 * 3 + 123, 2), dtype=np.float32), 44100, format="MP3")
+    assert probe.get_duration(path) == sf.info(str(path)).duration
+
+
+def test_duration_is_cached_until_file_changes(tmp_path, monkeypatch):
+    """Test that the probe is cached per path, mtime and size."""
+    path = tmp_path / "a.wav"
+    sf.write(path, np.zeros(8000, dtype=np.float32), 8000)
+    calls = []
+    real_info = sf.info
+    monkeypatch.setattr(probe.sf, "info", lambda p: calls.append(p) or real_info(p))
+
+    assert probe.get_duration(path) == 1.0
+    assert probe.get_duration(path) == 1.0
+    assert len(calls) == 1
+
+    sf.write(path, np.zeros(16000, dtype=np.float32), 8000)
+    assert probe.get_duration(path) == 2.0
+    assert len(calls) == 2
@@ -0,0 +1,52 @@
+"""Tests for transcription profiles."""
+
+import pytest
+
+from ksu_podcast_editor.profiles import PROFILES, TranscriptionProfile, get_profile, load_profiles
+from ksu_podcast_editor.transcriber import Transcriber
+
+
+def test_default_profile_keeps_library_defaults():
+    """Test that the default profile adds no decoding options, so cache keys are unchanged."""
+    transcriber = Transcriber(model_size="tiny")
+    assert transcriber.settings("ru")["options"] == {"word_timestamps": True}
+    assert transcriber.compute_type == "auto"
+
+
+def test_profile_options_reach_transcriber():
+    """Test that a preset sets compute type, model and decoding options."""
+    transcriber = Transcriber(model_size="tiny", profile=PROFILES["fast-cpu"])
+    options = transcriber.settings("ru")["options"]
+    assert options["beam_size"] == 1 and options["vad_filter"] is True
+    assert options["condition_on_previous_text"] is False
+    assert transcriber.settings("ru")["compute_type"] == "int8"
+    assert PROFILES["batch-throughput"].model_options() == {"compute_type": "int8", "cpu_threads": 2, "num_workers": 4}
+    assert transcriber.record("ru")["profile"] == "fast-cpu"
+
+
+def test_config_file_profiles(tmp_path):
+    """Test that config profiles extend a base and the config can pick the default."""
+    config = tmp_path / "profiles.toml"
+    config.write_text('profile = "overnight"\n\n[profiles.overnight]\nbase = "fast-cpu"\ncpu_threads = 16\n')
+
+    profile = get_profile(config_path=config)
+    assert profile.name == "overnight"
+    assert profile.cpu_threads == 16 and profile.beam_size == 1
+    assert get_profile("accurate", config).compute_type == "float32"
+    assert set(PROFILES) < set(load_profiles(config))
+
+
+def test_config_errors(tmp_path, monkeypatch):
+    """Test that typos and unknown profiles are reported."""
+    config = tmp_path / "profiles.toml"
+    config.write_text("[profiles.bad]\nbeam = 3\n")
+    with pytest.raises(ValueError):
+        load_profiles(config)
+    with pytest.raises(FileNotFoundError):
+        load_profiles(tmp_path / "missing.toml")
+
+    # Without an explicit path a missing config file just means built-ins only
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "empty"))
+    assert get_profile() == TranscriptionProfile()
+    with pytest.raises(ValueError, match="Unknown profile"):
+        get_profile("nope")
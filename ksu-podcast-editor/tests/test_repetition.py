@@ -0,0 +1,88 @@
+"""Tests for repetition and stutter detection."""
+
+import time
+
+import numpy as np
+
+from ksu_podcast_editor.analyzer import Analyzer
+from ksu_podcast_editor.models import Segment, Word
+from ksu_podcast_editor.repetition import Repetition, RepetitionDetector
+from ksu_podcast_editor.transcript import Transcript
+
+
+def _transcript(text: str, gaps: dict[int, float] | None = None, confidence: dict[int, float] | None = None):
+    """Build a transcript of 0.3 s words with 0.1 s pauses, overridable per word."""
+    words, t = [], 0.0
+    for i, token in enumerate(text.split()):
+        t += (gaps or {}).get(i, 0.1)
+        words.append(Word(text=token, start=t, end=t + 0.3, confidence=(confidence or {}).get(i, 1.0)))
+        t += 0.3
+    return Transcript.from_segments([Segment(start=0.0, end=t, words=words, text=text)])
+
+
+def _find(transcript: Transcript, **kwargs) -> list[Repetition]:
+    return RepetitionDetector(**kwargs).find(
+        transcript.token_ids, transcript.tokens, transcript.start, transcript.end, transcript.confidence
+    )
+
+
+def test_ngram_repeat():
+    """Test that a repeated phrase is found as one repeat, not word by word."""
+    found = _find(_transcript("я думаю я думаю что да"))
+    assert found == [Repetition(copies=(0, 2), length=2, keep=0, kind="repeat")]
+
+
+def test_chain_of_repeats():
+    """Test that several copies form one chain with all but one dropped."""
+    found = _find(_transcript("мы мы мы пошли"))
+    assert found == [Repetition(copies=(0, 1, 2), length=1, keep=0, kind="repeat")]
+    assert found[0].dropped == [1, 2]
+
+
+def test_keep_most_confident_copy():
+    """Test that the copy recognised with higher confidence is kept."""
+    found = _find(_transcript("я думаю я думаю", confidence={0: 0.4, 1: 0.5}))
+    assert found[0].keep == 1
+    assert found[0].dropped == [0]
+
+
+def test_long_pause_is_deliberate():
+    """Test that a repeat after a long pause is not cut."""
+    assert _find(_transcript("нет нет", gaps={1: 1.5})) == []
+    assert len(_find(_transcript("нет нет", gaps={1: 0.2}))) == 1
+
+
+def test_stutter():
+    """Test that broken-off fragments are cut and the full word kept."""
+    found = _find(_transcript("я п- пре- предлагаю"))
+    assert found == [Repetition(copies=(1, 2, 3), length=1, keep=2, kind="stutter")]
+
+
+def test_stutter_needs_tight_gap_and_fragment():
+    """Test that short words or slow pairs are not mistaken for stutters."""
+    assert _find(_transcript("при приехал", gaps={1: 0.5})) == []
+    assert _find(_transcript("в воскресенье")) == []
+    assert len(_find(_transcript("при приехал"))) == 1
+
+
+def test_analyzer_cuts_chosen_copy():
+    """Test that the analyzer cuts the dropped copies as repetitions."""
+    transcript = _transcript("ну я думаю я думаю что", confidence={1: 0.2})
+    decisions = Analyzer(language="ru").analyze(transcript)
+    assert [(d.reason, d.original_text) for d in decisions] == [
+        ("filler", "ну"),
+        ("repetition", "я думаю"),
+    ]
+    assert decisions[1].start == transcript.start[1]
+
+
+def test_linear_scaling():
+    """Test that detection over a long transcript stays fast."""
+    rng = np.random.default_rng(0)
+    n = 200_000
+    ids = rng.integers(0, 500, n).astype(np.int32)
+    tokens = [f"w{i}" for i in range(500)]
+    start = np.arange(n) * 0.4
+    started = time.perf_counter()
+    RepetitionDetector().find(ids, tokens, start, start + 0.3, np.ones(n, dtype=np.float32))
+    assert time.perf_counter() - started < 2.0
@@ -0,0 +1,141 @@
+"""Tests for result exporters."""
+
+import csv
+import json
+
+import numpy as np
+import pytest
+
+from ksu_podcast_editor import results
+from ksu_podcast_editor.models import EditDecision, Segment, Word
+from ksu_podcast_editor.results import assign_labels, save_results, stream_results
+from ksu_podcast_editor.transcript import Transcript
+
+
+def _segments() -> list[Segment]:
+    def word(text, start, end):
+        return Word(text=text, start=start, end=end, confidence=0.91234)
+
+    return [
+        Segment(start=0.0, end=2.0, text='ну как бы, "да"', words=[
+            word("ну", 0.0, 0.5), word("как", 0.6, 1.0), word("бы,", 1.1, 1.5), word('"да"', 1.6, 2.0),
+        ]),
+        Segment(start=2.5, end=3.0, text="", words=[]),
+        Segment(start=4.0, end=5.0, text="это это", words=[word("это", 4.0, 4.5), word("это", 4.6, 5.0)]),
+    ]
+
+
+DECISIONS = [
+    EditDecision(start=0.6, end=1.5, reason="filler", original_text="как бы,"),
+    EditDecision(start=0.0, end=0.5, reason="filler", original_text="ну"),
+    EditDecision(start=4.0, end=4.5, reason="repetition", original_text="это"),
+]
+LABELS = ["filler", "filler", "filler", "keep", "repetition", "keep"]
+
+
+def _expected_json(segments, decisions) -> dict:
+    """The document save_results wrote before it streamed, with phrase labels fixed."""
+    def record(w):
+        return {"text": w.text, "start": round(w.start, 3), "end": round(w.end, 3), "confidence": round(w.confidence, 3)}
+
+    words = [w for s in segments for w in s.words]
+    return {
+        "segments": [
+            {"text": s.text, "start": s.start, "end": s.end, "words": [record(w) for w in s.words]}
+            for s in segments
+        ],
+        "words": [{**record(w), "label": label} for w, label in zip(words, LABELS)],
+        "fillers": [
+            {"text": d.original_text, "start": d.start, "end": d.end, "reason": d.reason} for d in decisions
+        ],
+        "summary": {"total_segments": len(segments), "total_words": len(words), "fillers_count": len(decisions)},
+        "transcription": {"profile": "default"},
+    }
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    """Run a test with orjson and with the standard library."""
+    if request.param == "json":
+        monkeypatch.setattr(results, "orjson", None)
+    elif results.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+def test_json_document(tmp_path, backend):
+    """Test that JSON output has every section and labels every word of a phrase cut."""
+    path = tmp_path / "out.json"
+    save_results(_segments(), DECISIONS, path, transcription={"profile": "default"})
+    assert json.loads(path.read_text(encoding="utf-8")) == _expected_json(_segments(), DECISIONS)
+
+
+def test_backends_write_identical_files(tmp_path, monkeypatch):
+    """Test that the orjson and standard library backends produce the same bytes."""
+    if results.orjson is None:
+        pytest.skip("orjson is not installed")
+    for ext in ("json", "jsonl", "csv", "txt"):
+        save_results(_segments(), DECISIONS, tmp_path / f"a.{ext}")
+        with monkeypatch.context() as m:
+            m.setattr(results, "orjson", None)
+            save_results(_segments(), DECISIONS, tmp_path / f"b.{ext}")
+        assert (tmp_path / f"a.{ext}").read_bytes() == (tmp_path / f"b.{ext}").read_bytes()
+
+
+def test_jsonl_csv_and_text(tmp_path, backend):
+    """Test one-word-per-line formats, including quoting of awkward text."""
+    save_results(_segments(), DECISIONS, tmp_path / "out.jsonl")
+    lines = [json.loads(line) for line in (tmp_path / "out.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert [line["label"] for line in lines] == LABELS
+    assert lines[3] == {"text": '"да"', "start": 1.6, "end": 2.0, "confidence": 0.912, "label": "keep"}
+
+    save_results(_segments(), DECISIONS, tmp_path / "out.csv")
+    with open(tmp_path / "out.csv", encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [r["text"] for r in rows] == ["ну", "как", "бы,", '"да"', "это", "это"]
+    assert [r["label"] for r in rows] == LABELS
+    assert rows[0]["end"] == "0.5"
+
+    save_results(_segments(), DECISIONS, tmp_path / "out.txt")
+    text = (tmp_path / "out.txt").read_text(encoding="utf-8")
+    assert "0.600 - 1.000: как [filler]\n" in text
+    assert '1.600 - 2.000: "да"\n' in text
+    assert text.endswith("Total words: 6\nFillers to remove: 3\n")
+
+
+def test_transcript_and_segments_match(tmp_path):
+    """Test that a columnar transcript and segments export the same file."""
+    for ext in ("json", "csv"):
+        save_results(_segments(), DECISIONS, tmp_path / f"a.{ext}")
+        save_results(Transcript.from_segments(_segments()), DECISIONS, tmp_path / f"b.{ext}")
+        assert (tmp_path / f"a.{ext}").read_bytes() == (tmp_path / f"b.{ext}").read_bytes()
+
+
+def test_stream_results_matches_save_results(tmp_path, monkeypatch):
+    """Test that streamed output equals the whole-transcript output, across block boundaries."""
+    monkeypatch.setattr(results, "_BLOCK", 4)
+    words = [w for s in _segments() for w in s.words]
+    labels = assign_labels(np.array([w.start for w in words]), np.array([w.end for w in words]), DECISIONS)
+    pairs = [(w, DECISIONS[i] if i >= 0 else None) for w, i in zip(words, labels.tolist())]
+
+    for ext in ("jsonl", "csv", "txt"):
+        decisions = stream_results(pairs, tmp_path / f"stream.{ext}")
+        save_results(_segments(), decisions, tmp_path / f"saved.{ext}")
+        assert (tmp_path / f"stream.{ext}").read_bytes() == (tmp_path / f"saved.{ext}").read_bytes()
+
+    with pytest.raises(ValueError):
+        stream_results(pairs, tmp_path / "stream.json")
+
+
+def test_assign_labels_sweep():
+    """Test labels from overlapping, unsorted decisions, using word midpoints."""
+    start = np.array([0.0, 1.0, 2.0, 3.0, 4.0, 5.0])
+    end = start + 0.8
+    decisions = [
+        EditDecision(start=2.9, end=4.8, reason="repetition"),
+        EditDecision(start=0.0, end=3.5, reason="long_pause"),
+        EditDecision(start=1.0, end=1.3, reason="filler"),  # Covers part of word 1, not its midpoint
+    ]
+    # Word 3 lies in two decisions; the one reaching furthest wins
+    assert assign_labels(start, end, decisions).tolist() == [1, 1, 1, 0, 0, -1]
+    assert assign_labels(start, end, []).tolist() == [-1] * 6
@@ -0,0 +1,68 @@
+"""Tests for the resident transcription server."""
+
+import threading
+
+import pytest
+
+from ksu_podcast_editor.models import Segment, Word
+from ksu_podcast_editor.profiles import TranscriptionProfile
+from ksu_podcast_editor.server import RemoteTranscriber, TranscriptionServer, is_running
+
+
+class FakeTranscriber:
+    """Stands in for a loaded Transcriber."""
+
+    def __init__(self):
+        self.jobs = []
+
+    def iter_segments(self, audio_path, language=None):
+        self.jobs.append((audio_path.name, language))
+        if audio_path.name == "broken.wav":
+            raise ValueError("cannot decode")
+        for i in range(3):
+            yield Segment(start=i, end=i + 1, words=[Word(text=f"w{i}", start=i, end=i + 0.5)])
+
+
+TINY = ("tiny", TranscriptionProfile().model_dump_json())
+
+
+@pytest.fixture
+def server(tmp_path):
+    server = TranscriptionServer(tmp_path / "s.sock")
+    server.transcribers[TINY] = FakeTranscriber()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_remote_transcription_uses_resident_model(server, tmp_path):
+    """Test that jobs from several clients share the server's transcriber."""
+    for name in ("a.wav", "b.wav"):
+        client = RemoteTranscriber(server.socket_path, model_size="tiny")
+        segments = client.transcribe(tmp_path / name, language="ru")
+        assert [s.words[0].text for s in segments] == ["w0", "w1", "w2"]
+
+    assert server.transcribers[TINY].jobs == [("a.wav", "ru"), ("b.wav", "ru")]
+
+
+def test_remote_errors_are_raised(server, tmp_path):
+    """Test that server-side failures surface in the client."""
+    client = RemoteTranscriber(server.socket_path, model_size="tiny")
+    with pytest.raises(RuntimeError, match="cannot decode"):
+        client.transcribe(tmp_path / "broken.wav")
+
+
+def test_is_running(server, tmp_path):
+    """Test server detection."""
+    assert is_running(server.socket_path)
+    assert not is_running(tmp_path / "missing.sock")
+
+
+def test_probe_is_not_a_failed_job(server, tmp_path, caplog):
+    """Test that an is_running() probe, which sends nothing, is not logged as a failed job."""
+    assert is_running(server.socket_path)
+    # Jobs are served in order, so this one finishes after the probe was handled
+    RemoteTranscriber(server.socket_path, model_size="tiny").transcribe(tmp_path / "a.wav")
+    assert not [r for r in caplog.records if r.levelname == "ERROR"]
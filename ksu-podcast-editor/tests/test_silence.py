@@ -0,0 +1,50 @@
+"""Tests for audio silence detection."""
+
+import numpy as np
+import soundfile as sf
+
+from ksu_podcast_editor.silence import SilenceDetector
+
+
+def _write(path, parts: list[tuple[float, bool]], samplerate: int = 8000) -> None:
+    """Write alternating tone (True) and near-silent (False) parts of given lengths."""
+    rng = np.random.default_rng(0)
+    chunks = []
+    for seconds, loud in parts:
+        n = int(seconds * samplerate)
+        if loud:
+            chunks.append(0.5 * np.sin(np.arange(n) * 0.3))
+        else:
+            chunks.append(rng.normal(0, 1e-4, n))
+    sf.write(path, np.concatenate(chunks).astype(np.float32), samplerate)
+
+
+def test_finds_long_silences_only(tmp_path):
+    """Test that only silences above min_silence are reported, with frame accuracy."""
+    path = tmp_path / "in.wav"
+    _write(path, [(1.0, True), (0.5, False), (1.0, True), (2.0, False), (1.0, True)])
+    silences = list(SilenceDetector(min_silence=1.0).iter_silences(path))
+    assert len(silences) == 1
+    start, end = silences[0]
+    assert abs(start - 2.5) <= 0.02 and abs(end - 4.5) <= 0.02
+
+
+def test_block_size_does_not_matter(tmp_path):
+    """Test that results are the same however the file is split into blocks."""
+    path = tmp_path / "in.wav"
+    _write(path, [(0.3, True), (1.3, False), (0.7, True), (1.1, False), (0.2, True), (1.25, False)])
+    expected = list(SilenceDetector(block_frames=1 << 20).iter_silences(path))
+    assert len(expected) == 3
+    for block_frames in (160, 1000, 4096):
+        assert list(SilenceDetector(block_frames=block_frames).iter_silences(path)) == expected
+
+
+def test_decisions_shorten_to_target(tmp_path):
+    """Test that long_pause decisions leave half the target on each side."""
+    path = tmp_path / "in.wav"
+    _write(path, [(1.0, True), (3.0, False), (1.0, True)])
+    decisions = SilenceDetector(min_silence=1.0, target=0.4).detect(path)
+    assert len(decisions) == 1
+    cut = decisions[0]
+    assert cut.reason == "long_pause"
+    assert abs(cut.start - 1.2) <= 0.02 and abs(cut.end - 3.8) <= 0.02
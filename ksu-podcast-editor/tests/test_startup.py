@@ -0,0 +1,86 @@
+"""Tests for CLI startup cost."""
+
+import subprocess
+import sys
+import textwrap
+
+from ksu_podcast_editor import __version__
+
+# Backends the CLI must not import before a command needs them
+HEAVY_MODULES = {"numpy", "soundfile", "pydub", "pydantic", "faster_whisper", "ctranslate2", "onnxruntime", "av"}
+
+# Cumulative import time of the CLI module in microseconds; it is about
+# 150 ms, against about 600 ms when the backends loaded eagerly
+IMPORT_BUDGET_US = 400_000
+
+
+def _run(code: str, *args: str, env: dict | None = None) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args, "-c", textwrap.dedent(code)],
+        capture_output=True, text=True, check=True, env=env,
+    )
+
+
+def test_cli_import_time_budget():
+    """Test that importing the CLI stays within budget and loads no heavy backend."""
+    result = _run("import ksu_podcast_editor.cli", "-X", "importtime")
+    # Lines look like "import time:   self [us] | cumulative | package"
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+
+    assert not {name.split(".")[0] for name in times} & HEAVY_MODULES
+    assert times["ksu_podcast_editor.cli"] < IMPORT_BUDGET_US
+
+
+def test_version_and_help_are_metadata_only():
+    """Test that --version and --help answer without importing any backend."""
+    code = """
+        import sys
+        from ksu_podcast_editor.cli import app
+        for args in (["--version"], ["--help"], ["edit", "--help"]):
+            try:
+                app(args, standalone_mode=False)
+            except SystemExit:
+                pass
+        print("loaded:" + ",".join(sorted(m for m in sys.modules if m.split(".")[0] in {heavy!r})))
+    """.format(heavy=HEAVY_MODULES)
+    result = _run(code)
+    assert f"ksu-podcast-editor {__version__}" in result.stdout
+    assert result.stdout.strip().splitlines()[-1] == "loaded:"
+
+
+def test_dry_run_on_cached_transcript_skips_whisper(tmp_path):
+    """Test that a dry run served from the transcript cache never imports faster-whisper."""
+    code = """
+        import sys
+        import numpy as np
+        import soundfile as sf
+        from ksu_podcast_editor.cache import TranscriptCache
+        from ksu_podcast_editor.models import Segment, Word
+        from ksu_podcast_editor.transcriber import Transcriber
+
+        audio = sys.argv[1]
+        sf.write(audio, np.zeros(16000, dtype=np.float32), 16000)
+        words = [Word(text="ну", start=0.1, end=0.3), Word(text="да", start=0.4, end=0.6)]
+        cache = TranscriptCache()
+        key = cache.key(audio, Transcriber(model_size="tiny").settings("ru"))
+        list(cache.store(key, [Segment(start=0.1, end=0.6, text="ну да", words=words)]))
+
+        from ksu_podcast_editor.cli import app
+        try:
+            app(["edit", audio, audio + ".out.wav", "--dry-run", "-l", "ru", "-m", "tiny"], standalone_mode=False)
+        finally:
+            print("faster_whisper" in sys.modules)
+    """
+    env = {"XDG_CACHE_HOME": str(tmp_path / "cache"), "XDG_RUNTIME_DIR": str(tmp_path), "PATH": ""}
+    result = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code), str(tmp_path / "in.wav")],
+        capture_output=True, text=True, env=env,
+    )
+    assert result.returncode == 0, result.stderr
+    assert "would remove 1 segments" in result.stdout
+    assert result.stdout.strip().splitlines()[-1] == "False"
@@ -0,0 +1,78 @@
+"""Tests for two-tier transcription."""
+
+from types import SimpleNamespace
+
+from ksu_podcast_editor.models import Segment, Word
+from ksu_podcast_editor.tiered import splice_refined, uncertain_spans
+from ksu_podcast_editor.transcriber import Transcriber
+
+
+def _segment(words: list[tuple[str, float, float]], confidence: dict[str, float] | None = None) -> Segment:
+    items = [Word(text=t, start=s, end=e, confidence=(confidence or {}).get(t, 0.95)) for t, s, e in words]
+    return Segment(start=items[0].start, end=items[-1].end, words=items, text=" ".join(t for t, _, _ in words))
+
+
+def _whisper_segment(words: list[tuple[str, float, float]]):
+    """A segment shaped like faster-whisper's output."""
+    return SimpleNamespace(
+        start=words[0][1],
+        end=words[-1][2],
+        text=" ".join(t for t, _, _ in words),
+        words=[SimpleNamespace(word=" " + t, start=s, end=e, probability=0.9) for t, s, e in words],
+    )
+
+
+class _FakeModel:
+    def __init__(self, segments):
+        self.segments = segments
+        self.calls = []
+
+    def transcribe(self, audio, **kwargs):
+        self.calls.append(kwargs)
+        return iter(self.segments), SimpleNamespace(language="ru", language_probability=1.0, duration=60.0)
+
+
+def test_uncertain_spans_from_confidence_and_fillers():
+    """Test that low-confidence words and fillers seed spans widened to whole words."""
+    draft = [
+        _segment([("сегодня", 0.0, 0.5), ("мы", 0.6, 0.8), ("говорим", 0.9, 1.5)]),
+        _segment([("про", 10.0, 10.3), ("эээ", 10.4, 11.0), ("звук", 11.1, 11.6)]),
+        _segment([("и", 20.0, 20.1), ("мизансцену", 20.2, 21.0)], confidence={"мизансцену": 0.3}),
+        _segment([("всё", 40.0, 40.5)]),
+    ]
+    spans = uncertain_spans(draft, context=0.5)
+    assert spans == [(9.9, 11.6), (19.7, 21.5)]
+
+
+def test_clean_draft_has_no_spans():
+    """Test that a confident draft without fillers is never re-transcribed."""
+    assert uncertain_spans([_segment([("чистая", 0.0, 0.5), ("речь", 0.6, 1.0)])]) == []
+
+
+def test_splice_replaces_words_inside_spans():
+    """Test that draft words in a span are swapped for refined ones and others kept."""
+    first = _segment([("привет", 0.0, 0.5)])
+    second = _segment([("мы", 5.0, 5.2), ("ризансцену", 5.3, 6.0), ("ставим", 6.1, 6.5)])
+    refined = [_segment([("мизансцену", 5.3, 6.0)]), _segment([("лишнее", 9.0, 9.5)])]
+
+    result = splice_refined([first, second], [(5.25, 6.05)], refined)
+    assert result[0] is first
+    assert [w.text for w in result[1].words] == ["мы", "мизансцену", "ставим"]
+    assert result[1].text == "мы мизансцену ставим"
+
+
+def test_transcriber_tiered_mode():
+    """Test that the large model only decodes the uncertain clips and its words are spliced in."""
+    transcriber = Transcriber(model_size="large-v3", draft_model_size="tiny")
+    transcriber._draft_model = _FakeModel([
+        _whisper_segment([("начнём", 0.0, 0.5), ("с", 0.6, 0.7), ("новостей", 0.8, 1.4)]),
+        _whisper_segment([("ну", 30.0, 30.3), ("вот", 30.4, 30.7), ("да", 30.8, 31.0)]),
+    ])
+    transcriber._model = _FakeModel([_whisper_segment([("ну", 30.0, 30.3), ("вот", 30.4, 30.7), ("так", 30.8, 31.0)])])
+
+    segments = transcriber.transcribe("episode.wav")
+    words = [w.text for s in segments for w in s.words]
+    assert words == ["начнём", "с", "новостей", "ну", "вот", "так"]
+    clips = transcriber._model.calls[0]["clip_timestamps"]
+    assert clips[0] >= 29.0 and clips[-1] <= 32.0 and len(clips) == 2
+    assert transcriber.settings("ru")["tiered"] == {"draft": "tiny", "min_confidence": 0.6}
@@ -0,0 +1,102 @@
+"""Tests for the columnar transcript."""
+
+import json
+import random
+
+from ksu_podcast_editor.analyzer import Analyzer
+from ksu_podcast_editor.models import Segment, Word
+from ksu_podcast_editor.repetition import RepetitionDetector
+from ksu_podcast_editor.results import save_results
+from ksu_podcast_editor.transcript import Transcript
+
+VOCAB = ["ну", "Ну,", "вот", "на", "самом", "деле", "в", "общем", "я", "думаю", "это", "как", "бы", "да"]
+
+
+def _random_segments(n_words: int, seed: int = 0, confidence: float | None = None) -> list[Segment]:
+    """Build segments of random words, a few per segment."""
+    rng = random.Random(seed)
+    segments, words, t = [], [], 0.0
+    for _ in range(n_words):
+        conf = rng.random() if confidence is None else confidence
+        words.append(Word(text=rng.choice(VOCAB), start=t, end=t + 0.3, confidence=conf))
+        t += 0.4
+        if rng.random() < 0.2 or _ == n_words - 1:
+            segments.append(Segment(start=words[0].start, end=words[-1].end, words=words,
+                                    text=" ".join(w.text for w in words)))
+            words = []
+    return segments
+
+
+def test_round_trip():
+    """Test that converting back gives the original segments."""
+    segments = _random_segments(200)
+    transcript = Transcript.from_segments(iter(segments))
+    assert len(transcript) == 200
+    assert transcript.n_segments == len(segments)
+    restored = transcript.to_segments()
+    assert [s.text for s in restored] == [s.text for s in segments]
+    assert [w.text for s in restored for w in s.words] == [w.text for s in segments for w in s.words]
+    assert [w.start for s in restored for w in s.words] == [w.start for s in segments for w in s.words]
+
+
+def test_tokens_are_interned():
+    """Test that spellings normalizing to the same token share an id."""
+    transcript = Transcript.from_segments([
+        Segment(start=0, end=1, words=[Word(text="Ну,", start=0, end=0.5), Word(text="ну", start=0.5, end=1)])
+    ])
+    assert transcript.texts == ["Ну,", "ну"]
+    assert transcript.tokens == ["ну"]
+    assert transcript.token_ids.tolist() == [0, 0]
+
+
+def test_empty():
+    """Test that an empty transcript analyzes to nothing."""
+    transcript = Transcript.from_segments([])
+    assert len(transcript) == 0
+    assert Analyzer(language="ru").analyze(transcript) == []
+
+
+def _disfluent_segments(n_words: int, seed: int) -> list[Segment]:
+    """Random speech with repeated words and phrases, stutters and fillers."""
+    rng = random.Random(seed)
+    texts: list[str] = []
+    while len(texts) < n_words:
+        roll = rng.random()
+        if roll < 0.15 and texts:
+            texts.extend(texts[-rng.randint(1, 3):] * rng.randint(1, 2))
+        elif roll < 0.2:
+            word = rng.choice(["предлагаю", "говорю", "думаю"])
+            texts.extend([word[:3] + "-", word])
+        else:
+            texts.append(rng.choice(VOCAB + ["мы", "пошли", "домой", "сегодня"]))
+    segments, words, t = [], [], 0.0
+    for i, text in enumerate(texts[:n_words]):
+        words.append(Word(text=text, start=t, end=t + 0.3, confidence=rng.random()))
+        t += 0.35 + (1.5 if rng.random() < 0.05 else 0.0)
+        if rng.random() < 0.2 or i == n_words - 1:
+            segments.append(Segment(start=words[0].start, end=words[-1].end, words=words,
+                                    text=" ".join(w.text for w in words)))
+            words = []
+    return segments
+
+
+def test_analyze_matches_streaming():
+    """Test that windowed streaming analysis finds exactly the decisions of analyze()."""
+    analyzer = Analyzer(language="ru")
+    for seed in range(20):
+        segments = _disfluent_segments(1000, seed)
+        expected = analyzer.analyze(Transcript.from_segments(segments))
+        for window in (1, 100):
+            actual = sorted(analyzer.iter_decisions(segments, window=window), key=lambda d: d.start)
+            assert [d.model_dump() for d in actual] == [d.model_dump() for d in expected]
+
+
+def test_save_results_matches_segments(tmp_path):
+    """Test that JSON results from a transcript match those from segments."""
+    segments = _random_segments(300)
+    decisions = Analyzer(language="ru").analyze(segments)
+    save_results(segments, decisions, tmp_path / "a.json")
+    save_results(Transcript.from_segments(segments), decisions, tmp_path / "b.json")
+    a = json.loads((tmp_path / "a.json").read_text(encoding="utf-8"))
+    b = json.loads((tmp_path / "b.json").read_text(encoding="utf-8"))
+    assert a == b